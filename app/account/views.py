@@ -11,6 +11,7 @@ class LoginUserAPIView(GenericAPIView):
     """Login user and return JWT tokens."""
     serializer_class = AuthTokenSerializer
     permission_classes = [permissions.AllowAny]
+    throttle_scope = 'login'
 
     def post(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
@@ -0,0 +1,77 @@
+"""
+Daily enrollment rollups.
+
+``EnrollmentDailyStat`` holds one row per day, course, batch and enrollment
+year with the enrollments created, dropped and reactivated that day. Rows
+are incremented in the same transaction as the enrollment change, so the
+analytics endpoint only sums a date range of small rows instead of grouping
+the enrollment table.
+"""
+
+from collections import defaultdict
+
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from core.models import EnrollmentDailyStat
+
+METRICS = ('enrolled', 'dropped', 'reactivated')
+
+
+def change_key(enrollment, day=None):
+    """Return the rollup row key for ``enrollment``, on ``day`` (default today)."""
+    return (
+        day or timezone.localdate(),
+        enrollment.course_id,
+        enrollment.student.batch,
+        enrollment.student.enrollment_year,
+    )
+
+
+def status_change(previous_status, status):
+    """Return the metric an enrollment status change counts towards, if any."""
+    if previous_status is None:
+        return 'enrolled' if status == 'ACTIVE' else None
+    if previous_status == 'ACTIVE' and status == 'DROPPED':
+        return 'dropped'
+    if previous_status == 'DROPPED' and status == 'ACTIVE':
+        return 'reactivated'
+    return None
+
+
+class Changes:
+    """Rollup increments collected before they are written with :func:`record`."""
+
+    def __init__(self):
+        self.counts = defaultdict(lambda: dict.fromkeys(METRICS, 0))
+        self.teachers = {}
+
+    def add(self, key, metric, teacher_id, count=1):
+        self.counts[key][metric] += count
+        self.teachers[key] = teacher_id
+
+    def __bool__(self):
+        return bool(self.counts)
+
+
+def record(changes):
+    """Add ``changes`` to the rollup rows, creating rows that do not exist yet."""
+    for key, counts in changes.counts.items():
+        date, course_id, batch, enrollment_year = key
+        rows = EnrollmentDailyStat.objects.filter(
+            date=date, course_id=course_id, batch=batch, enrollment_year=enrollment_year
+        )
+        increments = {metric: F(metric) + count for metric, count in counts.items() if count}
+        teacher_id = changes.teachers[key]
+        if rows.update(teacher_id=teacher_id, **increments):
+            continue
+        try:
+            with transaction.atomic():
+                EnrollmentDailyStat.objects.create(
+                    date=date, course_id=course_id, batch=batch, enrollment_year=enrollment_year,
+                    teacher_id=teacher_id, **counts
+                )
+        except IntegrityError:
+            # Another transaction created the row first.
+            rows.update(teacher_id=teacher_id, **increments)
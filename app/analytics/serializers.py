@@ -0,0 +1,45 @@
+from datetime import timedelta
+from django.utils import timezone
+from rest_framework import serializers
+
+
+class EnrollmentAnalyticsQuerySerializer(serializers.Serializer):
+    """Serializer for enrollment analytics query parameters."""
+
+    GROUP_BY_CHOICES = ['course', 'teacher', 'batch', 'enrollment_year']
+    INTERVAL_CHOICES = ['day', 'week', 'month']
+
+    start = serializers.DateField(required=False, help_text='First day (default: 90 days before end)')
+    end = serializers.DateField(required=False, help_text='Last day (default: today)')
+    group_by = serializers.ChoiceField(choices=GROUP_BY_CHOICES, required=False)
+    interval = serializers.ChoiceField(choices=INTERVAL_CHOICES, default='day')
+
+    def validate(self, data):
+        """Default the date range and check that it is in order."""
+        data.setdefault('end', timezone.localdate())
+        data.setdefault('start', data['end'] - timedelta(days=90))
+        if data['start'] > data['end']:
+            raise serializers.ValidationError("start must not be after end")
+        return data
+
+
+class EnrollmentAnalyticsRowSerializer(serializers.Serializer):
+    """Serializer describing enrollment changes for one period and group."""
+
+    period = serializers.DateField(help_text='First day of the period')
+    group = serializers.CharField(allow_null=True, help_text='Course or teacher id, batch or year')
+    label = serializers.CharField(allow_null=True, help_text='Course title or teacher name')
+    enrolled = serializers.IntegerField()
+    dropped = serializers.IntegerField()
+    reactivated = serializers.IntegerField()
+    drop_rate = serializers.FloatField(allow_null=True, help_text='dropped / enrolled')
+
+
+class EnrollmentAnalyticsSerializer(serializers.Serializer):
+    """Serializer describing an enrollment analytics response."""
+
+    start = serializers.DateField()
+    end = serializers.DateField()
+    interval = serializers.CharField()
+    group_by = serializers.CharField(allow_null=True)
+    results = EnrollmentAnalyticsRowSerializer(many=True)
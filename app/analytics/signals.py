@@ -0,0 +1,23 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+from core.models import Enrollment
+from .rollups import Changes, change_key, record, status_change
+
+
+@receiver(post_save, sender=Enrollment)
+def update_enrollment_rollups(sender, instance, created, **kwargs):
+    """
+    Count enrollments, drops and reactivations in the daily rollups.
+
+    The previous status is stored on the instance by the pre_save receiver
+    in notification.signals. Queryset updates bypass this receiver and call
+    analytics.rollups.record themselves.
+    """
+    previous_status = None if created else getattr(instance, '_previous_status', None)
+    if not created and previous_status is None:
+        return
+    metric = status_change(previous_status, instance.status)
+    if metric:
+        changes = Changes()
+        changes.add(change_key(instance), metric, instance.course.teacher_id)
+        record(changes)
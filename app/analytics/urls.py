@@ -0,0 +1,8 @@
+from django.urls import path
+from . import views
+
+app_name = 'analytics'
+
+urlpatterns = [
+    path('enrollments/', views.EnrollmentAnalyticsAPIView.as_view(), name='enrollments'),
+]
@@ -0,0 +1,79 @@
+from django.db.models import F, Sum
+from django.db.models.functions import TruncMonth, TruncWeek
+from drf_spectacular.utils import extend_schema
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from core.models import Course, EnrollmentDailyStat, User
+from core.permissions import IsAdminUser
+from .serializers import EnrollmentAnalyticsQuerySerializer, EnrollmentAnalyticsSerializer
+
+GROUP_FIELDS = {
+    'course': 'course_id',
+    'teacher': 'teacher_id',
+    'batch': 'batch',
+    'enrollment_year': 'enrollment_year',
+}
+INTERVALS = {
+    'day': lambda: F('date'),
+    'week': lambda: TruncWeek('date'),
+    'month': lambda: TruncMonth('date'),
+}
+
+
+class EnrollmentAnalyticsAPIView(APIView):
+    """Enrollment trends and drop rates from the daily rollups."""
+
+    permission_classes = [IsAdminUser]
+
+    @extend_schema(parameters=[EnrollmentAnalyticsQuerySerializer], responses=EnrollmentAnalyticsSerializer)
+    def get(self, request):
+        """Get enrollments, drops and reactivations per period, optionally per group."""
+        serializer = EnrollmentAnalyticsQuerySerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        start = serializer.validated_data['start']
+        end = serializer.validated_data['end']
+        group_by = serializer.validated_data.get('group_by')
+        interval = serializer.validated_data['interval']
+
+        fields = ['period'] + ([GROUP_FIELDS[group_by]] if group_by else [])
+        rows = (
+            EnrollmentDailyStat.objects
+            .filter(date__range=(start, end))
+            .annotate(period=INTERVALS[interval]())
+            .values(*fields)
+            .annotate(enrolled=Sum('enrolled'), dropped=Sum('dropped'), reactivated=Sum('reactivated'))
+            .order_by(*fields)
+        )
+        rows = list(rows)
+        labels = self.get_labels(group_by, {row[GROUP_FIELDS[group_by]] for row in rows} if group_by else set())
+
+        results = []
+        for row in rows:
+            group = row.get(GROUP_FIELDS[group_by]) if group_by else None
+            results.append({
+                'period': row['period'],
+                'group': str(group) if group is not None else None,
+                'label': labels.get(group),
+                'enrolled': row['enrolled'],
+                'dropped': row['dropped'],
+                'reactivated': row['reactivated'],
+                'drop_rate': round(row['dropped'] / row['enrolled'], 4) if row['enrolled'] else None,
+            })
+
+        return Response({
+            'start': start,
+            'end': end,
+            'interval': interval,
+            'group_by': group_by,
+            'results': results,
+        }, status=status.HTTP_200_OK)
+
+    @staticmethod
+    def get_labels(group_by, ids):
+        """Return course titles or teacher names for the grouped ids."""
+        if group_by == 'course':
+            return dict(Course.objects.filter(id__in=ids).values_list('id', 'title'))
+        if group_by == 'teacher':
+            return dict(User.objects.filter(id__in=ids - {None}).values_list('id', 'name'))
+        return {}
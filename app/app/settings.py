@@ -13,6 +13,7 @@ https://docs.djangoproject.com/en/4.2/ref/settings/
 from pathlib import Path
 import os
 from datetime import timedelta
+from django.core.exceptions import ImproperlyConfigured
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -24,13 +25,20 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 # Quick-start development settings - unsuitable for production
 # See https://docs.djangoproject.com/en/4.2/howto/deployment/checklist/
 
-# SECURITY WARNING: keep the secret key used in production secret!
-SECRET_KEY = 'django-insecure-32ecrsb)*08h*ejfm1@h&dkfu5@vdsx970v*^85_d+(s7)ss^_'
-
 # SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = True
+# DEBUG also keeps every executed SQL query in memory, so it is off unless
+# DJANGO_DEBUG is set.
+DEBUG = (os.getenv('DJANGO_DEBUG') or 'False').lower() in ('1', 'true', 'yes')
 
-ALLOWED_HOSTS = []
+# SECURITY WARNING: keep the secret key used in production secret!
+# It signs JWTs and sessions, so the development fallback is only used with DEBUG.
+SECRET_KEY = os.getenv('DJANGO_SECRET_KEY')
+if not SECRET_KEY:
+    if not DEBUG:
+        raise ImproperlyConfigured('Set DJANGO_SECRET_KEY (or DJANGO_DEBUG=True for development)')
+    SECRET_KEY = 'django-insecure-32ecrsb)*08h*ejfm1@h&dkfu5@vdsx970v*^85_d+(s7)ss^_'
+
+ALLOWED_HOSTS = [host.strip() for host in (os.getenv('DJANGO_ALLOWED_HOSTS') or 'localhost,127.0.0.1').split(',') if host.strip()]
 
 
 # Application definition
@@ -42,6 +50,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'rest_framework',
     'rest_framework.authtoken',
     'rest_framework_simplejwt',
@@ -54,16 +63,25 @@ INSTALLED_APPS = [
     'enrollment',
     'notification',
     'user',
+    'job',
+    'batch',
+    'sync',
+    'analytics',
 ]
 
 MIDDLEWARE = [
+    'core.middleware.HealthCheckMiddleware',
+    'core.middleware.CompressionMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'whitenoise.middleware.WhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'core.middleware.ReplicaRoutingMiddleware',
+    'core.middleware.RateLimitHeadersMiddleware',
 ]
 
 ROOT_URLCONF = 'app.urls'
@@ -87,24 +105,92 @@ TEMPLATES = [
 WSGI_APPLICATION = 'app.wsgi.application'
 
 
+# Responses of at least COMPRESSION_MIN_SIZE bytes are brotli or gzip
+# compressed (core.middleware.CompressionMiddleware), per Accept-Encoding.
+COMPRESSION_MIN_SIZE = int(os.getenv('COMPRESSION_MIN_SIZE') or 1024)
+COMPRESSION_BROTLI_QUALITY = int(os.getenv('COMPRESSION_BROTLI_QUALITY') or 4)
+
+
 # Database
 # https://docs.djangoproject.com/en/4.2/ref/settings/#databases
 
+# Connections are kept open for DB_CONN_MAX_AGE seconds and health checked
+# before reuse. Setting DB_POOL_MAX_SIZE switches to an in-process pool
+# (core.db.pooled), which suits the ASGI deployment where connections are
+# not tied to long-lived request threads. Without the pool, ASGI workers
+# close connections after each request: persistent ones would pile up, one
+# per thread that sync code happened to run on.
+SERVER_MODE = (os.getenv('SERVER_MODE') or 'wsgi').lower()
+DB_POOL_MAX_SIZE = int(os.getenv('DB_POOL_MAX_SIZE') or 0)
+if DB_POOL_MAX_SIZE or SERVER_MODE == 'asgi':
+    DB_CONN_MAX_AGE = 0
+else:
+    DB_CONN_MAX_AGE = int(os.getenv('DB_CONN_MAX_AGE') or 60)
+
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.postgresql',
+        'ENGINE': 'core.db.pooled' if DB_POOL_MAX_SIZE else 'django.db.backends.postgresql',
         'NAME': os.getenv("DB_NAME"),
         'USER': os.getenv("DB_USER"),
         'PASSWORD': os.getenv("DB_PASSWORD"),
         'HOST': os.getenv("DB_HOST"),
         'PORT': os.getenv("DB_PORT", '5432'),
+        'CONN_MAX_AGE': DB_CONN_MAX_AGE,
+        'CONN_HEALTH_CHECKS': True,
+        'POOL': {
+            'min_size': int(os.getenv('DB_POOL_MIN_SIZE') or min(DB_POOL_MAX_SIZE, 2) or 1),
+            'max_size': DB_POOL_MAX_SIZE or 1,
+            'timeout': float(os.getenv('DB_POOL_TIMEOUT') or 10),
+            'check_after': float(os.getenv('DB_POOL_CHECK_AFTER') or 30),
+        },
         'OPTIONS': {
             'connect_timeout': 30,
-            'sslmode': 'require',
+            'sslmode': os.getenv('DB_SSLMODE') or 'require',
+            'keepalives': 1,
+            'keepalives_idle': 60,
+            'keepalives_interval': 10,
+            'keepalives_count': 5,
         },
     }
 }
 
+# Read replicas. Safe-method requests are routed to one of DB_REPLICA_HOSTS
+# (same credentials and port as the primary) unless it lags more than
+# DB_REPLICA_MAX_LAG seconds. A user's reads stay on the primary for
+# DB_REPLICA_STICKY_SECONDS after they write, so they see their own changes.
+# Replicas get a short connect timeout (DB_REPLICA_CONNECT_TIMEOUT seconds) so
+# an unreachable one is skipped quickly rather than stalling lag checks.
+DB_REPLICA_HOSTS = [host.strip() for host in (os.getenv('DB_REPLICA_HOSTS') or '').split(',') if host.strip()]
+
+for index, host in enumerate(DB_REPLICA_HOSTS):
+    DATABASES[f'replica_{index}'] = {
+        **DATABASES['default'],
+        'HOST': host,
+        'OPTIONS': {
+            **DATABASES['default']['OPTIONS'],
+            'connect_timeout': int(os.getenv('DB_REPLICA_CONNECT_TIMEOUT') or 2),
+        },
+        'TEST': {'MIRROR': 'default'},
+    }
+
+DATABASE_REPLICAS = [f'replica_{index}' for index in range(len(DB_REPLICA_HOSTS))]
+DATABASE_ROUTERS = ['core.db.replicas.ReplicaRouter']
+REPLICA_MAX_LAG = float(os.getenv('DB_REPLICA_MAX_LAG') or 5)
+REPLICA_LAG_CHECK_INTERVAL = float(os.getenv('DB_REPLICA_LAG_CHECK_INTERVAL') or 5)
+REPLICA_STICKY_SECONDS = int(os.getenv('DB_REPLICA_STICKY_SECONDS') or 10)
+REPLICA_LAG_QUERY_TIMEOUT = os.getenv('DB_REPLICA_LAG_QUERY_TIMEOUT') or '1s'
+
+# Rate limit buckets, Idempotency-Key responses and read-your-writes pins are
+# stored in the cache, so multi-process deployments need a shared backend
+# (e.g. CACHE_BACKEND=django.core.cache.backends.redis.RedisCache with
+# CACHE_LOCATION=redis://...); `check --deploy` fails without one (core.E001).
+CACHES = {
+    'default': {
+        'BACKEND': os.getenv('CACHE_BACKEND') or 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': os.getenv('CACHE_LOCATION') or '',
+    }
+}
+
 
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
@@ -142,6 +228,19 @@ USE_TZ = True
 
 STATIC_URL = 'static/'
 
+# Collected by `collectstatic` and served by WhiteNoise from each worker,
+# with hashed file names, gzip/brotli variants and far-future cache headers.
+STATIC_ROOT = BASE_DIR / 'staticfiles'
+
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'whitenoise.storage.CompressedManifestStaticFilesStorage',
+    },
+}
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/4.2/ref/settings/#default-auto-field
 
@@ -150,11 +249,80 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 # Custom User Model
 AUTH_USER_MODEL = 'core.User'
 
+# Serve /api/schema/ from a file generated at build time
+# (python manage.py spectacular --file schema.yml) instead of
+# introspecting the API on every request. Workers then never need
+# drf-spectacular's AutoSchema, which DRF's routers would otherwise import
+# while the URLconf loads.
+API_SCHEMA_FILE = os.getenv('API_SCHEMA_FILE') or ''
+
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
         'rest_framework_simplejwt.authentication.JWTAuthentication',
     ),
-    'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
+    'DEFAULT_RENDERER_CLASSES': (
+        'core.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
+    'DEFAULT_PARSER_CLASSES': (
+        'core.parsers.ORJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ),
+    'DEFAULT_THROTTLE_CLASSES': (
+        'core.throttling.RoleRateThrottle',
+        'core.throttling.ScopedRoleRateThrottle',
+    ),
+    # Reverse proxies in front of the app. Anonymous clients are throttled by
+    # the X-Forwarded-For entry this many hops back; 0 uses the socket address,
+    # so a client-supplied X-Forwarded-For is never trusted.
+    'NUM_PROXIES': int(os.getenv('DJANGO_NUM_PROXIES') or 0),
+    'DEFAULT_SCHEMA_CLASS': (
+        'rest_framework.schemas.inspectors.ViewInspector' if API_SCHEMA_FILE
+        else 'drf_spectacular.openapi.AutoSchema'
+    ),
+}
+
+# Incremental sync (sync app): rows changed in the last SYNC_SAFETY_WINDOW
+# seconds are held back until in-flight transactions have committed, and
+# deletion records are kept for SYNC_LOG_RETENTION_DAYS (prune_deletion_log).
+SYNC_SAFETY_WINDOW = int(os.getenv('SYNC_SAFETY_WINDOW') or 5)
+SYNC_LOG_RETENTION_DAYS = int(os.getenv('SYNC_LOG_RETENTION_DAYS') or 30)
+
+# Notifications are kept for this many whole months before the current one;
+# partition_notifications drops older monthly partitions.
+NOTIFICATION_RETENTION_MONTHS = int(os.getenv('NOTIFICATION_RETENTION_MONTHS') or 12)
+
+# Responses to requests sent with an Idempotency-Key (core.idempotency) are
+# replayed to retries for this many seconds.
+IDEMPOTENCY_KEY_TTL = int(os.getenv('IDEMPOTENCY_KEY_TTL') or 86400)
+# Seconds a key stays reserved while its first request runs; longer than
+# gunicorn's worker timeout, after which the request cannot still be running.
+IDEMPOTENCY_IN_FLIGHT_TIMEOUT = int(
+    os.getenv('IDEMPOTENCY_IN_FLIGHT_TIMEOUT') or int(os.getenv('GUNICORN_TIMEOUT') or 30) + 30
+)
+
+# Seconds a background job stays claimed without its worker renewing the
+# lease; after that another worker reclaims it (core.job_queue).
+JOB_LEASE_SECONDS = int(os.getenv('JOB_LEASE_SECONDS') or 300)
+
+# Sliding-window rates per scope and role (core.throttling). 'default' applies
+# to every request; views opt into another scope with `throttle_scope`.
+ROLE_THROTTLE_RATES = {
+    'default': {
+        'ADMIN': '1200/min',
+        'TEACHER': '600/min',
+        'STUDENT': '300/min',
+        'anon': '60/min',
+    },
+    'enrollments': {
+        'ADMIN': '600/min',
+        'TEACHER': '240/min',
+        'STUDENT': '60/min',
+    },
+    'login': {
+        'anon': '10/min',
+    },
 }
 
 SIMPLE_JWT = {
@@ -168,6 +336,8 @@ SPECTACULAR_SETTINGS = {
     'DESCRIPTION': 'API for managing students',
     'VERSION': '1.0.0',
     'SERVE_INCLUDE_SCHEMA': False,
+    # Generating the schema is the `check --deploy` test; it needs AutoSchema.
+    'ENABLE_DJANGO_DEPLOY_CHECK': not API_SCHEMA_FILE,
 }
 
 # Email Configuration using SendGrid
@@ -14,14 +14,21 @@ Including another URLconf
     1. Import the include() function: from django.urls import include, path
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
+from django.conf import settings
 from django.contrib import admin
 from django.urls import path, include
-from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
+
+from core.schema import lazy_view, schema_file_view
+
+if settings.API_SCHEMA_FILE:
+    schema_view = schema_file_view
+else:
+    schema_view = lazy_view('drf_spectacular.views.SpectacularAPIView')
 
 urlpatterns = [
     path('admin/', admin.site.urls),
-    path('api/schema/', SpectacularAPIView.as_view(), name='schema'),
-    path('api/docs/', SpectacularSwaggerView.as_view(url_name='schema'), name='swagger-ui'), 
+    path('api/schema/', schema_view, name='schema'),
+    path('api/docs/', lazy_view('drf_spectacular.views.SpectacularSwaggerView', url_name='schema'), name='swagger-ui'),
     path('api/auth/', include('account.urls')),
     path('api/users/', include('user.urls')),
     path('api/teachers/', include('teacher.urls')),
@@ -29,4 +36,8 @@ urlpatterns = [
     path('api/courses/', include('course.urls')),
     path('api/enrollments/', include('enrollment.urls')),
     path('api/notifications/', include('notification.urls')),
+    path('api/jobs/', include('job.urls')),
+    path('api/batch/', include('batch.urls')),
+    path('api/sync/', include('sync.urls')),
+    path('api/analytics/', include('analytics.urls')),
 ]
@@ -0,0 +1,37 @@
+from rest_framework import serializers
+
+MAX_BATCH_REQUESTS = 20
+
+
+class BatchRequestSerializer(serializers.Serializer):
+    """Serializer for the list of GET paths to run in one batch."""
+
+    requests = serializers.ListField(
+        child=serializers.CharField(),
+        min_length=1,
+        max_length=MAX_BATCH_REQUESTS,
+        help_text='API paths to GET, e.g. /api/courses/?fields=id,title'
+    )
+
+    def validate_requests(self, value):
+        """Only allow API paths, and no nested batches."""
+        for path in value:
+            if not path.startswith('/api/'):
+                raise serializers.ValidationError(f"'{path}' is not an API path.")
+            if path.startswith('/api/batch/'):
+                raise serializers.ValidationError('Batch requests cannot be nested.')
+        return value
+
+
+class BatchResponseItemSerializer(serializers.Serializer):
+    """Serializer describing the result of one batched request."""
+
+    path = serializers.CharField()
+    status = serializers.IntegerField()
+    body = serializers.JSONField(allow_null=True)
+
+
+class BatchResponseSerializer(serializers.Serializer):
+    """Serializer describing the combined batch response."""
+
+    responses = BatchResponseItemSerializer(many=True)
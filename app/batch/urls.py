@@ -0,0 +1,8 @@
+from django.urls import path
+from . import views
+
+app_name = 'batch'
+
+urlpatterns = [
+    path('', views.BatchAPIView.as_view(), name='batch'),
+]
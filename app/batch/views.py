@@ -0,0 +1,83 @@
+import logging
+
+import orjson
+from django.http import HttpRequest, QueryDict
+from django.urls import Resolver404, resolve
+from drf_spectacular.utils import extend_schema
+from rest_framework import permissions, status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from .serializers import BatchRequestSerializer, BatchResponseSerializer
+
+logger = logging.getLogger(__name__)
+
+# Headers of the batch request that must not leak into the sub-requests.
+EXCLUDED_META = ('HTTP_IF_NONE_MATCH', 'HTTP_IF_MODIFIED_SINCE', 'HTTP_ACCEPT_ENCODING', 'CONTENT_TYPE', 'CONTENT_LENGTH')
+
+
+class BatchAPIView(APIView):
+    """Run several API GET requests in one round trip."""
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    @extend_schema(parameters=[BatchRequestSerializer], responses=BatchResponseSerializer)
+    def get(self, request):
+        """
+        Run each path in ``?requests=`` in-process and return their results in order.
+
+        The sub-requests reuse this request's authenticated user and database
+        connection; each one still applies its own permissions and throttles.
+        """
+        serializer = BatchRequestSerializer(data={'requests': request.query_params.getlist('requests')})
+        serializer.is_valid(raise_exception=True)
+
+        responses = [self.run(request, path) for path in serializer.validated_data['requests']]
+        return Response({'responses': responses}, status=status.HTTP_200_OK)
+
+    def run(self, request, full_path):
+        """Dispatch one GET sub-request and return its path, status and body."""
+        path, _, query = full_path.partition('?')
+        try:
+            match = resolve(path)
+        except Resolver404:
+            return {'path': full_path, 'status': status.HTTP_404_NOT_FOUND, 'body': {'error': 'Not found.'}}
+
+        sub_request = HttpRequest()
+        sub_request.method = 'GET'
+        sub_request.path = sub_request.path_info = path
+        sub_request.META = {
+            key: value for key, value in request.META.items() if key not in EXCLUDED_META
+        }
+        sub_request.META.update({
+            'REQUEST_METHOD': 'GET',
+            'PATH_INFO': path,
+            'QUERY_STRING': query,
+            'HTTP_ACCEPT': 'application/json',
+        })
+        sub_request.GET = QueryDict(query)
+        sub_request.COOKIES = request.COOKIES
+        sub_request.resolver_match = match
+        # DRF authenticates these directly instead of decoding the token again.
+        sub_request._force_auth_user = request.user
+        sub_request._force_auth_token = request.auth
+
+        try:
+            response = match.func(sub_request, *match.args, **match.kwargs)
+        except Exception:
+            logger.exception(f"Batched request to {full_path} failed")
+            return {
+                'path': full_path,
+                'status': status.HTTP_500_INTERNAL_SERVER_ERROR,
+                'body': {'error': 'Internal server error.'},
+            }
+
+        return {'path': full_path, 'status': response.status_code, 'body': self.get_body(response)}
+
+    @staticmethod
+    def get_body(response):
+        """Return the response data, decoding JSON from non-DRF responses."""
+        if hasattr(response, 'data'):
+            return response.data
+        if response.get('Content-Type', '').startswith('application/json') and response.content:
+            return orjson.loads(response.content)
+        return None
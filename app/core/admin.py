@@ -1,12 +1,128 @@
+import json
+
 from django.contrib import admin
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
 from .models import (
-    User, TeacherProfile, StudentProfile, 
-    Course, Enrollment, Notification
+    User, TeacherProfile, StudentProfile,
+    Course, CourseSession, Enrollment, Notification, Job
 )
 
-admin.site.register(User)
-admin.site.register(TeacherProfile)
-admin.site.register(StudentProfile)
-admin.site.register(Course)
-admin.site.register(Enrollment)
-admin.site.register(Notification)
+# Changelists of more rows than this show PostgreSQL's estimate.
+ESTIMATED_COUNT_THRESHOLD = 100000
+
+
+def estimated_count(queryset):
+    """Return PostgreSQL's estimate of the rows in ``queryset``."""
+    connection = connections[queryset.db]
+    with connection.cursor() as cursor:
+        if not queryset.query.where:
+            # A partitioned table's own reltuples stays -1 (autovacuum never
+            # analyzes the parent), so add up its partitions' instead.
+            table = queryset.model._meta.db_table
+            cursor.execute(
+                "SELECT CASE WHEN t.relkind = 'p' THEN ("
+                "    SELECT SUM(GREATEST(p.reltuples, 0)) FROM pg_inherits i "
+                "    JOIN pg_class p ON p.oid = i.inhrelid WHERE i.inhparent = t.oid"
+                ") ELSE GREATEST(t.reltuples, 0) END "
+                "FROM pg_class t WHERE t.oid = %s::regclass",
+                [table]
+            )
+            return int(cursor.fetchone()[0] or 0)
+        sql, params = queryset.query.sql_with_params()
+        cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+class EstimatedCountPaginator(Paginator):
+    """Paginator that uses the planner's row estimate for large changelists."""
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if connections[queryset.db].vendor == 'postgresql':
+            estimate = estimated_count(queryset)
+            if estimate >= ESTIMATED_COUNT_THRESHOLD:
+                return estimate
+        return super().count
+
+
+class LargeTableAdmin(admin.ModelAdmin):
+    """ModelAdmin for tables that grow to millions of rows."""
+
+    paginator = EstimatedCountPaginator
+    # Skips the extra COUNT(*) of the whole table on filtered pages.
+    show_full_result_count = False
+    list_per_page = 50
+
+
+@admin.register(User)
+class UserAdmin(LargeTableAdmin):
+    list_display = ('email', 'name', 'role', 'is_active', 'is_staff', 'created_at')
+    list_filter = ('role', 'is_active')
+    search_fields = ('^email', '^name')
+    ordering = ('email',)
+
+
+@admin.register(TeacherProfile)
+class TeacherProfileAdmin(admin.ModelAdmin):
+    list_display = ('user', 'qualification', 'experience_years')
+    list_select_related = ('user',)
+    search_fields = ('^user__email', '^user__name')
+    raw_id_fields = ('user',)
+
+
+@admin.register(StudentProfile)
+class StudentProfileAdmin(LargeTableAdmin):
+    list_display = ('user', 'roll_number', 'batch', 'enrollment_year')
+    list_select_related = ('user',)
+    search_fields = ('=roll_number', '^user__email', '^user__name')
+    raw_id_fields = ('user',)
+    ordering = ('roll_number',)
+
+
+class CourseSessionInline(admin.TabularInline):
+    model = CourseSession
+    extra = 0
+
+
+@admin.register(Course)
+class CourseAdmin(admin.ModelAdmin):
+    list_display = ('title', 'teacher', 'duration_weeks', 'created_at')
+    list_select_related = ('teacher__user',)
+    search_fields = ('^title',)
+    autocomplete_fields = ('teacher',)
+    inlines = (CourseSessionInline,)
+
+
+@admin.register(Enrollment)
+class EnrollmentAdmin(LargeTableAdmin):
+    list_display = ('student', 'course', 'status', 'created_at')
+    list_select_related = ('student__user', 'course')
+    list_filter = ('status',)
+    search_fields = ('=student__roll_number', '^course__title')
+    autocomplete_fields = ('student', 'course')
+    ordering = ('-created_at',)
+
+
+@admin.register(Notification)
+class NotificationAdmin(LargeTableAdmin):
+    list_display = ('receiver', 'type', 'sent_at')
+    list_select_related = ('receiver',)
+    list_filter = ('type',)
+    search_fields = ('^receiver__email',)
+    raw_id_fields = ('receiver',)
+    ordering = ('-sent_at',)
+
+
+@admin.register(Job)
+class JobAdmin(LargeTableAdmin):
+    list_display = ('type', 'status', 'attempts', 'created_by', 'created_at', 'finished_at')
+    list_select_related = ('created_by',)
+    list_filter = ('status', 'type')
+    raw_id_fields = ('created_by',)
+    ordering = ('-created_at',)
@@ -0,0 +1,28 @@
+"""
+System checks for settings that only matter in production.
+"""
+
+from django.conf import settings
+from django.core.checks import Error, Tags, register
+
+# Cache backends whose entries are private to one process.
+PROCESS_LOCAL_CACHES = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+
+@register(Tags.caches, deploy=True)
+def check_shared_cache(app_configs, **kwargs):
+    """Require a cache shared by all worker processes."""
+    if settings.CACHES['default']['BACKEND'] not in PROCESS_LOCAL_CACHES:
+        return []
+    return [Error(
+        'The default cache is private to each process.',
+        hint=(
+            'Rate limit buckets, Idempotency-Key responses and read-your-writes '
+            'pins must be shared by every gunicorn worker. Set CACHE_BACKEND and '
+            'CACHE_LOCATION to a shared cache such as Redis.'
+        ),
+        id='core.E001',
+    )]
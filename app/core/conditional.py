@@ -0,0 +1,128 @@
+"""
+HTTP conditional request support (ETag) for viewsets.
+
+ETags are derived from ``MAX(updated_at)`` and row counts of the querysets
+a response is built from, or from the listed rows themselves where they
+carry everything shown, so an unchanged resource is answered with
+``304 Not Modified`` before anything is serialized.
+
+No ``Last-Modified`` is sent: deleting a row, or a row leaving a filtered
+roster, does not raise ``MAX(updated_at)``, so ``If-Modified-Since`` would
+keep answering 304 for a response that lost a row. The row counts in the
+ETag catch those changes.
+"""
+
+import hashlib
+from functools import partial
+
+from django.db.models import Count, IntegerField, Max, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
+from rest_framework.response import Response
+
+from core.models import User, StudentProfile, Course, Enrollment
+
+
+def compute_etag(request, sources):
+    """
+    Return the ETag for a list of ``(queryset, field)`` pairs.
+
+    A tuple of fields instead hashes those values of every row.
+    """
+    digest = hashlib.sha1()
+    digest.update(request.get_full_path().encode())
+    digest.update(str(request.user.pk).encode())
+    digest.update(request.META.get('HTTP_ACCEPT', '').encode())
+
+    for queryset, field in sources:
+        if isinstance(field, tuple):
+            for row in queryset.order_by('pk').values_list(*field):
+                digest.update(('|' + ':'.join(map(str, row))).encode())
+            continue
+        stats = queryset.order_by().aggregate(last=Max(field), count=Count('pk'))
+        last = stats['last']
+        digest.update(f"|{stats['count']}:{last.isoformat() if last else ''}".encode())
+
+    return 'W/' + quote_etag(digest.hexdigest())
+
+
+def student_sources(students):
+    """Sources for StudentProfileSerializer output."""
+    return [
+        (students, 'updated_at'),
+        (User.objects.filter(studentprofile__in=students), 'updated_at'),
+    ]
+
+
+def teacher_sources(teachers):
+    """Sources for TeacherProfileSerializer output."""
+    return [
+        (teachers, 'updated_at'),
+        (User.objects.filter(teacherprofile__in=teachers), 'updated_at'),
+    ]
+
+
+def with_enrollment_counts(courses):
+    """Annotate each course's number of active enrollments as ``active_enrollment_count``."""
+    active = (
+        Enrollment.objects.filter(course=OuterRef('pk'), status='ACTIVE')
+        .order_by().values('course')
+        .annotate(total=Count('pk'))
+        .values('total')
+    )
+    return courses.annotate(active_enrollment_count=Coalesce(Subquery(active, output_field=IntegerField()), 0))
+
+
+def course_sources(courses):
+    """Sources for course output: the listed courses with their teacher and active enrollment count."""
+    return [(
+        with_enrollment_counts(courses),
+        ('pk', 'updated_at', 'teacher__user__updated_at', 'active_enrollment_count'),
+    )]
+
+
+def enrollment_sources(enrollments):
+    """Sources for enrollment output, including the nested student, course and teacher."""
+    courses = Course.objects.filter(enrollments__in=enrollments)
+    students = StudentProfile.objects.filter(enrollments__in=enrollments)
+    return [
+        (enrollments, 'updated_at'),
+        (courses, 'updated_at'),
+        (User.objects.filter(teacherprofile__courses__in=courses), 'updated_at'),
+    ] + student_sources(students)
+
+
+class ConditionalGetMixin:
+    """ViewSet mixin answering list and retrieve with ETag validators."""
+
+    def get_validator_sources(self, queryset):
+        """Return ``(queryset, field)`` pairs whose changes alter the response."""
+        return [(queryset, 'updated_at')]
+
+    def conditional_response(self, request, sources, render):
+        """Return 304 if the request's validators still match, else ``render()``."""
+        etag = compute_etag(request, sources)
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = render()
+        if response.status_code in (200, 304):
+            response['ETag'] = etag
+        return response
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        return self.conditional_response(
+            request,
+            self.get_validator_sources(queryset),
+            partial(super().list, request, *args, **kwargs),
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        queryset = type(instance).objects.filter(pk=instance.pk)
+        return self.conditional_response(
+            request,
+            self.get_validator_sources(queryset),
+            lambda: Response(self.get_serializer(instance).data),
+        )
@@ -0,0 +1,196 @@
+"""
+Monthly range partitioning for append-only PostgreSQL tables.
+
+A partitioned table keeps one partition per calendar month (UTC) of its
+timestamp column, named ``<table>_pYYYY_MM``, plus a ``<table>_default``
+partition that catches rows outside every month created so far. Queries
+that filter on the timestamp only touch the months they need, and old
+months are dropped whole instead of deleted row by row.
+
+PostgreSQL requires the primary key of a partitioned table to include the
+partition column, so the primary key becomes ``(id, <column>)``. The ORM
+still addresses rows by ``id`` alone.
+"""
+
+import logging
+import re
+from datetime import date
+
+from django.db import OperationalError, transaction
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SUFFIX = '_default'
+
+
+def month_start(value):
+    """Return the first day of the month ``value`` falls in."""
+    return date(value.year, value.month, 1)
+
+
+def add_months(month, months):
+    """Return the first day of the month ``months`` after ``month``."""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table, month):
+    """Return the name of the partition of ``table`` for ``month``."""
+    return f'{table}_p{month:%Y_%m}'
+
+
+def _bound(month):
+    # Partition bounds must be literals on PostgreSQL 11.
+    return f"'{month:%Y-%m-%d} 00:00:00+00'"
+
+
+def monthly_partitions(connection, table):
+    """Return ``{month: partition name}`` for the monthly partitions of ``table``."""
+    pattern = re.compile(rf'^{re.escape(table)}_p(\d{{4}})_(\d{{2}})$')
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid '
+            'WHERE i.inhparent = %s::regclass',
+            [table]
+        )
+        names = [name for name, in cursor.fetchall()]
+    partitions = {}
+    for name in names:
+        match = pattern.match(name)
+        if match:
+            partitions[date(int(match[1]), int(match[2]), 1)] = name
+    return partitions
+
+
+def create_partition(connection, table, column, month):
+    """
+    Create the partition of ``table`` for ``month``, moving any rows for
+    that month out of the default partition.
+    """
+    quote = connection.ops.quote_name
+    name = partition_name(table, month)
+    default = table + DEFAULT_SUFFIX
+    lower, upper = _bound(month), _bound(add_months(month, 1))
+
+    with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+        cursor.execute(
+            f'SELECT EXISTS (SELECT 1 FROM {quote(default)} '
+            f'WHERE {quote(column)} >= {lower} AND {quote(column)} < {upper})'
+        )
+        if not cursor.fetchone()[0]:
+            cursor.execute(
+                f'CREATE TABLE {quote(name)} PARTITION OF {quote(table)} '
+                f'FOR VALUES FROM ({lower}) TO ({upper})'
+            )
+            return name
+
+        # A new partition may not overlap rows already in the default one.
+        cursor.execute(f'ALTER TABLE {quote(table)} DETACH PARTITION {quote(default)}')
+        cursor.execute(
+            f'CREATE TABLE {quote(name)} PARTITION OF {quote(table)} '
+            f'FOR VALUES FROM ({lower}) TO ({upper})'
+        )
+        cursor.execute(
+            f'WITH moved AS (DELETE FROM {quote(default)} '
+            f'WHERE {quote(column)} >= {lower} AND {quote(column)} < {upper} RETURNING *) '
+            f'INSERT INTO {quote(table)} SELECT * FROM moved'
+        )
+        cursor.execute(f'ALTER TABLE {quote(table)} ATTACH PARTITION {quote(default)} DEFAULT')
+    return name
+
+
+def ensure_partitions(connection, table, column, first, last):
+    """Create the missing monthly partitions from ``first`` to ``last``; return their names."""
+    existing = monthly_partitions(connection, table)
+    created = []
+    month = month_start(first)
+    while month <= last:
+        if month not in existing:
+            created.append(create_partition(connection, table, column, month))
+        month = add_months(month, 1)
+    return created
+
+
+def drop_partitions(connection, table, before, lock_timeout='5s'):
+    """
+    Detach and drop the monthly partitions of ``table`` that end on or
+    before ``before``; return the names of those dropped. A partition whose
+    lock is not granted within ``lock_timeout`` is skipped until the next run.
+    """
+    quote = connection.ops.quote_name
+    dropped = []
+    for month, name in sorted(monthly_partitions(connection, table).items()):
+        if add_months(month, 1) > before:
+            continue
+        # Detaching briefly locks the parent (DETACH ... CONCURRENTLY is not
+        # allowed next to a default partition); give up rather than queue
+        # inserts behind a long-running query.
+        try:
+            with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+                cursor.execute(f"SET LOCAL lock_timeout = '{lock_timeout}'")
+                cursor.execute(f'ALTER TABLE {quote(table)} DETACH PARTITION {quote(name)}')
+                cursor.execute(f'DROP TABLE {quote(name)}')
+        except OperationalError:
+            logger.warning(f"Could not drop partition {name}; it will be retried on the next run", exc_info=True)
+            continue
+        dropped.append(name)
+    return dropped
+
+
+def partition_table(connection, table, column, last):
+    """
+    Rebuild ``table`` as a table partitioned by month on ``column``, with
+    partitions up to ``last``, keeping its rows, indexes and foreign keys.
+
+    The table is locked for the duration, so run it in a migration.
+    """
+    quote = connection.ops.quote_name
+    staging = f'{table}_partitioned'
+
+    with connection.cursor() as cursor:
+        cursor.execute(f'LOCK TABLE {quote(table)} IN ACCESS EXCLUSIVE MODE')
+        primary_key = connection.introspection.get_primary_key_column(cursor, table)
+        cursor.execute(
+            'SELECT pg_get_indexdef(indexrelid) FROM pg_index '
+            'WHERE indrelid = %s::regclass AND NOT indisprimary',
+            [table]
+        )
+        indexes = [definition for definition, in cursor.fetchall()]
+        cursor.execute(
+            "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+            "WHERE conrelid = %s::regclass AND contype = 'f'",
+            [table]
+        )
+        foreign_keys = cursor.fetchall()
+        cursor.execute(f'SELECT MIN({quote(column)}) FROM {quote(table)}')
+        oldest = cursor.fetchone()[0]
+
+        cursor.execute(
+            f'CREATE TABLE {quote(staging)} (LIKE {quote(table)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS) '
+            f'PARTITION BY RANGE ({quote(column)})'
+        )
+        cursor.execute(
+            f'CREATE TABLE {quote(table + DEFAULT_SUFFIX)} PARTITION OF {quote(staging)} DEFAULT'
+        )
+        month = month_start(oldest or last)
+        while month <= last:
+            cursor.execute(
+                f'CREATE TABLE {quote(partition_name(table, month))} PARTITION OF {quote(staging)} '
+                f'FOR VALUES FROM ({_bound(month)}) TO ({_bound(add_months(month, 1))})'
+            )
+            month = add_months(month, 1)
+
+        cursor.execute(f'INSERT INTO {quote(staging)} SELECT * FROM {quote(table)}')
+        cursor.execute(f'DROP TABLE {quote(table)}')
+        cursor.execute(f'ALTER TABLE {quote(staging)} RENAME TO {quote(table)}')
+
+        # Indexes and constraints are created on the parent once the rows are
+        # in place; PostgreSQL builds them on every partition.
+        cursor.execute(
+            f'ALTER TABLE {quote(table)} ADD CONSTRAINT {quote(table + "_pkey")} '
+            f'PRIMARY KEY ({quote(primary_key)}, {quote(column)})'
+        )
+        for definition in indexes:
+            cursor.execute(definition)
+        for name, definition in foreign_keys:
+            cursor.execute(f'ALTER TABLE {quote(table)} ADD CONSTRAINT {quote(name)} {definition}')
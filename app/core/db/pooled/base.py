@@ -0,0 +1,133 @@
+"""
+PostgreSQL backend that borrows connections from an in-process pool.
+
+Django opens a connection per thread and closes it at the end of each
+request when ``CONN_MAX_AGE`` is 0. With this backend ``close()`` returns
+the connection to a process-wide pool instead, so requests (including the
+threads ASGI runs sync ORM code on) skip the TCP and TLS handshake.
+
+Configure it through the ``POOL`` key of the database settings:
+
+    'POOL': {'min_size': 2, 'max_size': 20, 'timeout': 10, 'check_after': 30}
+"""
+
+import threading
+import time
+
+import psycopg2
+import psycopg2.extras
+from psycopg2.pool import ThreadedConnectionPool
+
+from django.db.backends.postgresql import base
+from django.db.backends.postgresql.psycopg_any import IsolationLevel
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+class _JSONThreadedConnectionPool(ThreadedConnectionPool):
+    """Thread-safe pool whose connections are set up the way Django expects."""
+
+    def _connect(self, key=None):
+        connection = super()._connect(key)
+        # Same as Django: avoid decoding jsonb twice for JSONField.
+        psycopg2.extras.register_default_jsonb(conn_or_curs=connection, loads=lambda x: x)
+        return connection
+
+
+class ConnectionPool:
+    """
+    Blocking wrapper around psycopg2's pool with idle health checks.
+
+    ``min_size`` connections are kept open between requests; connections
+    opened above that under load are closed when they are returned.
+    """
+
+    def __init__(self, conn_params, min_size=1, max_size=10, timeout=10, check_after=30):
+        self.max_size = max_size
+        self.timeout = timeout
+        self.check_after = check_after
+        self._pool = _JSONThreadedConnectionPool(min_size, max_size, **conn_params)
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._returned_at = {}
+        self._lock = threading.Lock()
+
+    def getconn(self):
+        """Borrow a connection, waiting up to ``timeout`` seconds for a free slot."""
+        if not self._slots.acquire(timeout=self.timeout):
+            raise psycopg2.OperationalError(
+                f"Timed out after {self.timeout}s waiting for a pooled connection"
+            )
+        try:
+            return self._checkout()
+        except Exception:
+            self._slots.release()
+            raise
+
+    def _checkout(self):
+        with self._lock:
+            connection = self._pool.getconn()
+            returned_at = self._returned_at.pop(id(connection), None)
+        if returned_at is not None and time.monotonic() - returned_at > self.check_after:
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute('SELECT 1')
+                connection.rollback()
+            except psycopg2.Error:
+                self._pool.putconn(connection, close=True)
+                connection = self._pool.getconn()
+        return connection
+
+    def putconn(self, connection):
+        """Return a connection; broken ones are closed instead of reused."""
+        try:
+            with self._lock:
+                self._pool.putconn(connection, close=bool(connection.closed))
+                if not connection.closed:
+                    self._returned_at[id(connection)] = time.monotonic()
+        finally:
+            self._slots.release()
+
+    def status(self):
+        """Return pool usage counters."""
+        return {
+            'max_size': self.max_size,
+            'in_use': len(self._pool._used),
+            'idle': len(self._pool._pool),
+        }
+
+
+def get_pool(conn_params, options):
+    """Return the process-wide pool for ``conn_params``, creating it on first use."""
+    key = repr(sorted(conn_params.items()))
+    with _pools_lock:
+        if key not in _pools:
+            _pools[key] = ConnectionPool(conn_params, **options)
+        return _pools[key]
+
+
+def pool_status():
+    """Return the status of every pool created in this process."""
+    with _pools_lock:
+        return [pool.status() for pool in _pools.values()]
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """PostgreSQL wrapper whose connections come from and go back to a pool."""
+
+    def get_new_connection(self, conn_params):
+        pool = get_pool(conn_params, self.settings_dict.get('POOL', {}))
+        connection = pool.getconn()
+        isolation_level = self.settings_dict['OPTIONS'].get('isolation_level')
+        if isolation_level is None:
+            self.isolation_level = IsolationLevel.READ_COMMITTED
+        else:
+            self.isolation_level = IsolationLevel(isolation_level)
+            connection.isolation_level = self.isolation_level
+        self.pool = pool
+        return connection
+
+    def _close(self):
+        if self.connection is not None:
+            with self.wrap_database_errors:
+                return self.pool.putconn(self.connection)
@@ -0,0 +1,110 @@
+"""
+Read-replica routing.
+
+``ReplicaRoutingMiddleware`` (core.middleware) picks a replica for each
+safe-method request and stores it with :func:`use_database`; the router
+then sends every read made during that request to it. Writes, management
+commands and background jobs always use ``default``.
+
+Replicas whose replication lag exceeds ``DB_REPLICA_MAX_LAG`` seconds, or
+that cannot be reached, are skipped until the next lag check.
+"""
+
+import logging
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+
+logger = logging.getLogger(__name__)
+
+_read_database = ContextVar('read_database', default=None)
+
+# alias -> (checked_at, lag in seconds or None when unreachable)
+_lag_cache = {}
+
+LAG_QUERY = """
+    SELECT CASE
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+    END
+"""
+
+
+def replica_aliases():
+    """Return the configured replica database aliases."""
+    return getattr(settings, 'DATABASE_REPLICAS', [])
+
+
+def measure_lag(alias):
+    """Return the replication lag of ``alias`` in seconds, or None if unreachable."""
+    try:
+        connection = connections[alias]
+        if connection.vendor != 'postgresql':
+            connection.ensure_connection()
+            return 0.0
+        # Bounded so a replica that accepts connections but hangs is
+        # reported as unreachable instead of stalling the caller.
+        with transaction.atomic(using=alias), connection.cursor() as cursor:
+            cursor.execute("SELECT set_config('statement_timeout', %s, true)", [settings.REPLICA_LAG_QUERY_TIMEOUT])
+            cursor.execute(LAG_QUERY)
+            lag = cursor.fetchone()[0]
+        # NULL on a server that is not replaying WAL, i.e. not lagging.
+        return float(lag or 0)
+    except Exception:
+        logger.warning(f"Replica {alias} is unreachable", exc_info=True)
+        return None
+
+
+def replica_lag(alias):
+    """Return the cached lag of ``alias``, measuring it again when stale."""
+    now = time.monotonic()
+    checked_at, lag = _lag_cache.get(alias, (None, None))
+    if checked_at is None or now - checked_at >= settings.REPLICA_LAG_CHECK_INTERVAL:
+        lag = measure_lag(alias)
+        _lag_cache[alias] = (now, lag)
+    return lag
+
+
+def healthy_replicas():
+    """Return the replicas that are reachable and within the allowed lag."""
+    return [
+        alias for alias in replica_aliases()
+        if (lag := replica_lag(alias)) is not None and lag <= settings.REPLICA_MAX_LAG
+    ]
+
+
+def choose_replica():
+    """Pick a healthy replica at random, or None to read from the primary."""
+    replicas = healthy_replicas()
+    return random.choice(replicas) if replicas else None
+
+
+@contextmanager
+def use_database(alias):
+    """Route reads made inside the block to ``alias`` (``None`` for the primary)."""
+    token = _read_database.set(alias)
+    try:
+        yield
+    finally:
+        _read_database.reset(token)
+
+
+class ReplicaRouter:
+    """Send reads to the replica chosen for the current request."""
+
+    def db_for_read(self, model, **hints):
+        return _read_database.get() or DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same rows as the primary.
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == DEFAULT_DB_ALIAS
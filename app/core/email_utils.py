@@ -1,6 +1,19 @@
-from django.core.mail import send_mail
+import logging
+from datetime import timedelta
+from django.core.mail import send_mail, get_connection, EmailMessage
 from django.conf import settings
-from core.models import Notification
+from core.models import Notification, PendingNotification
+
+logger = logging.getLogger(__name__)
+
+# How long notifications are held before a user's digest is sent.
+DIGEST_WINDOWS = {
+    'IMMEDIATE': timedelta(0),
+    'HOURLY': timedelta(hours=1),
+    'DAILY': timedelta(days=1),
+}
+# Notification types that are never held for a digest (account emails carry credentials).
+IMMEDIATE_TYPES = ('ACCOUNT_CREATED',)
 
 
 class EmailNotificationService:
@@ -11,8 +24,18 @@ class EmailNotificationService:
     @staticmethod
     def send_email_notification(receiver, subject, message, notification_type, context=None):
         """
-        Send email notification and store notification record.
+        Send email notification and store notification record, or hold it
+        for the receiver's digest.
         """
+        if EmailNotificationService.is_digested(receiver, notification_type):
+            PendingNotification.objects.create(
+                receiver=receiver,
+                subject=subject,
+                message=message,
+                type=notification_type
+            )
+            return True
+        
         try:
             send_mail(
                 subject=subject,
@@ -35,6 +58,27 @@ class EmailNotificationService:
             print(f"Failed to send email notification to {receiver.email}: {str(e)}") 
             return False
     
+    @staticmethod
+    def is_digested(receiver, notification_type):
+        """
+        Return whether the notification should wait for the receiver's digest.
+        """
+        return receiver.digest_frequency != 'IMMEDIATE' and notification_type not in IMMEDIATE_TYPES
+    
+    @staticmethod
+    def digest_notification(receiver, pending):
+        """
+        Combine pending notifications into one (subject, message, type).
+        """
+        if len(pending) == 1:
+            return pending[0].subject, pending[0].message, pending[0].type
+        
+        subject = f"You have {len(pending)} new notifications"
+        message = f"Dear {receiver.name}, here is what happened since your last update:\n\n" + "\n\n".join(
+            f"{notification.subject}\n{notification.message}" for notification in pending
+        )
+        return subject, message, 'DIGEST'
+    
     @staticmethod
     def send_enrollment_notification(student, course, teacher):
         """
@@ -62,30 +106,132 @@ class EmailNotificationService:
         )
     
     @staticmethod
-    def send_removal_notification(student, course, teacher):
+    def send_bulk_email_notifications(notifications, notification_type):
         """
-        Send notification when student is removed from a course.
+        Send many (receiver, subject, message) notifications over a single
+        connection and store their records in one insert. Notifications for
+        receivers with a digest are held for it instead. Mail server errors
+        are raised, so run it in a transaction that can be retried.
+        """
+        held, immediate = [], []
+        for receiver, subject, message in notifications:
+            if EmailNotificationService.is_digested(receiver, notification_type):
+                held.append(PendingNotification(
+                    receiver=receiver, subject=subject, message=message, type=notification_type
+                ))
+            else:
+                immediate.append((receiver, subject, message))
+        if held:
+            PendingNotification.objects.bulk_create(held)
+        notifications = immediate
+        
+        if not notifications:
+            return 0
+        
+        try:
+            connection = get_connection(fail_silently=False)
+            sent = connection.send_messages([
+                EmailMessage(
+                    subject=subject,
+                    body=message,
+                    from_email=settings.DEFAULT_FROM_EMAIL,
+                    to=[receiver.email],
+                    connection=connection,
+                )
+                for receiver, subject, message in notifications
+            ])
+        except Exception:
+            # Raised so the background job running the batch is retried.
+            logger.exception(f"Failed to send {len(notifications)} bulk email notifications")
+            raise
+        
+        Notification.objects.bulk_create([
+            Notification(receiver=receiver, message=message, type=notification_type)
+            for receiver, subject, message in notifications
+        ])
+        
+        return sent
+    
+    @staticmethod
+    def send_announcement_emails(announcement, receivers):
+        """
+        Email a course announcement to many receivers over a single
+        connection. No Notification records are stored, since the
+        announcement itself shows in their inboxes; receivers with a digest
+        get it in their next digest instead.
+        """
+        subject = f"{announcement.course.title}: {announcement.title}"
+        held, immediate = [], []
+        for receiver in receivers:
+            if EmailNotificationService.is_digested(receiver, 'ANNOUNCEMENT'):
+                held.append(PendingNotification(
+                    receiver=receiver, subject=subject, message=announcement.message, type='ANNOUNCEMENT'
+                ))
+            else:
+                immediate.append(receiver)
+        if held:
+            PendingNotification.objects.bulk_create(held)
+        if not immediate:
+            return 0
+        
+        connection = get_connection(fail_silently=False)
+        return connection.send_messages([
+            EmailMessage(
+                subject=subject,
+                body=announcement.message,
+                from_email=settings.DEFAULT_FROM_EMAIL,
+                to=[receiver.email],
+                connection=connection,
+            )
+            for receiver in immediate
+        ])
+    
+    @staticmethod
+    def removal_notifications(student, course, teacher):
+        """
+        Build the (receiver, subject, message) notifications for a removal.
         """
         
         student_subject = f"Removed from Course: {course.title}"
         student_message = f"Dear {student.user.name}, you have been removed from the course '{course.title}'. If you have any questions, please contact the administration."
         
-        EmailNotificationService.send_email_notification(
-            receiver=student.user,
-            subject=student_subject,
-            message=student_message,
-            notification_type='REMOVAL'
-        )
-        
         teacher_subject = f"Student Removed: {course.title}"
         teacher_message = f"Dear {teacher.user.name}, student '{student.user.name}' (Roll No: {student.roll_number}) has been removed from your course '{course.title}'."
         
-        EmailNotificationService.send_email_notification(
-            receiver=teacher.user,
-            subject=teacher_subject,
-            message=teacher_message,
-            notification_type='REMOVAL'
-        )
+        return [
+            (student.user, student_subject, student_message),
+            (teacher.user, teacher_subject, teacher_message),
+        ]
+    
+    @staticmethod
+    def send_removal_notification(student, course, teacher):
+        """
+        Send notification when student is removed from a course.
+        """
+        for receiver, subject, message in EmailNotificationService.removal_notifications(student, course, teacher):
+            EmailNotificationService.send_email_notification(
+                receiver=receiver,
+                subject=subject,
+                message=message,
+                notification_type='REMOVAL'
+            )
+    
+    @staticmethod
+    def send_bulk_removal_notification(enrollments):
+        """
+        Send removal notifications for many enrollments in a single batch.
+        Enrollments should have student.user and course.teacher.user loaded.
+        """
+        notifications = []
+        for enrollment in enrollments:
+            if enrollment.course.teacher:
+                notifications.extend(EmailNotificationService.removal_notifications(
+                    student=enrollment.student,
+                    course=enrollment.course,
+                    teacher=enrollment.course.teacher
+                ))
+        
+        return EmailNotificationService.send_bulk_email_notifications(notifications, 'REMOVAL')
     
     @staticmethod
     def send_course_assignment_notification(teacher, course):
@@ -0,0 +1,194 @@
+"""
+Sparse fieldsets for serializers and viewsets.
+
+Clients can ask for a subset of a resource with ``?fields=`` and control
+which nested relations are rendered inline with ``?expand=``:
+
+    GET /api/enrollments/?fields=id,status,course.title
+    GET /api/enrollments/?fields=id,status,course&expand=course
+
+When ``fields`` is given, nested relations that are listed without a
+sub-selection and are not expanded collapse to their primary key. Without
+``fields`` the full representation is returned, as before.
+"""
+
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import permissions, serializers
+from rest_framework.response import Response
+
+
+def parse_field_paths(value):
+    """Turn ``"id,course.title"`` into ``{'id': {}, 'course': {'title': {}}}``."""
+    tree = {}
+    for path in (value or '').split(','):
+        path = path.strip()
+        if not path:
+            continue
+        node = tree
+        for part in path.split('.'):
+            node = node.setdefault(part, {})
+    return tree
+
+
+def get_sparse_params(request):
+    """Return the parsed ``(fields, expand)`` trees for a request, or ``None``."""
+    if request is None or request.method not in permissions.SAFE_METHODS:
+        return None
+    params = getattr(request, 'query_params', request.GET)
+    if 'fields' not in params and 'expand' not in params:
+        return None
+    fields = parse_field_paths(params['fields']) if 'fields' in params else None
+    return fields, parse_field_paths(params.get('expand'))
+
+
+class DynamicFieldsMixin:
+    """Serializer mixin that trims its fields to ``?fields=`` and ``?expand=``."""
+
+    def get_fields(self):
+        fields = super().get_fields()
+        spec = self._get_sparse_spec()
+        if spec is None:
+            return fields
+
+        only, expand = spec
+        for name in list(fields):
+            field = fields[name]
+            if only is not None and name not in only and name not in expand:
+                del fields[name]
+                continue
+
+            if not isinstance(field, serializers.Serializer):
+                continue
+
+            sub_only = only.get(name) if only is not None else None
+            sub_expand = expand.get(name, {})
+            if sub_only:
+                field._sparse_spec = (sub_only, sub_expand)
+            elif only is None or name in expand:
+                field._sparse_spec = (None, sub_expand)
+            else:
+                # Fields are not bound yet, so an implicit source is still None.
+                source = field.source or name
+                if source != '*' and '.' not in source:
+                    kwargs = {} if source == name else {'source': source}
+                    fields[name] = serializers.PrimaryKeyRelatedField(
+                        read_only=True, **kwargs
+                    )
+        return fields
+
+    def _get_sparse_spec(self):
+        """Nested serializers get their spec from the parent; roots read the request."""
+        if hasattr(self, '_sparse_spec'):
+            return self._sparse_spec
+
+        parent = self.parent
+        if isinstance(parent, serializers.ListSerializer):
+            parent = parent.parent
+        if parent is not None:
+            return None
+        return get_sparse_params(self.context.get('request'))
+
+
+def _resolve_path(model, parts):
+    """Return True if ``parts`` walks forward relations to a concrete column."""
+    for index, part in enumerate(parts):
+        try:
+            field = model._meta.get_field(part)
+        except FieldDoesNotExist:
+            return False
+        if not field.concrete or field.many_to_many:
+            return False
+        if index < len(parts) - 1:
+            if not field.is_relation:
+                return False
+            model = field.related_model
+    return True
+
+
+def _collect_sources(model, serializer, prefix, related, columns):
+    """
+    Gather the ``select_related`` paths and columns a serializer reads.
+
+    Returns False when some field cannot be mapped to a column, in which
+    case the caller should not defer anything.
+    """
+    complete = True
+    for field in serializer.fields.values():
+        if field.write_only:
+            continue
+        if isinstance(field, serializers.SerializerMethodField):
+            # Method fields in this project only read the primary key.
+            continue
+        if field.source == '*' or isinstance(field, (serializers.ListSerializer, serializers.ManyRelatedField)):
+            complete = False
+            continue
+
+        parts = (prefix + field.source.replace('.', '__')).split('__')
+        if not _resolve_path(model, parts):
+            complete = False
+            continue
+
+        for index in range(1, len(parts)):
+            related.add('__'.join(parts[:index]))
+            columns.add('__'.join(parts[:index]))
+        columns.add('__'.join(parts))
+
+        if isinstance(field, serializers.BaseSerializer):
+            path = '__'.join(parts)
+            related.add(path)
+            if not _collect_sources(model, field, path + '__', related, columns):
+                complete = False
+    return complete
+
+
+def sparse_queryset(queryset, serializer, defer_unused=False):
+    """
+    Join the relations ``serializer`` renders and, if ``defer_unused`` is set,
+    load only the columns it needs.
+    """
+    related, columns = set(), set()
+    complete = _collect_sources(queryset.model, serializer, '', related, columns)
+    if related:
+        queryset = queryset.select_related(*sorted(related))
+    if defer_unused and complete:
+        queryset = queryset.only(*sorted(columns))
+    return queryset
+
+
+class SparseFieldsetMixin:
+    """ViewSet mixin that narrows list/retrieve querysets to the rendered fields."""
+
+    sparse_actions = ('list', 'retrieve')
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if getattr(self, 'action', 'list') in self.sparse_actions:
+            queryset = self.sparse_queryset(queryset, self.get_serializer())
+        return queryset
+
+    def sparse_queryset(self, queryset, serializer):
+        """Optimize ``queryset`` for ``serializer`` on safe requests."""
+        if self.request.method not in permissions.SAFE_METHODS:
+            return queryset
+        if isinstance(serializer, serializers.ListSerializer):
+            serializer = serializer.child
+        params = get_sparse_params(self.request)
+        defer_unused = params is not None and params[0] is not None
+        return sparse_queryset(queryset, serializer, defer_unused=defer_unused)
+
+    def get_sparse_serializer(self, serializer_class, queryset):
+        """Serialize ``queryset`` with ``serializer_class`` honouring ``?fields=``."""
+        serializer = serializer_class(
+            queryset, many=True, context=self.get_serializer_context()
+        )
+        serializer.instance = self.sparse_queryset(queryset, serializer)
+        return serializer
+
+    def sparse_response(self, serializer_class, queryset, projection_class=None):
+        """
+        Respond with ``queryset`` rendered by ``projection_class`` when no
+        fields are requested, otherwise by ``serializer_class``.
+        """
+        if projection_class is not None and get_sparse_params(self.request) is None:
+            return Response(projection_class(queryset).data)
+        return Response(self.get_sparse_serializer(serializer_class, queryset).data)
@@ -0,0 +1,59 @@
+"""
+Dependency checks shared by the ``wait_for_db`` command and the
+``/healthz`` and ``/readyz`` probes.
+
+The probes are answered by ``HealthCheckMiddleware`` before host
+validation, sessions or authentication, since orchestrators call them by
+pod IP and without credentials.
+"""
+
+import logging
+import time
+
+from django.core.mail import get_connection
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.http import JsonResponse
+
+from core.db.pooled.base import pool_status
+from core.db.replicas import replica_aliases, replica_lag
+
+logger = logging.getLogger(__name__)
+
+
+def check_database(alias=DEFAULT_DB_ALIAS):
+    """Run ``SELECT 1`` on ``alias`` and return the round trip in milliseconds."""
+    start = time.perf_counter()
+    with connections[alias].cursor() as cursor:
+        cursor.execute('SELECT 1')
+        cursor.fetchone()
+    return (time.perf_counter() - start) * 1000
+
+
+def check_smtp():
+    """Open and close a connection with the configured email backend."""
+    start = time.perf_counter()
+    connection = get_connection(fail_silently=False)
+    connection.open()
+    connection.close()
+    return (time.perf_counter() - start) * 1000
+
+
+def healthz(request):
+    """Liveness: the process is up and serving requests."""
+    return JsonResponse({'status': 'ok'})
+
+
+def readyz(request):
+    """Readiness: the primary database answers, with latency and pool usage."""
+    body = {'status': 'ok'}
+    try:
+        body['database'] = {'status': 'ok', 'latency_ms': round(check_database(), 2)}
+    except Exception:
+        # The probe is unauthenticated; details go to the log, not the body.
+        logger.warning('Readiness check: database unavailable', exc_info=True)
+        body['status'] = 'unavailable'
+        body['database'] = {'status': 'error'}
+
+    body['pools'] = pool_status()
+    body['replicas'] = {alias: replica_lag(alias) for alias in replica_aliases()}
+    return JsonResponse(body, status=200 if body['status'] == 'ok' else 503)
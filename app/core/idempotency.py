@@ -0,0 +1,139 @@
+"""
+``Idempotency-Key`` support for write endpoints.
+
+Clients that retry a request after a timeout send the same key each time:
+
+    POST /api/enrollments/
+    Idempotency-Key: 5f0c7c1e-6b7e-4c43-9a59-2f0d4b8c1a21
+
+The first request runs normally and, if it succeeds, its response is stored
+in the default cache for ``IDEMPOTENCY_KEY_TTL`` seconds; retries get that
+response back (with ``Idempotent-Replayed: true``) without validating,
+writing or sending emails again. Keys are scoped to the user, method and
+path. A retry that arrives while the first request is still running gets
+``409``, and reusing a key with a different body gets ``422``. Failed
+requests are not stored, so they can be retried with the same key.
+
+Keys live in the default cache, which must be shared by every worker
+process and should not evict them early (the ``core.E001`` deploy check
+rejects per-process caches). While a request runs its key holds an
+in-flight marker that expires after ``IDEMPOTENCY_IN_FLIGHT_TIMEOUT``
+seconds, longer than gunicorn lets a request run, so a slow request keeps
+its key and a worker that dies releases it. If the cache is unavailable
+requests are processed without the guarantee rather than failing.
+"""
+
+import hashlib
+import json
+import logging
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import QueryDict
+from drf_spectacular.utils import OpenApiParameter
+from rest_framework import status
+from rest_framework.response import Response
+
+logger = logging.getLogger(__name__)
+
+HEADER = 'Idempotency-Key'
+MAX_KEY_LENGTH = 255
+IN_FLIGHT = 'in-flight'
+
+IDEMPOTENCY_KEY_PARAMETER = OpenApiParameter(
+    name=HEADER,
+    type=str,
+    location=OpenApiParameter.HEADER,
+    required=False,
+    description='Unique key for this request; retries with the same key replay the first response',
+)
+
+
+def request_fingerprint(request):
+    """Return a digest of the request body, to detect a key reused for another request."""
+    data = request.data
+    if isinstance(data, QueryDict):
+        data = dict(data.lists())
+    body = json.dumps(data, sort_keys=True, default=str)
+    return hashlib.sha256(body.encode()).hexdigest()
+
+
+def cache_key(request, key):
+    """Return the cache key for a client's key, scoped to the user, method and path."""
+    digest = hashlib.sha256(key.encode()).hexdigest()
+    return f'idempotency:{request.user.pk}:{request.method}:{request.path}:{digest}'
+
+
+def error(message, status_code):
+    """Return an error response in the API's ``{'error': ...}`` format."""
+    return Response({'error': message}, status=status_code)
+
+
+def release(store_key):
+    """Delete the in-flight marker at ``store_key`` so the key can be retried."""
+    try:
+        cache.delete(store_key)
+    except Exception:
+        logger.warning('Could not release idempotency key', exc_info=True)
+
+
+def idempotent(handler):
+    """Decorate a viewset action so requests with an ``Idempotency-Key`` run at most once."""
+
+    @wraps(handler)
+    def wrapper(self, request, *args, **kwargs):
+        key = request.headers.get(HEADER)
+        if not key:
+            return handler(self, request, *args, **kwargs)
+        if len(key) > MAX_KEY_LENGTH:
+            return error(f'{HEADER} must be at most {MAX_KEY_LENGTH} characters', status.HTTP_400_BAD_REQUEST)
+
+        store_key = cache_key(request, key)
+        fingerprint = request_fingerprint(request)
+        try:
+            claimed = cache.add(store_key, IN_FLIGHT, timeout=settings.IDEMPOTENCY_IN_FLIGHT_TIMEOUT)
+            stored = None if claimed else cache.get(store_key)
+        except Exception:
+            logger.warning('Idempotency cache unavailable, processing request', exc_info=True)
+            return handler(self, request, *args, **kwargs)
+
+        if not claimed:
+            if stored is None or stored == IN_FLIGHT:
+                response = error(
+                    f'A request with this {HEADER} is still being processed', status.HTTP_409_CONFLICT
+                )
+                response['Retry-After'] = '1'
+                return response
+            if stored['fingerprint'] != fingerprint:
+                return error(
+                    f'{HEADER} has already been used for a different request',
+                    status.HTTP_422_UNPROCESSABLE_ENTITY
+                )
+            response = Response(stored['data'], status=stored['status'], headers=stored['headers'])
+            response['Idempotent-Replayed'] = 'true'
+            return response
+
+        try:
+            response = handler(self, request, *args, **kwargs)
+        except Exception:
+            release(store_key)
+            raise
+        if not status.is_success(response.status_code):
+            release(store_key)
+            return response
+
+        try:
+            cache.set(store_key, {
+                'fingerprint': fingerprint,
+                'status': response.status_code,
+                'data': response.data,
+                'headers': {name: response[name] for name in ('Location',) if response.has_header(name)},
+            }, timeout=settings.IDEMPOTENCY_KEY_TTL)
+        except Exception:
+            # The write has committed; report it rather than a 500 that
+            # would invite the client to retry it.
+            logger.warning('Could not store idempotent response', exc_info=True)
+        return response
+
+    return wrapper
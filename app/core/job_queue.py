@@ -0,0 +1,175 @@
+"""
+Database-backed background job queue.
+
+Handlers are registered per job type in each app's ``tasks.py`` module:
+
+    @register('COURSE_DELETE')
+    def delete_course(payload):
+        ...
+        return {'deleted_enrollments': 10}
+
+Jobs are created with :func:`enqueue` and executed by the ``run_jobs``
+management command. A running job holds a lease of ``JOB_LEASE_SECONDS``
+that its worker renews while the handler runs; if the worker is killed,
+the lease expires and another worker reclaims the job as a new attempt.
+
+Handlers that work through many items in batches register with
+``resumable=True`` and also receive a :class:`Checkpoint`. Saving it inside
+each batch's transaction means a retried job carries on after the last
+committed batch instead of starting over:
+
+    @register('ANNOUNCEMENT_EMAIL', resumable=True)
+    def send_announcement_email(payload, checkpoint):
+        last_pk = checkpoint.get('last_pk')
+        ...
+        checkpoint.save(last_pk=str(batch[-1].pk))
+"""
+
+import logging
+import threading
+from contextlib import contextmanager
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.module_loading import autodiscover_modules
+
+from core.models import Job
+
+logger = logging.getLogger(__name__)
+
+_handlers = {}
+
+
+def register(job_type, resumable=False):
+    """Decorator registering ``func`` as the handler for ``job_type``."""
+    def decorator(func):
+        _handlers[job_type] = (func, resumable)
+        return func
+    return decorator
+
+
+class Checkpoint:
+    """Progress of a running job, stored on the job so retries can resume."""
+
+    def __init__(self, job):
+        self.job = job
+
+    def get(self, key, default=None):
+        """Return a saved progress value."""
+        return self.job.progress.get(key, default)
+
+    def save(self, **values):
+        """Store progress values; they commit with the surrounding transaction."""
+        self.job.progress = {**self.job.progress, **values}
+        Job.objects.filter(pk=self.job.pk).update(progress=self.job.progress, updated_at=timezone.now())
+
+
+def autodiscover():
+    """Import every installed app's ``tasks`` module so handlers register."""
+    autodiscover_modules('tasks')
+
+
+def enqueue(job_type, payload, user=None):
+    """Create a pending job and return it."""
+    return Job.objects.create(
+        type=job_type,
+        payload=payload,
+        created_by=user if user and user.is_authenticated else None,
+    )
+
+
+def claim_job():
+    """Lock the oldest runnable job, mark it RUNNING under a lease and return it."""
+    while True:
+        with transaction.atomic():
+            now = timezone.now()
+            job = (
+                Job.objects.select_for_update(skip_locked=True)
+                .filter(Q(status='PENDING', run_after__lte=now) | Q(status='RUNNING', locked_until__lt=now))
+                .order_by('run_after', 'created_at')
+                .first()
+            )
+            if job is None:
+                return None
+            if job.status == 'RUNNING':
+                logger.warning(f"Job {job.id} ({job.type}) lost its worker on attempt {job.attempts}")
+                if job.attempts >= job.max_attempts:
+                    job.status = 'FAILED'
+                    job.error = 'The worker stopped before the job finished'
+                    job.finished_at = now
+                    job.locked_until = None
+                    job.save(update_fields=['status', 'error', 'finished_at', 'locked_until', 'updated_at'])
+                    continue
+            job.status = 'RUNNING'
+            job.attempts += 1
+            job.started_at = now
+            job.locked_until = now + timedelta(seconds=settings.JOB_LEASE_SECONDS)
+            job.save(update_fields=['status', 'attempts', 'started_at', 'locked_until', 'updated_at'])
+        return job
+
+
+@contextmanager
+def holding_lease(job):
+    """Renew ``job``'s lease in the background while the block runs."""
+    done = threading.Event()
+
+    def renew():
+        try:
+            while not done.wait(settings.JOB_LEASE_SECONDS / 3):
+                try:
+                    Job.objects.filter(pk=job.pk, status='RUNNING', attempts=job.attempts).update(
+                        locked_until=timezone.now() + timedelta(seconds=settings.JOB_LEASE_SECONDS)
+                    )
+                except Exception:
+                    logger.warning(f"Could not renew the lease of job {job.id}", exc_info=True)
+        finally:
+            # Connections are per thread; do not leak this one.
+            connection.close()
+
+    thread = threading.Thread(target=renew, daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        done.set()
+        thread.join()
+
+
+def run_job(job):
+    """Run a claimed job and record its outcome, retrying with backoff on failure."""
+    handler, resumable = _handlers.get(job.type, (None, False))
+    try:
+        if handler is None:
+            raise LookupError(f"No handler registered for job type {job.type}")
+        with holding_lease(job):
+            if resumable:
+                result = handler(job.payload, Checkpoint(job))
+            else:
+                result = handler(job.payload)
+    except Exception as e:
+        logger.exception(f"Job {job.id} ({job.type}) failed on attempt {job.attempts}")
+        job.error = str(e)
+        if job.attempts < job.max_attempts:
+            job.status = 'PENDING'
+            job.run_after = timezone.now() + timedelta(seconds=30 * 2 ** (job.attempts - 1))
+        else:
+            job.status = 'FAILED'
+            job.finished_at = timezone.now()
+    else:
+        job.status = 'SUCCEEDED'
+        job.result = result or {}
+        job.error = ''
+        job.finished_at = timezone.now()
+    job.locked_until = None
+
+    with transaction.atomic():
+        attempts = Job.objects.select_for_update().filter(pk=job.pk).values_list('attempts', flat=True).first()
+        if attempts != job.attempts:
+            # The lease expired and another worker reclaimed the job.
+            logger.warning(f"Job {job.id} was reclaimed; discarding the outcome of attempt {job.attempts}")
+            return job
+        job.save()
+    return job
@@ -0,0 +1,103 @@
+"""
+Django management command to rebuild the daily enrollment rollups.
+
+Scans the enrollment table in primary-key chunks and recounts, for every
+day from ``--start`` up to the required ``--before`` date, the enrollments
+created and dropped that day. Set ``--before`` to the day the live signals
+started maintaining the rollups: only the current state of each enrollment
+is known, so reactivations (and drops later undone) cannot be recovered,
+and rebuilding days the signals counted would throw their exact figures
+away. Rows are attributed to each course's current teacher.
+
+Like the live path, an enrollment only counts as enrolled if it was created
+ACTIVE; one that is DROPPED and was never updated after being created is
+taken to have been created DROPPED and is not counted at all.
+"""
+
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from analytics.rollups import Changes
+from core.models import Enrollment, EnrollmentDailyStat
+
+# created_at and updated_at are stamped separately when a row is inserted.
+CREATED_TOLERANCE = timedelta(seconds=1)
+
+
+class Command(BaseCommand):
+    """Django command to backfill EnrollmentDailyStat from enrollment history."""
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--start',
+            help='First day to rebuild, as YYYY-MM-DD (default: all history)'
+        )
+        parser.add_argument(
+            '--before',
+            required=True,
+            help='Rebuild days before this one, as YYYY-MM-DD: the day live rollups started'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=10000,
+            help='Enrollments read per query'
+        )
+
+    def handle(self, *args, **options):
+        try:
+            start = date.fromisoformat(options['start']) if options['start'] else None
+            before = date.fromisoformat(options['before'])
+        except ValueError as e:
+            raise CommandError(f'Invalid date: {e}')
+        # Today's rows keep being maintained live.
+        cutoff = min(before, timezone.localdate())
+
+        changes = Changes()
+        enrollments = Enrollment.objects.order_by('pk').values_list(
+            'pk', 'created_at', 'updated_at', 'status',
+            'course_id', 'course__teacher_id', 'student__batch', 'student__enrollment_year'
+        )
+        last_pk, scanned = None, 0
+        while True:
+            chunk = list(
+                (enrollments.filter(pk__gt=last_pk) if last_pk else enrollments)[:options['chunk_size']]
+            )
+            if not chunk:
+                break
+            for _, created_at, updated_at, status, course_id, teacher_id, batch, year in chunk:
+                if status == 'DROPPED' and updated_at - created_at < CREATED_TOLERANCE:
+                    continue
+                events = [(created_at, 'enrolled')]
+                if status == 'DROPPED':
+                    events.append((updated_at, 'dropped'))
+                for at, metric in events:
+                    day = timezone.localdate(at)
+                    if day < cutoff and (start is None or day >= start):
+                        changes.add((day, course_id, batch, year), metric, teacher_id)
+            last_pk = chunk[-1][0]
+            scanned += len(chunk)
+            self.stdout.write(f'Scanned {scanned} enrollments')
+
+        with transaction.atomic():
+            stale = EnrollmentDailyStat.objects.filter(date__lt=cutoff)
+            if start:
+                stale = stale.filter(date__gte=start)
+            stale.delete()
+            EnrollmentDailyStat.objects.bulk_create(
+                [
+                    EnrollmentDailyStat(
+                        date=day, course_id=course_id, batch=batch, enrollment_year=year,
+                        teacher_id=changes.teachers[day, course_id, batch, year], **counts
+                    )
+                    for (day, course_id, batch, year), counts in changes.counts.items()
+                ],
+                batch_size=1000,
+            )
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Rebuilt {len(changes.counts)} daily rollup rows before {cutoff}'
+        ))
@@ -0,0 +1,69 @@
+"""
+Django management command to benchmark database connection reuse.
+
+Simulates requests against the configured database (including its TLS
+settings) with a new connection per request, persistent connections and
+the in-process pool, and reports per-request latency for each.
+"""
+
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+from django.db.backends.postgresql.base import DatabaseWrapper as PostgresWrapper
+
+from core.db.pooled.base import DatabaseWrapper as PooledWrapper
+
+
+class Command(BaseCommand):
+    """Django command to compare per-request connection strategies."""
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--requests',
+            type=int,
+            default=200,
+            help='Number of simulated requests per strategy'
+        )
+        parser.add_argument(
+            '--database',
+            default='default',
+            help='Database alias to benchmark'
+        )
+
+    def handle(self, *args, **options):
+        settings_dict = connections[options['database']].settings_dict
+        self.stdout.write(
+            f"Benchmarking {settings_dict['HOST']}:{settings_dict['PORT']} "
+            f"(sslmode={settings_dict['OPTIONS'].get('sslmode', 'prefer')}), "
+            f"{options['requests']} requests per strategy"
+        )
+
+        strategies = [
+            ('new connection per request', PostgresWrapper, {'CONN_MAX_AGE': 0}),
+            ('persistent + health checks', PostgresWrapper, {'CONN_MAX_AGE': 600, 'CONN_HEALTH_CHECKS': True}),
+            ('in-process pool', PooledWrapper, {'CONN_MAX_AGE': 0, 'POOL': {'min_size': 1, 'max_size': 1}}),
+        ]
+        for label, wrapper_class, overrides in strategies:
+            wrapper = wrapper_class({**settings_dict, **overrides}, alias=f'bench-{label}')
+            timings = self.simulate(wrapper, options['requests'])
+            self.stdout.write(
+                f'{label:<30} mean {statistics.mean(timings):7.2f}ms  '
+                f'p50 {statistics.median(timings):7.2f}ms  '
+                f'p95 {statistics.quantiles(timings, n=20)[-1]:7.2f}ms'
+            )
+
+    def simulate(self, wrapper, requests):
+        """Run SELECT 1 per request between the request_started/finished hooks."""
+        timings = []
+        for _ in range(requests):
+            start = time.perf_counter()
+            wrapper.close_if_unusable_or_obsolete()
+            with wrapper.cursor() as cursor:
+                cursor.execute('SELECT 1')
+                cursor.fetchone()
+            wrapper.close_if_unusable_or_obsolete()
+            timings.append((time.perf_counter() - start) * 1000)
+        wrapper.close()
+        return timings
@@ -0,0 +1,70 @@
+"""
+Django management command to benchmark response size and render time.
+
+Requests the largest list endpoints over the same rolled-back fixtures as
+``bench_serializers`` and reports, per endpoint, the time to render the
+response data with DRF's stdlib JSONRenderer and with ORJSONRenderer, and
+the bytes on the wire uncompressed, gzipped and brotli compressed.
+"""
+
+import time
+
+from django.conf import settings
+from django.test.utils import override_settings
+from django.utils.text import compress_string
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from core.management.commands import bench_serializers
+from core.models import Course, StudentProfile, User
+from core.renderers import ORJSONRenderer
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+class Command(bench_serializers.Command):
+    """Django command to compare JSON renderers and response compression."""
+
+    def run_benchmarks(self, rows):
+        admin = User.objects.create(email='bench-admin@example.com', name='Admin', role='ADMIN')
+        course = Course.objects.filter(title='Course 0').first()
+        student = StudentProfile.objects.filter(roll_number='BENCH-0').first()
+        client = APIClient()
+        client.force_authenticate(admin)
+
+        endpoints = [
+            '/api/enrollments/',
+            '/api/courses/',
+            f'/api/courses/{course.pk}/enrollments/',
+            f'/api/students/{student.pk}/enrollments/',
+        ]
+
+        self.stdout.write(
+            f"{'endpoint':<64} {'stdlib':>9} {'orjson':>9} {'identity':>12} {'gzip':>11} {'br':>11}"
+        )
+        # Fixtures only exist on the primary, inside this transaction.
+        with override_settings(ALLOWED_HOSTS=['testserver'], DATABASE_REPLICAS=[]):
+            for path in endpoints:
+                response = client.get(path, HTTP_ACCEPT_ENCODING='identity')
+                data = response.data
+
+                stdlib_ms, body = self.timed(lambda: JSONRenderer().render(data))
+                orjson_ms, _ = self.timed(lambda: ORJSONRenderer().render(data))
+                gzipped = len(compress_string(body))
+                brotlied = (
+                    len(brotli.compress(body, quality=settings.COMPRESSION_BROTLI_QUALITY))
+                    if brotli else 0
+                )
+                self.stdout.write(
+                    f'{path:<64} {stdlib_ms:7.1f}ms {orjson_ms:7.1f}ms '
+                    f'{len(body):>12,} {gzipped:>11,} {brotlied:>11,}'
+                )
+
+    @staticmethod
+    def timed(func):
+        start = time.perf_counter()
+        result = func()
+        return (time.perf_counter() - start) * 1000, result
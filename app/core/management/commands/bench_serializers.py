@@ -0,0 +1,119 @@
+"""
+Django management command to benchmark enrollment list rendering.
+
+Compares the DRF serializer path against the values() projection path
+for the same rows. Fixture rows are created inside a transaction that is
+rolled back at the end.
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+from core.models import User, TeacherProfile, StudentProfile, Course, Enrollment
+from core.renderers import ORJSONRenderer
+from enrollment.serializers import EnrollmentSerializer
+from enrollment.projections import EnrollmentProjection
+from student.serializers import StudentEnrollmentsSerializer
+from student.projections import StudentEnrollmentsProjection
+
+
+class Rollback(Exception):
+    """Raised to discard the benchmark fixtures."""
+
+
+class Command(BaseCommand):
+    """Django command to compare serializer and projection throughput."""
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rows',
+            type=int,
+            default=100000,
+            help='Number of enrollments to render'
+        )
+        parser.add_argument(
+            '--courses',
+            type=int,
+            default=100,
+            help='Number of courses the enrollments are spread over'
+        )
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                self.create_fixtures(options['rows'], options['courses'])
+                self.run_benchmarks(options['rows'])
+                raise Rollback
+        except Rollback:
+            pass
+
+    def create_fixtures(self, rows, course_count):
+        """Bulk create teachers, courses, students and enrollments."""
+        self.stdout.write(f'Creating {rows} enrollments over {course_count} courses...')
+        students_needed = max(1, -(-rows // course_count))
+
+        teacher_users = User.objects.bulk_create([
+            User(email=f'bench-teacher-{i}@example.com', name=f'Teacher {i}', role='TEACHER')
+            for i in range(course_count)
+        ])
+        teachers = TeacherProfile.objects.bulk_create([
+            TeacherProfile(user=user) for user in teacher_users
+        ])
+        courses = Course.objects.bulk_create([
+            Course(
+                title=f'Course {i}',
+                description='Lorem ipsum dolor sit amet. ' * 20,
+                duration_weeks=12,
+                schedule='Mon/Wed 10:00-11:30',
+                teacher=teachers[i],
+            )
+            for i in range(course_count)
+        ])
+        student_users = User.objects.bulk_create([
+            User(email=f'bench-student-{i}@example.com', name=f'Student {i}', role='STUDENT')
+            for i in range(students_needed)
+        ])
+        students = StudentProfile.objects.bulk_create([
+            StudentProfile(user=user, roll_number=f'BENCH-{i}', batch='2024', enrollment_year=2024)
+            for i, user in enumerate(student_users)
+        ])
+
+        enrollments = []
+        for i in range(rows):
+            enrollments.append(Enrollment(
+                student=students[i // course_count],
+                course=courses[i % course_count],
+            ))
+        Enrollment.objects.bulk_create(enrollments, batch_size=5000)
+
+    def run_benchmarks(self, rows):
+        """Time both render paths and report rows per second."""
+        queryset = Enrollment.objects.filter(student__roll_number__startswith='BENCH-')
+
+        self.report('EnrollmentSerializer + JSONRenderer', rows, lambda: JSONRenderer().render(
+            EnrollmentSerializer(
+                queryset.select_related('student__user', 'course'), many=True
+            ).data
+        ))
+        self.report('EnrollmentProjection + ORJSONRenderer', rows, lambda: ORJSONRenderer().render(
+            EnrollmentProjection(queryset).data
+        ))
+        self.report('StudentEnrollmentsSerializer + JSONRenderer', rows, lambda: JSONRenderer().render(
+            StudentEnrollmentsSerializer(
+                queryset.select_related('course__teacher__user'), many=True
+            ).data
+        ))
+        self.report('StudentEnrollmentsProjection + ORJSONRenderer', rows, lambda: ORJSONRenderer().render(
+            StudentEnrollmentsProjection(queryset).data
+        ))
+
+    def report(self, label, rows, render):
+        start = time.perf_counter()
+        body = render()
+        elapsed = time.perf_counter() - start
+        self.stdout.write(
+            f'{label:<48} {elapsed:8.3f}s {rows / elapsed:12,.0f} rows/s {len(body):>12,} bytes'
+        )
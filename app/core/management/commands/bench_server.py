@@ -0,0 +1,149 @@
+"""
+Django management command to compare request throughput of runserver and
+the gunicorn WSGI/ASGI serving modes.
+
+Each server is started on a free local port, loaded with concurrent
+requests against ``--path`` and shut down again.
+"""
+
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+class Command(BaseCommand):
+    """Django command to benchmark the serving modes."""
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--path',
+            default='/api/docs/',
+            help='Path to request, e.g. /api/courses/'
+        )
+        parser.add_argument(
+            '--header',
+            action='append',
+            default=[],
+            help='Extra request header, e.g. "Authorization: Bearer <token>"'
+        )
+        parser.add_argument(
+            '--requests',
+            type=int,
+            default=2000,
+            help='Number of requests per server'
+        )
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=16,
+            help='Number of concurrent clients'
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=4,
+            help='Gunicorn worker processes'
+        )
+
+    def handle(self, *args, **options):
+        headers = dict(
+            [part.strip() for part in header.split(':', 1)]
+            for header in options['header']
+        )
+        gunicorn = [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py']
+        servers = [
+            ('runserver', [sys.executable, 'manage.py', 'runserver', '--noreload', '--nothreading'], {}),
+            ('runserver (threaded)', [sys.executable, 'manage.py', 'runserver', '--noreload'], {}),
+            ('gunicorn wsgi', gunicorn, {'SERVER_MODE': 'wsgi'}),
+            ('gunicorn asgi', gunicorn, {'SERVER_MODE': 'asgi'}),
+        ]
+
+        self.stdout.write(
+            f"GET {options['path']}, {options['requests']} requests, "
+            f"concurrency {options['concurrency']}, {options['workers']} gunicorn workers"
+        )
+        for label, command, extra_env in servers:
+            port = free_port()
+            env = {
+                **os.environ,
+                **extra_env,
+                'PORT': str(port),
+                'WEB_CONCURRENCY': str(options['workers']),
+                'GUNICORN_LOG_LEVEL': 'warning',
+                'DJANGO_SETTINGS_MODULE': os.environ.get('DJANGO_SETTINGS_MODULE', 'app.settings'),
+            }
+            if command[1] == 'manage.py':
+                command = [*command, f'127.0.0.1:{port}']
+            else:
+                # Access logs would dominate the measurement.
+                command = [*command, '--access-logfile', '/dev/null']
+
+            process = subprocess.Popen(
+                command, cwd=settings.BASE_DIR, env=env,
+                stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+            )
+            try:
+                url = f"http://127.0.0.1:{port}{options['path']}"
+                self.wait_until_up(url, headers, process)
+                elapsed, timings, errors = self.load(url, headers, options['requests'], options['concurrency'])
+            finally:
+                process.terminate()
+                process.wait(timeout=30)
+
+            self.stdout.write(
+                f'{label:<22} {len(timings) / elapsed:8.1f} req/s  '
+                f'p50 {statistics.median(timings):7.2f}ms  '
+                f'p95 {statistics.quantiles(timings, n=20)[-1]:7.2f}ms  '
+                f'errors {errors}'
+            )
+
+    def wait_until_up(self, url, headers, process, timeout=30):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if process.poll() is not None:
+                raise CommandError(f'Server exited: {process.stderr.read().decode()[-2000:]}')
+            try:
+                self.fetch(url, headers)
+                return
+            except (urllib.error.URLError, ConnectionError):
+                time.sleep(0.2)
+        raise CommandError(f'Server at {url} did not start within {timeout} seconds')
+
+    def load(self, url, headers, requests, concurrency):
+        def timed(_):
+            start = time.perf_counter()
+            try:
+                self.fetch(url, headers)
+                ok = True
+            except (urllib.error.URLError, ConnectionError):
+                ok = False
+            return (time.perf_counter() - start) * 1000, ok
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(concurrency) as executor:
+            results = list(executor.map(timed, range(requests)))
+        elapsed = time.perf_counter() - start
+
+        timings = [timing for timing, ok in results if ok]
+        return elapsed, timings, requests - len(timings)
+
+    @staticmethod
+    def fetch(url, headers):
+        request = urllib.request.Request(url, headers=headers)
+        with urllib.request.urlopen(request, timeout=30) as response:
+            response.read()
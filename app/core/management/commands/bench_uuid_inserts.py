@@ -0,0 +1,119 @@
+"""
+Django management command to benchmark uuid4 against uuid7 primary keys.
+
+Inserts the same number of rows into two scratch tables keyed by a UUID
+primary key, one with random (version 4) ids and one with time-ordered
+(version 7) ids, in multi-row INSERT batches like a busy enrollment or
+notification table. Reports insert throughput as the tables grow and the
+final size of each primary key index. The tables are dropped afterwards.
+"""
+
+import time
+import uuid
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, models, transaction
+
+from core.ids import uuid7
+
+GENERATORS = {'uuid4': uuid.uuid4, 'uuid7': uuid7}
+
+
+class Command(BaseCommand):
+    """Django command to compare insert speed and index size of uuid4 and uuid7 keys."""
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rows',
+            type=int,
+            default=10_000_000,
+            help='Rows to insert into each table'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Rows per INSERT statement'
+        )
+        parser.add_argument(
+            '--reports',
+            type=int,
+            default=10,
+            help='Progress lines per table'
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor not in ('postgresql', 'sqlite'):
+            raise CommandError('Index sizes can only be measured on PostgreSQL or SQLite')
+
+        field = models.UUIDField()
+        results = {}
+        for name, generate in GENERATORS.items():
+            table = f'bench_{name}_ids'
+            self.stdout.write(f'Inserting {options["rows"]:,} {name} rows...')
+            with connection.cursor() as cursor:
+                cursor.execute(f'DROP TABLE IF EXISTS {table}')
+                cursor.execute(
+                    f'CREATE TABLE {table} (id {field.db_type(connection)} PRIMARY KEY, '
+                    f'created_at {models.DateTimeField().db_type(connection)} NOT NULL)'
+                )
+            try:
+                elapsed = self.fill(table, generate, field, options)
+                results[name] = (elapsed, self.index_size(table))
+            finally:
+                with connection.cursor() as cursor:
+                    cursor.execute(f'DROP TABLE {table}')
+
+        self.stdout.write(f"\n{'key':<6} {'seconds':>9} {'rows/s':>10} {'pk index':>12}")
+        for name, (elapsed, size) in results.items():
+            self.stdout.write(
+                f'{name:<6} {elapsed:9.1f} {options["rows"] / elapsed:10,.0f} {size / 2 ** 20:10.1f}MB'
+            )
+
+    def fill(self, table, generate, field, options):
+        """Insert the rows in batches, reporting progress; return the seconds spent."""
+        rows, batch_size = options['rows'], options['batch_size']
+        report_every = max(batch_size, rows // max(options['reports'], 1))
+        sql = self.insert_sql(table, batch_size)
+
+        start = segment_start = time.perf_counter()
+        inserted = segment_rows = 0
+        with connection.cursor() as cursor:
+            while inserted < rows:
+                count = min(batch_size, rows - inserted)
+                ids = [field.get_db_prep_value(generate(), connection) for _ in range(count)]
+                with transaction.atomic():
+                    cursor.execute(sql if count == batch_size else self.insert_sql(table, count), ids)
+                inserted += count
+                segment_rows += count
+
+                if segment_rows >= report_every or inserted == rows:
+                    now = time.perf_counter()
+                    self.stdout.write(
+                        f'  {inserted:>12,} rows  {segment_rows / (now - segment_start):10,.0f} rows/s  '
+                        f'index {self.index_size(table) / 2 ** 20:8.1f}MB'
+                    )
+                    segment_start, segment_rows = now, 0
+        return time.perf_counter() - start
+
+    @staticmethod
+    def insert_sql(table, count):
+        values = ', '.join(['(%s, CURRENT_TIMESTAMP)'] * count)
+        return f'INSERT INTO {table} (id, created_at) VALUES {values}'
+
+    def index_size(self, table):
+        """Return the size in bytes of ``table``'s primary key index."""
+        with connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                cursor.execute(
+                    'SELECT pg_relation_size(indexrelid) FROM pg_index '
+                    'WHERE indrelid = %s::regclass AND indisprimary',
+                    [table]
+                )
+            else:
+                cursor.execute(
+                    'SELECT SUM(pgsize) FROM dbstat WHERE name IN '
+                    "(SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = %s)",
+                    [table]
+                )
+            return cursor.fetchone()[0] or 0
@@ -0,0 +1,66 @@
+"""
+Django management command to write the OpenAPI schema to a file.
+
+Run at deploy time and serve the result with ``API_SCHEMA_FILE``; CI runs
+it with ``--check`` to make sure the committed schema matches the code.
+"""
+
+import difflib
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import override_settings
+from drf_spectacular.renderers import OpenApiJsonRenderer, OpenApiYamlRenderer
+from drf_spectacular.settings import spectacular_settings
+
+
+class Command(BaseCommand):
+    """Django command to generate or verify the stored OpenAPI schema."""
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--file',
+            default=settings.API_SCHEMA_FILE or 'schema.yml',
+            help='Schema file; .json is written as JSON, anything else as YAML'
+        )
+        parser.add_argument(
+            '--check',
+            action='store_true',
+            help='Fail if the file differs from the generated schema instead of writing it'
+        )
+
+    def handle(self, *args, **options):
+        path = Path(options['file'])
+        if not path.is_absolute():
+            path = settings.BASE_DIR / path
+
+        output = self.generate(json=path.suffix == '.json')
+
+        if options['check']:
+            stored = path.read_bytes() if path.exists() else b''
+            if stored != output:
+                diff = difflib.unified_diff(
+                    stored.decode().splitlines(), output.decode().splitlines(),
+                    fromfile=f'{path.name} (stored)', tofile=f'{path.name} (generated)', lineterm='',
+                )
+                self.stdout.write('\n'.join(list(diff)[:200]))
+                raise CommandError(
+                    f'{path} is out of date; run `python manage.py build_schema --file {options["file"]}`'
+                )
+            self.stdout.write(self.style.SUCCESS(f'{path} is up to date'))
+            return
+
+        path.write_bytes(output)
+        self.stdout.write(self.style.SUCCESS(f'Wrote {path} ({len(output)} bytes)'))
+
+    def generate(self, json=False):
+        """Return the rendered schema for the current code."""
+        # Workers serving API_SCHEMA_FILE run without AutoSchema; generation needs it.
+        rest_framework = {**settings.REST_FRAMEWORK, 'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema'}
+        with override_settings(REST_FRAMEWORK=rest_framework):
+            generator = spectacular_settings.DEFAULT_GENERATOR_CLASS()
+            schema = generator.get_schema(request=None, public=True)
+
+        renderer = OpenApiJsonRenderer() if json else OpenApiYamlRenderer()
+        return renderer.render(schema, renderer_context={})
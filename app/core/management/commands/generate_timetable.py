@@ -0,0 +1,212 @@
+"""
+Django management command to generate a conflict-free course timetable.
+
+Places the weekly sessions of every course into the given days, start
+times and rooms so that no teacher or room is double-booked, while keeping
+the number of students with two courses at once as low as possible. Courses
+keep their number of sessions (``--sessions`` for courses without any), and
+with ``--assign-teachers`` courses without a teacher go to the teacher with
+the fewest courses. Nothing is written without ``--apply``, which refuses
+timetables that leave courses unplaced.
+"""
+
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from core.models import Course, CourseSession, Enrollment, TeacherProfile
+from core.timetable import TimeSlot, TimetableSolver
+
+
+class Command(BaseCommand):
+    """Django command to assign course sessions to time slots and rooms."""
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            default='0,1,2,3,4',
+            help='Comma-separated weekdays to schedule on (0 = Monday)'
+        )
+        parser.add_argument(
+            '--times',
+            default='09:00,10:30,12:00,13:30,15:00,16:30',
+            help='Comma-separated session start times'
+        )
+        parser.add_argument(
+            '--slot-minutes',
+            type=int,
+            default=90,
+            help='Length of each session'
+        )
+        parser.add_argument(
+            '--rooms',
+            help='Comma-separated room names (default: the rooms of existing sessions)'
+        )
+        parser.add_argument(
+            '--sessions',
+            type=int,
+            default=2,
+            help='Sessions per week for courses that have none yet'
+        )
+        parser.add_argument(
+            '--assign-teachers',
+            action='store_true',
+            help='Assign courses without a teacher to the least loaded teacher'
+        )
+        parser.add_argument(
+            '--time-limit',
+            type=float,
+            default=50,
+            help='Seconds to spend improving the timetable'
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=0,
+            help='Random seed for reproducible timetables'
+        )
+        parser.add_argument(
+            '--apply',
+            action='store_true',
+            help='Replace the course sessions and schedules with the result'
+        )
+
+    def handle(self, *args, **options):
+        slots = self.get_slots(options['days'], options['times'], options['slot_minutes'])
+        rooms = self.get_rooms(options['rooms'])
+
+        courses = list(Course.objects.order_by('created_at').values_list('id', 'teacher_id'))
+        session_counts = Counter(CourseSession.objects.values_list('course_id', flat=True))
+        teachers = {}
+        if options['assign_teachers']:
+            teachers = self.assign_teachers(courses)
+
+        solver = TimetableSolver(
+            [
+                (course_id, teacher_id or teachers.get(course_id), session_counts[course_id] or options['sessions'])
+                for course_id, teacher_id in courses
+            ],
+            slots,
+            rooms,
+            Enrollment.objects.filter(status='ACTIVE').values_list('student_id', 'course_id').iterator(chunk_size=5000),
+            seed=options['seed'],
+        )
+        started = timezone.now()
+        placements = solver.solve(options['time_limit'])
+        elapsed = (timezone.now() - started).total_seconds()
+
+        self.stdout.write(
+            f'Placed {len(placements)} sessions of {len(courses)} courses in {len(slots)} slots '
+            f'and {len(rooms)} rooms in {elapsed:.1f}s'
+        )
+        self.stdout.write(f'Student clashes: {solver.student_clashes()}')
+        if teachers:
+            self.stdout.write(f'Teachers assigned: {len(teachers)}')
+        if solver.unplaced:
+            self.stdout.write(self.style.WARNING(
+                f'{len(solver.unplaced)} courses could not be fully placed; add rooms or time slots'
+            ))
+
+        if options['apply']:
+            if solver.unplaced:
+                # Their old sessions were not part of the search, so keeping
+                # them (or only some new ones) could double-book rooms and teachers.
+                raise CommandError('Not applied, since not every course could be placed')
+            self.apply(placements, teachers)
+            self.stdout.write(self.style.SUCCESS('Timetable applied'))
+        else:
+            self.stdout.write('Dry run; pass --apply to save the timetable')
+
+    def get_slots(self, days, times, minutes):
+        """Return every (day, start time) combination as a TimeSlot."""
+        try:
+            weekdays = [int(day) for day in days.split(',')]
+            starts = [datetime.strptime(start.strip(), '%H:%M') for start in times.split(',')]
+        except ValueError as e:
+            raise CommandError(f'Invalid --days or --times: {e}')
+        if not all(0 <= day <= 6 for day in weekdays):
+            raise CommandError('--days must be between 0 (Monday) and 6 (Sunday)')
+
+        starts.sort()
+        for previous, start in zip(starts, starts[1:]):
+            if start < previous + timedelta(minutes=minutes):
+                raise CommandError('Start times must be at least --slot-minutes apart')
+        return [
+            TimeSlot(day, start.time(), (start + timedelta(minutes=minutes)).time())
+            for day in weekdays
+            for start in starts
+        ]
+
+    def get_rooms(self, rooms):
+        """Return the room names to schedule into."""
+        if rooms:
+            return [room.strip() for room in rooms.split(',') if room.strip()]
+        rooms = list(
+            CourseSession.objects.exclude(room='').order_by('room').values_list('room', flat=True).distinct()
+        )
+        if not rooms:
+            raise CommandError('No rooms found in existing sessions; pass --rooms')
+        return rooms
+
+    def assign_teachers(self, courses):
+        """Return ``{course_id: teacher_id}`` for courses without a teacher, balancing course load."""
+        load = {teacher_id: 0 for teacher_id in TeacherProfile.objects.values_list('user_id', flat=True)}
+        if not load:
+            return {}
+        for _, teacher_id in courses:
+            if teacher_id is not None:
+                load[teacher_id] += 1
+
+        assigned = {}
+        for course_id, teacher_id in courses:
+            if teacher_id is None:
+                teacher_id = min(load, key=load.get)
+                load[teacher_id] += 1
+                assigned[course_id] = teacher_id
+        return assigned
+
+    @transaction.atomic
+    def apply(self, placements, teachers):
+        """Replace the sessions and schedule text of the placed courses."""
+        sessions = defaultdict(list)
+        for placement in placements:
+            sessions[placement.course_id].append(placement)
+
+        CourseSession.objects.filter(course_id__in=sessions).delete()
+        CourseSession.objects.bulk_create(
+            [
+                CourseSession(
+                    course_id=course_id,
+                    weekday=placement.slot.weekday,
+                    start_time=placement.slot.start_time,
+                    end_time=placement.slot.end_time,
+                    room=placement.room,
+                )
+                for course_id, course_placements in sessions.items()
+                for placement in course_placements
+            ],
+            batch_size=1000,
+        )
+
+        weekdays = dict(CourseSession.WEEKDAY_CHOICES)
+        courses = Course.objects.in_bulk(list(sessions))
+        for course_id, course_placements in sessions.items():
+            courses[course_id].schedule = ', '.join(
+                f'{weekdays[p.slot.weekday][:3]} {p.slot.start_time:%H:%M}-{p.slot.end_time:%H:%M} ({p.room})'
+                for p in sorted(course_placements, key=lambda p: p.slot)
+            )[:500]
+            courses[course_id].updated_at = timezone.now()
+
+        # Saved one by one so the new teachers are notified of their courses.
+        for course_id, teacher_id in teachers.items():
+            course = courses.get(course_id) or Course.objects.get(pk=course_id)
+            course.teacher_id = teacher_id
+            course.save()
+        Course.objects.bulk_update(
+            [course for course_id, course in courses.items() if course_id not in teachers],
+            ['schedule', 'updated_at'],
+            batch_size=1000,
+        )
@@ -0,0 +1,73 @@
+"""
+Django management command to maintain the monthly Notification partitions.
+
+Run it daily from cron. It creates the partitions for the coming months
+ahead of time, so inserts never land in the default partition, and detaches
+and drops whole months older than the retention period. On databases other
+than PostgreSQL, where the table is not partitioned, it deletes the expired
+rows instead.
+"""
+
+from datetime import datetime, timezone as dt_timezone
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.utils import timezone
+
+from core.db.partitions import (
+    DEFAULT_SUFFIX, add_months, drop_partitions, ensure_partitions, month_start
+)
+from core.models import Notification
+
+
+class Command(BaseCommand):
+    """Django command to create upcoming and drop expired Notification partitions."""
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--months-ahead',
+            type=int,
+            default=3,
+            help='Create partitions for this many months after the current one'
+        )
+        parser.add_argument(
+            '--retention-months',
+            type=int,
+            default=settings.NOTIFICATION_RETENTION_MONTHS,
+            help='Keep notifications for this many whole months before the current one'
+        )
+
+    def handle(self, *args, **options):
+        current = month_start(timezone.now())
+        cutoff = add_months(current, -options['retention_months'])
+        cutoff_at = datetime(cutoff.year, cutoff.month, 1, tzinfo=dt_timezone.utc)
+        table = Notification._meta.db_table
+
+        if connection.vendor != 'postgresql':
+            deleted, _ = Notification.objects.filter(sent_at__lt=cutoff_at).delete()
+            self.stdout.write(self.style.SUCCESS(
+                f'Deleted {deleted} notifications sent before {cutoff:%Y-%m-%d}'
+            ))
+            return
+
+        created = ensure_partitions(
+            connection, table, 'sent_at', current, add_months(current, options['months_ahead'])
+        )
+        dropped = drop_partitions(connection, table, cutoff)
+        # Rows outside every monthly partition are pruned individually.
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'DELETE FROM {connection.ops.quote_name(table + DEFAULT_SUFFIX)} WHERE sent_at < %s',
+                [cutoff_at]
+            )
+            stray = cursor.rowcount
+
+        for name in created:
+            self.stdout.write(f'Created {name}')
+        for name in dropped:
+            self.stdout.write(f'Dropped {name}')
+        self.stdout.write(self.style.SUCCESS(
+            f'Created {len(created)} and dropped {len(dropped)} partitions; '
+            f'deleted {stray} stray notifications sent before {cutoff:%Y-%m-%d}'
+        ))
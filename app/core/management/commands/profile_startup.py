@@ -0,0 +1,94 @@
+"""
+Django management command to profile worker start-up.
+
+Boots a fresh interpreter under ``python -X importtime`` the way a worker
+does (``django.setup()``, URLconf, WSGI handler with middleware) and
+reports the time spent in each phase and the slowest imports.
+"""
+
+import json
+import os
+import re
+import subprocess
+import sys
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+BOOT_SCRIPT = """
+import json, time
+start = time.perf_counter()
+import django
+django.setup()
+setup = time.perf_counter()
+from django.urls import get_resolver
+get_resolver().url_patterns
+urls = time.perf_counter()
+from django.core.wsgi import get_wsgi_application
+get_wsgi_application()
+wsgi = time.perf_counter()
+print(json.dumps({
+    'django.setup()': setup - start,
+    'URLconf': urls - setup,
+    'WSGI handler + middleware': wsgi - urls,
+}))
+"""
+
+IMPORT_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$')
+
+
+class Command(BaseCommand):
+    """Django command to report import time per module at start-up."""
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--limit',
+            type=int,
+            default=25,
+            help='Number of modules to list'
+        )
+        parser.add_argument(
+            '--sort',
+            choices=['self', 'cumulative'],
+            default='cumulative',
+            help='Order modules by their own import time or including their imports'
+        )
+
+    def handle(self, *args, **options):
+        env = {
+            **os.environ,
+            'DJANGO_SETTINGS_MODULE': os.environ.get('DJANGO_SETTINGS_MODULE', 'app.settings'),
+        }
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', BOOT_SCRIPT],
+            cwd=settings.BASE_DIR, env=env, capture_output=True, text=True,
+        )
+        if result.returncode != 0:
+            raise CommandError(f'Start-up failed:\n{result.stderr[-2000:]}')
+
+        phases = json.loads(result.stdout.strip().splitlines()[-1])
+        modules = []
+        for line in result.stderr.splitlines():
+            match = IMPORT_LINE.match(line)
+            if match:
+                own, cumulative, indent, name = match.groups()
+                modules.append((name, int(own) / 1000, int(cumulative) / 1000, len(indent) // 2))
+
+        self.stdout.write(self.style.MIGRATE_HEADING('Phases'))
+        for phase, seconds in phases.items():
+            self.stdout.write(f'  {phase:<30} {seconds * 1000:8.1f}ms')
+        self.stdout.write(f"  {'total':<30} {sum(phases.values()) * 1000:8.1f}ms")
+
+        packages = defaultdict(float)
+        for name, own, _, _ in modules:
+            packages[name.split('.')[0]] += own
+        self.stdout.write(self.style.MIGRATE_HEADING('Import time by top-level package (self)'))
+        for package, ms in sorted(packages.items(), key=lambda item: -item[1])[:options['limit']]:
+            self.stdout.write(f'  {package:<40} {ms:8.1f}ms')
+
+        column = 1 if options['sort'] == 'self' else 2
+        self.stdout.write(self.style.MIGRATE_HEADING(f"Slowest modules ({options['sort']})"))
+        self.stdout.write(f"  {'module':<55} {'self':>9} {'cumulative':>11}")
+        for name, own, cumulative, _ in sorted(modules, key=lambda m: -m[column])[:options['limit']]:
+            self.stdout.write(f'  {name:<55} {own:7.1f}ms {cumulative:9.1f}ms')
@@ -0,0 +1,40 @@
+"""
+Django management command to prune old sync deletion records.
+
+The newest pruned deletion of each resource is recorded, so sync tokens are
+only rejected as expired when deletes after their position are gone.
+"""
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Max
+from django.utils import timezone
+
+from core.models import DeletionLog, DeletionLogPrune
+
+
+class Command(BaseCommand):
+    """Django command to delete DeletionLog rows older than the retention period."""
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=settings.SYNC_LOG_RETENTION_DAYS,
+            help='Keep deletion records for this many days'
+        )
+
+    @transaction.atomic
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options['days'])
+        expired = DeletionLog.objects.filter(deleted_at__lt=cutoff)
+        newest = expired.order_by().values_list('resource').annotate(newest=Max('deleted_at'))
+        for resource, pruned_through in newest:
+            DeletionLogPrune.objects.update_or_create(
+                resource=resource, defaults={'pruned_through': pruned_through}
+            )
+        deleted, _ = expired.delete()
+        self.stdout.write(self.style.SUCCESS(f'Pruned {deleted} deletion records older than {cutoff:%Y-%m-%d}'))
@@ -0,0 +1,47 @@
+"""
+Django management command to run queued background jobs.
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from core.job_queue import autodiscover, claim_job, run_job
+
+
+class Command(BaseCommand):
+    """Django command to process jobs from the database queue."""
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=2.0,
+            help='Seconds to sleep when the queue is empty'
+        )
+        parser.add_argument(
+            '--burst',
+            action='store_true',
+            help='Exit once the queue is empty instead of polling'
+        )
+
+    def handle(self, *args, **options):
+        autodiscover()
+        self.stdout.write('Worker started, waiting for jobs...')
+
+        while True:
+            job = claim_job()
+            if job is None:
+                if options['burst']:
+                    break
+                time.sleep(options['poll_interval'])
+                continue
+
+            self.stdout.write(f'Running job {job.id} ({job.type}), attempt {job.attempts}')
+            job = run_job(job)
+            if job.status == 'SUCCEEDED':
+                self.stdout.write(self.style.SUCCESS(f'Job {job.id} succeeded: {job.result}'))
+            else:
+                self.stderr.write(self.style.ERROR(f'Job {job.id} {job.status.lower()}: {job.error}'))
+
+        self.stdout.write('Queue empty, exiting.')
@@ -0,0 +1,84 @@
+"""
+Django management command to send notification digests.
+
+Run it from cron every few minutes. Each user whose oldest pending
+notification is older than their digest window (an hour or a day) gets one
+email, and one Notification record, covering everything pending for them.
+Each digest is sent and committed on its own: pending rows are locked with
+SKIP LOCKED, so overlapping runs never send a digest twice, and they are
+deleted as soon as that receiver's email has been handed to the mail
+server, so a failure part way through only retries the digests not sent.
+"""
+
+import logging
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Min
+from django.utils import timezone
+
+from core.email_utils import DIGEST_WINDOWS, EmailNotificationService
+from core.models import Notification, PendingNotification
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """Django command to coalesce pending notifications into digest emails."""
+
+    def handle(self, *args, **options):
+        now = timezone.now()
+        oldest = (
+            PendingNotification.objects.order_by()
+            .values_list('receiver_id', 'receiver__digest_frequency')
+            .annotate(oldest=Min('created_at'))
+        )
+        due = [
+            receiver_id for receiver_id, frequency, oldest_at in oldest
+            if oldest_at <= now - DIGEST_WINDOWS.get(frequency, DIGEST_WINDOWS['IMMEDIATE'])
+        ]
+
+        sent = held = 0
+        connection = get_connection(fail_silently=False)
+        with connection:
+            for receiver_id in due:
+                try:
+                    covered = self.send_digest(connection, receiver_id, now)
+                except Exception:
+                    logger.exception('Failed to send notification digest; it will be retried')
+                    continue
+                if covered:
+                    sent += 1
+                    held += covered
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Sent {sent} digests covering {held} notifications'
+        ))
+
+    @transaction.atomic
+    def send_digest(self, connection, receiver_id, now):
+        """Send one receiver's digest and delete the pending rows it covers; return their count."""
+        pending = list(
+            PendingNotification.objects
+            .select_for_update(skip_locked=True, of=('self',))
+            .select_related('receiver')
+            .filter(receiver_id=receiver_id, created_at__lte=now)
+            .order_by('created_at')
+        )
+        if not pending:
+            # Sent by an overlapping run.
+            return 0
+        receiver = pending[0].receiver
+        subject, message, notification_type = EmailNotificationService.digest_notification(receiver, pending)
+        connection.send_messages([EmailMessage(
+            subject=subject,
+            body=message,
+            from_email=settings.DEFAULT_FROM_EMAIL,
+            to=[receiver.email],
+            connection=connection,
+        )])
+        Notification.objects.create(receiver=receiver, message=message, type=notification_type)
+        PendingNotification.objects.filter(id__in=[notification.id for notification in pending]).delete()
+        return len(pending)
@@ -1,15 +1,20 @@
 """
-Django management command to wait for the database to be ready.
+Django management command to wait for the database (and SMTP) to be ready.
+
+Each dependency is checked in its own thread with exponential backoff and
+full jitter. The command exits non-zero if any of them is still down when
+the timeout expires.
 """
 
+import random
 import time
-import socket
-from psycopg2 import OperationalError as Psycopg2Error
+from concurrent.futures import ThreadPoolExecutor
 
-from django.db.utils import OperationalError
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 from django.db import connections
-from django.conf import settings
+
+from core.health import check_database, check_smtp
+
 
 class Command(BaseCommand):
     """Django command to wait for the database to be available."""
@@ -21,64 +26,67 @@ class Command(BaseCommand):
             default=60,
             help='Maximum time to wait for database (seconds)'
         )
+        parser.add_argument(
+            '--initial-delay',
+            type=float,
+            default=0.1,
+            help='First backoff delay, doubled after every failed attempt (seconds)'
+        )
+        parser.add_argument(
+            '--max-delay',
+            type=float,
+            default=5.0,
+            help='Upper bound for a single backoff delay (seconds)'
+        )
+        parser.add_argument(
+            '--skip-smtp',
+            action='store_true',
+            help='Only wait for the database'
+        )
 
     def handle(self, *args, **options):
-        timeout = options['timeout']
-        self.stdout.write('Waiting for database connection...')
-        
-        db_config = settings.DATABASES['default']
-        host = db_config['HOST']
-        port = int(db_config['PORT'])
-        
-        # First check network connectivity
-        start_time = time.time()
-        connected = False
-        
-        while not connected and (time.time() - start_time) < timeout:
-            try:
-                # Test socket connection
-                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.settimeout(5)
-                result = sock.connect_ex((host, port))
-                sock.close()
-                
-                if result == 0:
-                    connected = True
-                    self.stdout.write(f'Network connection to {host}:{port} established')
-                else:
-                    self.stdout.write(f'Network unreachable to {host}:{port}, retrying in 2 seconds...')
-                    time.sleep(2)
-            except Exception as e:
-                self.stdout.write(f'Network error: {e}, retrying in 2 seconds...')
-                time.sleep(2)
+        checks = {'database': self.check_database}
+        if not options['skip_smtp']:
+            checks['smtp'] = check_smtp
+        self.stdout.write(f"Waiting for {', '.join(checks)}...")
+
+        deadline = time.monotonic() + options['timeout']
+        with ThreadPoolExecutor(len(checks)) as executor:
+            futures = {
+                name: executor.submit(self.wait_for, name, check, deadline, options)
+                for name, check in checks.items()
+            }
+            failed = [name for name, future in futures.items() if not future.result()]
 
-        if not connected:
-            self.stderr.write(
-                self.style.ERROR(
-                    f'Failed to establish network connection to {host}:{port} within {timeout} seconds'
-                )
+        if failed:
+            raise CommandError(
+                f"{', '.join(failed)} unavailable after {options['timeout']} seconds"
             )
-            return
+        self.stdout.write(self.style.SUCCESS('Database available!'))
 
-        # Now test database connection
-        db_up = False
-        self.stdout.write('Testing database connection...')
-        
-        while not db_up and (time.time() - start_time) < timeout:
+    def wait_for(self, name, check, deadline, options):
+        """Retry ``check`` until it succeeds or ``deadline`` passes."""
+        attempt = 0
+        while True:
+            attempt += 1
             try:
-                # Test database connection
-                connection = connections['default']
-                connection.cursor()
-                db_up = True
-            except (OperationalError, Psycopg2Error) as e:
-                self.stdout.write(f'Database unavailable: {e}, waiting 2 seconds...')
-                time.sleep(2)
+                latency = check()
+            except Exception as e:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self.stderr.write(self.style.ERROR(f'{name} unavailable: {e}'))
+                    return False
+                delay = random.uniform(0, min(options['max_delay'], options['initial_delay'] * 2 ** attempt))
+                self.stdout.write(f'{name} unavailable ({e}), retrying in {delay:.2f}s...')
+                time.sleep(min(delay, remaining))
+            else:
+                self.stdout.write(f'{name} ready after {attempt} attempt(s) ({latency:.1f}ms)')
+                return True
 
-        if db_up:
-            self.stdout.write(self.style.SUCCESS('Database available!'))
-        else:
-            self.stderr.write(
-                self.style.ERROR(
-                    f'Database connection failed within {timeout} seconds'
-                )
-            )
\ No newline at end of file
+    @staticmethod
+    def check_database():
+        try:
+            return check_database()
+        finally:
+            # Connections are per thread; don't leave this one open.
+            connections.close_all()
@@ -0,0 +1,207 @@
+import secrets
+
+from django.conf import settings
+from django.contrib.auth import SESSION_KEY
+from django.core.cache import cache
+from django.utils.cache import patch_vary_headers
+from django.utils.text import compress_string
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from core.db.replicas import choose_replica, use_database
+from core.health import healthz, readyz
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+
+def qvalue(params):
+    """Return the q-value among an Accept-Encoding entry's parameters (1 if absent, 0 if invalid)."""
+    for param in params:
+        name, _, value = param.partition('=')
+        if name.strip().lower() != 'q':
+            continue
+        try:
+            q = float(value.strip())
+        except ValueError:
+            return 0.0
+        # Also rejects nan and inf.
+        return q if 0.0 <= q <= 1.0 else 0.0
+    return 1.0
+
+
+def negotiate(accept_encoding, encodings):
+    """Return the encoding in ``encodings`` the client accepts with the highest q-value, or None."""
+    weights = {}
+    for part in accept_encoding.split(','):
+        coding, *params = part.split(';')
+        coding = coding.strip().lower()
+        if coding == 'x-gzip':
+            coding = 'gzip'
+        weights[coding] = qvalue(params)
+
+    best = None
+    for encoding in encodings:
+        q = weights.get(encoding, weights.get('*', 0.0))
+        if q > 0 and (best is None or q > best[1]):
+            best = (encoding, q)
+    return best[0] if best else None
+
+
+def compress_brotli(content, *, quality, max_random_bytes=None):
+    """
+    Return ``content`` brotli compressed, padded like Django's ``compress_string``.
+
+    Brotli has no file name field to pad, so the random bytes go into a
+    metadata meta-block, which decoders skip (RFC 7932, section 9.2).
+    """
+    if not max_random_bytes:
+        return brotli.compress(content, quality=quality)
+
+    compressor = brotli.Compressor(quality=quality)
+    # Flushing before any input ends the stream header on a byte boundary,
+    # where whole meta-blocks can be inserted.
+    header = compressor.process(b'') + compressor.flush()
+    padding = secrets.token_bytes(secrets.randbelow(max_random_bytes) + 1)
+    # ISLAST=0, MNIBBLES=0 (metadata), reserved bit, MSKIPBYTES=1, MSKIPLEN-1.
+    metadata = (3 << 1 | 1 << 4 | (len(padding) - 1) << 6).to_bytes(2, 'little')
+    return header + metadata + padding + compressor.process(content) + compressor.finish()
+
+
+class HealthCheckMiddleware:
+    """Answer /healthz and /readyz before host validation and authentication."""
+
+    probes = {
+        '/healthz': healthz,
+        '/readyz': readyz,
+    }
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        probe = self.probes.get(request.path_info.rstrip('/'))
+        if probe is not None and request.method in SAFE_METHODS:
+            return probe(request)
+        return self.get_response(request)
+
+
+class CompressionMiddleware:
+    """
+    Compress responses with brotli or gzip, whichever the client prefers.
+
+    Responses under COMPRESSION_MIN_SIZE bytes are sent as they are; for
+    them compression costs more CPU than it saves on the wire.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.encodings = ('br', 'gzip') if brotli else ('gzip',)
+
+    def __call__(self, request):
+        response = self.get_response(request)
+
+        if response.streaming or response.has_header('Content-Encoding'):
+            return response
+        if len(response.content) < settings.COMPRESSION_MIN_SIZE:
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+        encoding = self.negotiate(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        if encoding is None:
+            return response
+
+        # Random padding mitigates BREACH, as in Django's GZipMiddleware.
+        if encoding == 'br':
+            compressed = compress_brotli(
+                response.content, quality=settings.COMPRESSION_BROTLI_QUALITY, max_random_bytes=100
+            )
+        else:
+            compressed = compress_string(response.content, max_random_bytes=100)
+        if len(compressed) >= len(response.content):
+            return response
+
+        response.content = compressed
+        response['Content-Length'] = str(len(compressed))
+        response['Content-Encoding'] = encoding
+        # The compressed body is no longer byte-for-byte what a strong ETag promised.
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response['ETag'] = 'W/' + etag
+        return response
+
+    def negotiate(self, accept_encoding):
+        """Return the supported encoding with the highest q-value, or None."""
+        return negotiate(accept_encoding, self.encodings)
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Serve safe-method requests from a read replica.
+
+    After a write, the user's reads stay on the primary for
+    REPLICA_STICKY_SECONDS so they see their own changes.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.authenticator = JWTAuthentication()
+
+    def __call__(self, request):
+        user_id = self.get_user_id(request)
+
+        if request.method not in SAFE_METHODS:
+            response = self.get_response(request)
+            if user_id is not None:
+                cache.set(self.pin_key(user_id), True, settings.REPLICA_STICKY_SECONDS)
+            return response
+
+        if user_id is not None and cache.get(self.pin_key(user_id)):
+            alias = None
+        else:
+            alias = choose_replica()
+
+        with use_database(alias):
+            return self.get_response(request)
+
+    def get_user_id(self, request):
+        """Read the user id from the JWT, or else the session, without loading the user."""
+        header = self.authenticator.get_header(request)
+        if header is None:
+            # Django admin users authenticate with a session.
+            session = getattr(request, 'session', None)
+            return session.get(SESSION_KEY) if session is not None else None
+        try:
+            raw_token = self.authenticator.get_raw_token(header)
+            if raw_token is None:
+                return None
+            token = self.authenticator.get_validated_token(raw_token)
+        except (AuthenticationFailed, InvalidToken):
+            return None
+        return token.get(api_settings.USER_ID_CLAIM)
+
+    @staticmethod
+    def pin_key(user_id):
+        return f'replica-pin:{user_id}'
+
+
+class RateLimitHeadersMiddleware:
+    """Expose the quota recorded by core.throttling as X-RateLimit-* headers."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        quota = getattr(request, 'rate_limit', None)
+        if quota is not None:
+            limit, remaining, reset = quota
+            response['X-RateLimit-Limit'] = str(limit)
+            response['X-RateLimit-Remaining'] = str(remaining)
+            response['X-RateLimit-Reset'] = str(reset)
+        return response
@@ -0,0 +1,35 @@
+# Generated by Django 4.2.30 on 2026-10-19 12:39
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_job'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DeletionLog',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('resource', models.CharField(choices=[('courses', 'Course'), ('enrollments', 'Enrollment'), ('students', 'Student Profile'), ('teachers', 'Teacher Profile')], max_length=20)),
+                ('object_id', models.UUIDField()),
+                ('deleted_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='course',
+            index=models.Index(fields=['updated_at', 'id'], name='core_course_updated_at_id'),
+        ),
+        migrations.AddIndex(
+            model_name='enrollment',
+            index=models.Index(fields=['updated_at', 'id'], name='core_enrollment_updated_id'),
+        ),
+        migrations.AddIndex(
+            model_name='deletionlog',
+            index=models.Index(fields=['resource', 'deleted_at', 'object_id'], name='core_deletionlog_feed'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-19 12:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_course_session'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='enrollment',
+            index=models.Index(fields=['-created_at'], name='core_enrollment_created_at'),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['-sent_at'], name='core_notification_sent_at'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 4.2.30 on 2026-10-19 12:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_admin_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EnrollmentDailyStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('course_id', models.UUIDField()),
+                ('teacher_id', models.UUIDField(blank=True, null=True)),
+                ('batch', models.CharField(max_length=50)),
+                ('enrollment_year', models.PositiveIntegerField()),
+                ('enrolled', models.PositiveIntegerField(default=0)),
+                ('dropped', models.PositiveIntegerField(default=0)),
+                ('reactivated', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='enrollmentdailystat',
+            constraint=models.UniqueConstraint(fields=('date', 'course_id', 'batch', 'enrollment_year'), name='core_enrollmentdailystat_key'),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 4.2.30 on 2026-10-19 12:49
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_enrollment_daily_stat'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='digest_frequency',
+            field=models.CharField(choices=[('IMMEDIATE', 'Immediate'), ('HOURLY', 'Hourly'), ('DAILY', 'Daily')], default='IMMEDIATE', max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='notification',
+            name='type',
+            field=models.CharField(choices=[('ENROLLMENT', 'Enrollment'), ('REMOVAL', 'Removal'), ('COURSE_ASSIGNMENT', 'Course Assignment'), ('ACCOUNT_CREATED', 'Account Created'), ('DIGEST', 'Digest')], max_length=30),
+        ),
+        migrations.CreateModel(
+            name='PendingNotification',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('subject', models.CharField(max_length=255)),
+                ('message', models.TextField()),
+                ('type', models.CharField(choices=[('ENROLLMENT', 'Enrollment'), ('REMOVAL', 'Removal'), ('COURSE_ASSIGNMENT', 'Course Assignment'), ('ACCOUNT_CREATED', 'Account Created'), ('DIGEST', 'Digest')], max_length=30)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('receiver', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='pending_notifications', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['receiver', 'created_at'], name='core_pendingnotif_receiver')],
+            },
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 4.2.30 on 2026-10-19 12:51
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_notification_digests'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='job',
+            name='type',
+            field=models.CharField(choices=[('COURSE_DELETE', 'Course Delete'), ('COURSE_ASSIGNMENT', 'Course Assignment'), ('ANNOUNCEMENT_EMAIL', 'Announcement Email')], max_length=50),
+        ),
+        migrations.AlterField(
+            model_name='notification',
+            name='type',
+            field=models.CharField(choices=[('ENROLLMENT', 'Enrollment'), ('REMOVAL', 'Removal'), ('COURSE_ASSIGNMENT', 'Course Assignment'), ('ACCOUNT_CREATED', 'Account Created'), ('DIGEST', 'Digest'), ('ANNOUNCEMENT', 'Announcement')], max_length=30),
+        ),
+        migrations.AlterField(
+            model_name='pendingnotification',
+            name='type',
+            field=models.CharField(choices=[('ENROLLMENT', 'Enrollment'), ('REMOVAL', 'Removal'), ('COURSE_ASSIGNMENT', 'Course Assignment'), ('ACCOUNT_CREATED', 'Account Created'), ('DIGEST', 'Digest'), ('ANNOUNCEMENT', 'Announcement')], max_length=30),
+        ),
+        migrations.CreateModel(
+            name='Announcement',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('title', models.CharField(max_length=255)),
+                ('message', models.TextField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('author', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='announcements', to=settings.AUTH_USER_MODEL)),
+                ('course', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='announcements', to='core.course')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['course', '-created_at'], name='core_announcement_course')],
+            },
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 4.2.30 on 2026-10-19 12:58
+
+from django.db import migrations, models
+from django.utils import timezone
+
+from core.db.partitions import add_months, month_start, partition_table
+
+
+def partition_notifications(apps, schema_editor):
+    """Rebuild core_notification as a table partitioned by month of sent_at."""
+    connection = schema_editor.connection
+    if connection.vendor != 'postgresql':
+        return
+    partition_table(
+        connection, 'core_notification', 'sent_at',
+        last=add_months(month_start(timezone.now()), 3)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0010_uuid7_primary_keys'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['receiver', '-sent_at'], name='core_notification_inbox'),
+        ),
+        # The partitioned table has the same columns and indexes, so there is
+        # nothing to undo when migrating backwards.
+        migrations.RunPython(partition_notifications, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-19 13:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0011_notification_partitions'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DeletionLogPrune',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('resource', models.CharField(choices=[('courses', 'Course'), ('enrollments', 'Enrollment'), ('students', 'Student Profile'), ('teachers', 'Teacher Profile')], max_length=20, unique=True)),
+                ('pruned_through', models.DateTimeField()),
+            ],
+        ),
+    ]
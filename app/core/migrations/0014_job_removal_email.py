@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-19 13:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0013_job_progress'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='job',
+            name='type',
+            field=models.CharField(choices=[('COURSE_DELETE', 'Course Delete'), ('COURSE_ASSIGNMENT', 'Course Assignment'), ('ANNOUNCEMENT_EMAIL', 'Announcement Email'), ('REMOVAL_EMAIL', 'Removal Email')], max_length=50),
+        ),
+    ]
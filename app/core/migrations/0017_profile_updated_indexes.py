@@ -0,0 +1,32 @@
+# Generated by Django 4.2.30 on 2026-10-19 13:35
+
+from django.db import migrations, models
+from django.db.models import F, OuterRef, Subquery
+
+
+def touch_profiles(apps, schema_editor):
+    """Carry user changes made before profiles were touched with them."""
+    User = apps.get_model('core', 'User')
+    user_updated_at = Subquery(User.objects.filter(pk=OuterRef('pk')).values('updated_at'))
+    for model_name in ('StudentProfile', 'TeacherProfile'):
+        model = apps.get_model('core', model_name)
+        model.objects.filter(user__updated_at__gt=F('updated_at')).update(updated_at=user_updated_at)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0016_admin_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(touch_profiles, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='studentprofile',
+            index=models.Index(fields=['updated_at', 'user'], name='core_student_updated_id'),
+        ),
+        migrations.AddIndex(
+            model_name='teacherprofile',
+            index=models.Index(fields=['updated_at', 'user'], name='core_teacher_updated_id'),
+        ),
+    ]
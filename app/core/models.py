@@ -1,7 +1,10 @@
-import uuid
+from django.contrib.postgres.indexes import OpClass
 from django.db import models
+from django.db.models import F, Q
+from django.db.models.functions import Upper
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager, PermissionsMixin
 from django.utils import timezone
+from core.ids import uuid7
 
 
 class UserManager(BaseUserManager):
@@ -35,11 +38,17 @@ class User(AbstractBaseUser, PermissionsMixin):
         ('TEACHER', 'Teacher'),
         ('STUDENT', 'Student'),
     )
+    DIGEST_CHOICES = (
+        ('IMMEDIATE', 'Immediate'),
+        ('HOURLY', 'Hourly'),
+        ('DAILY', 'Daily'),
+    )
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     email = models.EmailField(unique=True)
     name = models.CharField(max_length=255)
     role = models.CharField(max_length=20, choices=ROLE_CHOICES)
+    digest_frequency = models.CharField(max_length=20, choices=DIGEST_CHOICES, default='IMMEDIATE')
     is_active = models.BooleanField(default=True)
     is_staff = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
@@ -50,6 +59,14 @@ class User(AbstractBaseUser, PermissionsMixin):
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = ['name', 'role']
     
+    class Meta:
+        # Admin filters and prefix searches ('^email' is UPPER(email) LIKE 'X%').
+        indexes = [
+            models.Index(fields=['role', 'email'], name='core_user_role'),
+            models.Index(OpClass(Upper('email'), name='text_pattern_ops'), name='core_user_email_prefix'),
+            models.Index(OpClass(Upper('name'), name='text_pattern_ops'), name='core_user_name_prefix'),
+        ]
+    
     def __str__(self):
         return f"Name: {self.name}, Email: {self.email}, Role: {self.role}"
 
@@ -67,6 +84,14 @@ class TeacherProfile(models.Model):
     address = models.TextField(blank=True, null=True)
     qualification = models.CharField(max_length=255, blank=True, null=True)
     experience_years = models.PositiveIntegerField(default=0)
+    # Also touched when the user changes (sync.signals), so the sync feed can
+    # page on it alone.
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        indexes = [
+            models.Index(fields=['updated_at', 'user'], name='core_teacher_updated_id'),
+        ]
     
     def __str__(self):
         return f"Teacher: {self.user.name}"
@@ -86,6 +111,15 @@ class StudentProfile(models.Model):
     enrollment_year = models.PositiveIntegerField()
     phone = models.CharField(max_length=20, blank=True, null=True)
     address = models.TextField(blank=True, null=True)
+    # Also touched when the user changes (sync.signals).
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        indexes = [
+            models.Index(fields=['updated_at', 'user'], name='core_student_updated_id'),
+            # Admin search '=roll_number' is UPPER(roll_number) = 'X'.
+            models.Index(Upper('roll_number'), name='core_student_roll_upper'),
+        ]
     
     def __str__(self):
         return f"Student: {self.user.name} ({self.roll_number})"
@@ -94,7 +128,7 @@ class StudentProfile(models.Model):
 class Course(models.Model):
     """Course model for managing educational courses."""
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     title = models.CharField(max_length=255)
     description = models.TextField()
     duration_weeks = models.PositiveIntegerField()
@@ -109,14 +143,56 @@ class Course(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    class Meta:
+        indexes = [
+            models.Index(fields=['updated_at', 'id'], name='core_course_updated_at_id'),
+            models.Index(OpClass(Upper('title'), name='text_pattern_ops'), name='core_course_title_prefix'),
+        ]
+    
     def __str__(self):
         return self.title
 
 
+class CourseSession(models.Model):
+    """Weekly meeting of a course, used to detect timetable clashes."""
+    
+    WEEKDAY_CHOICES = (
+        (0, 'Monday'),
+        (1, 'Tuesday'),
+        (2, 'Wednesday'),
+        (3, 'Thursday'),
+        (4, 'Friday'),
+        (5, 'Saturday'),
+        (6, 'Sunday'),
+    )
+    
+    course = models.ForeignKey(
+        Course,
+        on_delete=models.CASCADE,
+        related_name='sessions'
+    )
+    weekday = models.PositiveSmallIntegerField(choices=WEEKDAY_CHOICES)
+    start_time = models.TimeField()
+    end_time = models.TimeField()
+    room = models.CharField(max_length=100, blank=True)
+    
+    class Meta:
+        ordering = ['weekday', 'start_time']
+        constraints = [
+            models.CheckConstraint(
+                check=Q(end_time__gt=F('start_time')),
+                name='core_coursesession_ends_after_start'
+            ),
+        ]
+    
+    def __str__(self):
+        return f"{self.course.title}: {self.get_weekday_display()} {self.start_time:%H:%M}-{self.end_time:%H:%M}"
+
+
 class Enrollment(models.Model):
     """Enrollment model for student-course relationships."""
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     STATUS_CHOICES = (
         ('ACTIVE', 'Active'),
         ('DROPPED', 'Dropped'),
@@ -135,19 +211,92 @@ class Enrollment(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    class Meta:
+        indexes = [
+            models.Index(fields=['updated_at', 'id'], name='core_enrollment_updated_id'),
+            models.Index(fields=['-created_at'], name='core_enrollment_created_at'),
+            models.Index(fields=['status', '-created_at'], name='core_enrollment_status'),
+        ]
+    
     def __str__(self):
         return f"{self.student.user.name} - {self.course.title} ({self.status})"
 
 
+class Announcement(models.Model):
+    """
+    Message to every student enrolled in a course.
+    
+    Stored once and joined to students' inboxes through active enrollments
+    when they are read, rather than copied into a Notification per student.
+    """
+    
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
+    course = models.ForeignKey(
+        Course,
+        on_delete=models.CASCADE,
+        related_name='announcements'
+    )
+    author = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='announcements'
+    )
+    title = models.CharField(max_length=255)
+    message = models.TextField()
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        indexes = [
+            models.Index(fields=['course', '-created_at'], name='core_announcement_course'),
+        ]
+    
+    def __str__(self):
+        return f"{self.course.title}: {self.title}"
+
+
+class EnrollmentDailyStat(models.Model):
+    """Enrollment changes per day, course and student cohort, maintained incrementally."""
+    
+    # Plain ids rather than foreign keys, so history outlives deleted courses.
+    date = models.DateField()
+    course_id = models.UUIDField()
+    teacher_id = models.UUIDField(null=True, blank=True)
+    batch = models.CharField(max_length=50)
+    enrollment_year = models.PositiveIntegerField()
+    enrolled = models.PositiveIntegerField(default=0)
+    dropped = models.PositiveIntegerField(default=0)
+    reactivated = models.PositiveIntegerField(default=0)
+    
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['date', 'course_id', 'batch', 'enrollment_year'],
+                name='core_enrollmentdailystat_key'
+            ),
+        ]
+    
+    def __str__(self):
+        return f"{self.date} {self.course_id} {self.batch}/{self.enrollment_year}"
+
+
 class Notification(models.Model):
-    """Notification model for storing email notification logs."""
+    """
+    Notification model for storing email notification logs.
+
+    On PostgreSQL the table is partitioned by month of ``sent_at``
+    (core.db.partitions); run ``partition_notifications`` daily.
+    """
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     TYPE_CHOICES = (
         ('ENROLLMENT', 'Enrollment'),
         ('REMOVAL', 'Removal'),
         ('COURSE_ASSIGNMENT', 'Course Assignment'),
         ('ACCOUNT_CREATED', 'Account Created'),
+        ('DIGEST', 'Digest'),
+        ('ANNOUNCEMENT', 'Announcement'),
     )
     
     receiver = models.ForeignKey(
@@ -159,5 +308,120 @@ class Notification(models.Model):
     type = models.CharField(max_length=30, choices=TYPE_CHOICES)
     sent_at = models.DateTimeField(auto_now_add=True)
     
+    class Meta:
+        indexes = [
+            models.Index(fields=['-sent_at'], name='core_notification_sent_at'),
+            models.Index(fields=['receiver', '-sent_at'], name='core_notification_inbox'),
+            models.Index(fields=['type', '-sent_at'], name='core_notification_type'),
+        ]
+    
     def __str__(self):
         return f"{self.type} notification for {self.receiver.name}"
+
+
+class PendingNotification(models.Model):
+    """Notification held for a user's next digest email."""
+    
+    receiver = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='pending_notifications'
+    )
+    subject = models.CharField(max_length=255)
+    message = models.TextField()
+    type = models.CharField(max_length=30, choices=Notification.TYPE_CHOICES)
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        indexes = [
+            models.Index(fields=['receiver', 'created_at'], name='core_pendingnotif_receiver'),
+        ]
+    
+    def __str__(self):
+        return f"Pending {self.type} notification for {self.receiver_id}"
+
+
+class Job(models.Model):
+    """Background job stored in the database and run by the run_jobs worker."""
+    
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
+    TYPE_CHOICES = (
+        ('COURSE_DELETE', 'Course Delete'),
+        ('COURSE_ASSIGNMENT', 'Course Assignment'),
+        ('ANNOUNCEMENT_EMAIL', 'Announcement Email'),
+        ('REMOVAL_EMAIL', 'Removal Email'),
+    )
+    STATUS_CHOICES = (
+        ('PENDING', 'Pending'),
+        ('RUNNING', 'Running'),
+        ('SUCCEEDED', 'Succeeded'),
+        ('FAILED', 'Failed'),
+    )
+    
+    type = models.CharField(max_length=50, choices=TYPE_CHOICES)
+    payload = models.JSONField(default=dict)
+    result = models.JSONField(default=dict, blank=True)
+    # Checkpoint saved by resumable handlers, so a retry skips finished work.
+    progress = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='PENDING')
+    error = models.TextField(blank=True)
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=3)
+    run_after = models.DateTimeField(default=timezone.now)
+    # Lease of a RUNNING job, renewed by its worker; once it expires the
+    # worker is presumed dead and another one reclaims the job.
+    locked_until = models.DateTimeField(null=True, blank=True)
+    created_by = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='jobs'
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'run_after'], name='core_job_status_run_after'),
+            models.Index(fields=['status', '-created_at'], name='core_job_status_created'),
+            models.Index(fields=['type', '-created_at'], name='core_job_type_created'),
+        ]
+    
+    def __str__(self):
+        return f"{self.type} job ({self.status})"
+
+
+class DeletionLog(models.Model):
+    """Record of a deleted row, so sync clients can learn about deletes."""
+    
+    RESOURCE_CHOICES = (
+        ('courses', 'Course'),
+        ('enrollments', 'Enrollment'),
+        ('students', 'Student Profile'),
+        ('teachers', 'Teacher Profile'),
+    )
+    
+    resource = models.CharField(max_length=20, choices=RESOURCE_CHOICES)
+    object_id = models.UUIDField()
+    deleted_at = models.DateTimeField(default=timezone.now)
+    
+    class Meta:
+        indexes = [
+            models.Index(fields=['resource', 'deleted_at', 'object_id'], name='core_deletionlog_feed'),
+        ]
+    
+    def __str__(self):
+        return f"{self.resource} {self.object_id} deleted at {self.deleted_at}"
+
+
+class DeletionLogPrune(models.Model):
+    """Newest deletion pruned from the DeletionLog of a resource."""
+    
+    resource = models.CharField(max_length=20, choices=DeletionLog.RESOURCE_CHOICES, unique=True)
+    pruned_through = models.DateTimeField()
+    
+    def __str__(self):
+        return f"{self.resource} deletions pruned through {self.pruned_through}"
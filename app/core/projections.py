@@ -0,0 +1,46 @@
+"""
+Read-only projections for large list endpoints.
+
+A projection renders rows straight from ``QuerySet.values_list()`` instead
+of instantiating models and walking DRF fields per row.
+"""
+
+
+class Projection:
+    """
+    Lightweight read-only serializer over ``values_list()`` rows.
+
+    ``fields`` maps output keys to ORM lookups; a nested dict produces a
+    nested object. Key order is preserved in the output.
+    """
+
+    fields = {}
+
+    def __init__(self, queryset):
+        self.queryset = queryset
+
+    @classmethod
+    def _compile(cls, fields, lookups):
+        """Turn ``fields`` into ``(key, index-or-nested-spec)`` pairs."""
+        spec = []
+        for key, source in fields.items():
+            if isinstance(source, dict):
+                spec.append((key, cls._compile(source, lookups)))
+            else:
+                spec.append((key, len(lookups)))
+                lookups.append(source)
+        return spec
+
+    @classmethod
+    def _build(cls, spec, row):
+        return {
+            key: cls._build(index, row) if isinstance(index, list) else row[index]
+            for key, index in spec
+        }
+
+    @property
+    def data(self):
+        lookups = []
+        spec = self._compile(self.fields, lookups)
+        rows = self.queryset.values_list(*lookups).iterator(chunk_size=2000)
+        return [self._build(spec, row) for row in rows]
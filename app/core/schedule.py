@@ -0,0 +1,108 @@
+"""
+Timetable conflict detection for enrollments.
+
+A ``ScheduleIndex`` holds each student's weekly ``CourseSession`` slots in
+per-(student, weekday) lists sorted by start time, so checking a course
+costs a bisect per session instead of a scan of the student's timetable.
+``find_conflicts`` builds the index for a whole batch of enrollments with
+two queries, whatever the batch size, and adds each accepted enrollment to
+it so clashes between new enrollments in the same batch are caught too.
+Enrolling, reactivating one enrollment and reactivating many all check
+through ``describe_conflicts``.
+"""
+
+from bisect import bisect_left, insort
+from collections import defaultdict, namedtuple
+
+from core.models import Course, CourseSession
+
+Slot = namedtuple('Slot', ['start_time', 'end_time', 'weekday', 'course_id'])
+Conflict = namedtuple('Conflict', ['slot', 'other'])
+
+
+class ScheduleIndex:
+    """Weekly slots per student, bucketed by weekday and sorted by start time."""
+
+    def __init__(self):
+        self.buckets = defaultdict(list)
+
+    def add(self, student_id, slot):
+        insort(self.buckets[student_id, slot.weekday], slot)
+
+    def clashes(self, student_id, slot):
+        """Return the slots of other courses that overlap ``slot``."""
+        bucket = self.buckets.get((student_id, slot.weekday), ())
+        # Only slots starting before this one ends can overlap it.
+        end = bisect_left(bucket, (slot.end_time,))
+        return [
+            other for other in bucket[:end]
+            if other.end_time > slot.start_time and other.course_id != slot.course_id
+        ]
+
+
+def format_conflict(conflict, titles):
+    """Describe a conflict for an error message; ``titles`` maps course ids to titles."""
+    slot = conflict.slot
+    return (
+        f"Schedule conflicts with '{titles.get(conflict.other.course_id, conflict.other.course_id)}' on "
+        f"{dict(CourseSession.WEEKDAY_CHOICES)[slot.weekday]} "
+        f"{slot.start_time:%H:%M}-{slot.end_time:%H:%M}"
+    )
+
+
+def find_conflicts(pairs):
+    """
+    Check ``(student_id, course_id)`` enrollments against the students' active courses.
+
+    Returns ``{position in pairs: Conflict}``. Pairs are checked in order, so
+    of two new enrollments that clash with each other the later one is reported.
+    """
+    student_ids = {student_id for student_id, _ in pairs}
+    course_ids = {course_id for _, course_id in pairs}
+
+    index = ScheduleIndex()
+    existing = CourseSession.objects.filter(
+        course__enrollments__student_id__in=student_ids,
+        course__enrollments__status='ACTIVE',
+    ).values_list('course__enrollments__student_id', 'start_time', 'end_time', 'weekday', 'course_id')
+    for student_id, *slot in existing.iterator(chunk_size=2000):
+        index.add(student_id, Slot(*slot))
+
+    slots = defaultdict(list)
+    new_sessions = CourseSession.objects.filter(course_id__in=course_ids).values_list(
+        'start_time', 'end_time', 'weekday', 'course_id'
+    )
+    for slot in new_sessions:
+        slots[slot[3]].append(Slot(*slot))
+
+    conflicts = {}
+    for position, (student_id, course_id) in enumerate(pairs):
+        for slot in slots[course_id]:
+            clashes = index.clashes(student_id, slot)
+            if clashes:
+                conflicts[position] = Conflict(slot, clashes[0])
+                break
+        else:
+            for slot in slots[course_id]:
+                index.add(student_id, slot)
+    return conflicts
+
+
+def describe_conflicts(pairs):
+    """Return a description of each ``(student_id, course_id)`` pair that clashes."""
+    conflicts = find_conflicts(pairs)
+    titles = dict(
+        Course.objects.filter(
+            id__in={conflict.other.course_id for conflict in conflicts.values()}
+        ).values_list('id', 'title')
+    )
+    return [
+        {
+            'index': position,
+            'student_id': pairs[position][0],
+            'course_id': pairs[position][1],
+            'conflicting_course_id': conflict.other.course_id,
+            'error': format_conflict(conflict, titles),
+        }
+        for position, conflict in sorted(conflicts.items())
+    ]
@@ -0,0 +1,80 @@
+"""
+OpenAPI schema serving.
+
+When ``API_SCHEMA_FILE`` is set, ``/api/schema/`` is served from that file
+(generated at deploy time with ``manage.py build_schema``) instead of
+introspecting every serializer on each request. ``lazy_view`` keeps
+drf-spectacular's views out of worker start-up until they are first used.
+"""
+
+import gzip
+import hashlib
+import mimetypes
+from pathlib import Path
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.module_loading import import_string
+from django.views.decorators.http import require_safe
+
+from core.middleware import negotiate
+
+mimetypes.add_type('application/vnd.oai.openapi', '.yaml')
+mimetypes.add_type('application/vnd.oai.openapi', '.yml')
+
+
+def lazy_view(view_path, **initkwargs):
+    """Return a view that imports the class-based view ``view_path`` on its first request."""
+    view = None
+
+    def wrapper(request, *args, **kwargs):
+        nonlocal view
+        if view is None:
+            view = import_string(view_path).as_view(**initkwargs)
+        return view(request, *args, **kwargs)
+
+    # DRF views are CSRF exempt and enforce CSRF in their own authentication.
+    wrapper.csrf_exempt = True
+    return wrapper
+
+
+_schema_cache = {}
+
+
+def load_schema_file(path):
+    """
+    Read the schema file once per process.
+
+    Returns ``(content, gzipped content, content_type, etag)``.
+    """
+    if path not in _schema_cache:
+        content = Path(settings.BASE_DIR, path).read_bytes()
+        content_type, _ = mimetypes.guess_type(path)
+        _schema_cache[path] = (
+            content,
+            gzip.compress(content, mtime=0),
+            content_type or 'application/octet-stream',
+            f'W/"{hashlib.sha256(content).hexdigest()[:32]}"',
+        )
+    return _schema_cache[path]
+
+
+@require_safe
+def schema_file_view(request):
+    """Serve the pre-generated OpenAPI schema from ``API_SCHEMA_FILE``."""
+    content, gzipped, content_type, etag = load_schema_file(settings.API_SCHEMA_FILE)
+
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        if negotiate(request.META.get('HTTP_ACCEPT_ENCODING', ''), ('gzip',)):
+            response = HttpResponse(gzipped, content_type=content_type)
+            response['Content-Encoding'] = 'gzip'
+        else:
+            response = HttpResponse(content, content_type=content_type)
+
+    response['ETag'] = etag
+    patch_vary_headers(response, ('Accept-Encoding',))
+    # Clients revalidate on each use, so a redeploy is picked up immediately.
+    patch_cache_control(response, public=True, no_cache=True)
+    return response
@@ -0,0 +1,171 @@
+from unittest import mock
+
+import brotli
+
+from django.contrib.auth import SESSION_KEY
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from rest_framework_simplejwt.tokens import AccessToken
+
+from core.db import replicas
+from core.db.replicas import ReplicaRouter, healthy_replicas, use_database
+from core.middleware import CompressionMiddleware, ReplicaRoutingMiddleware
+from core.schema import schema_file_view
+from core.models import User
+
+
+@override_settings(COMPRESSION_MIN_SIZE=100)
+class CompressionMiddlewareTests(SimpleTestCase):
+    """Tests for CompressionMiddleware."""
+
+    def setUp(self):
+        self.middleware = CompressionMiddleware(lambda request: HttpResponse('x' * 1000))
+        self.middleware.encodings = ('br', 'gzip')
+
+    def request(self, accept_encoding):
+        return self.middleware(RequestFactory().get('/api/courses/', HTTP_ACCEPT_ENCODING=accept_encoding))
+
+    def test_preferred_encoding(self):
+        self.assertEqual(self.middleware.negotiate('gzip, br'), 'br')
+        self.assertEqual(self.middleware.negotiate('gzip;q=0.9, br;q=0.5'), 'gzip')
+        self.assertEqual(self.middleware.negotiate('x-gzip'), 'gzip')
+        self.assertEqual(self.middleware.negotiate('identity'), None)
+
+    def test_refused_encodings_are_skipped(self):
+        for accept_encoding in ('gzip;q=0', 'gzip; Q=0', 'gzip;q = 0', 'gzip;level=1;q=0', 'gzip;q=0.000', '*;q=0'):
+            with self.subTest(accept_encoding=accept_encoding):
+                self.assertIsNone(self.middleware.negotiate(accept_encoding))
+        self.assertEqual(self.middleware.negotiate('br;q=0, gzip'), 'gzip')
+        self.assertEqual(self.middleware.negotiate('gzip;q=0, *'), 'br')
+
+    def test_invalid_qvalues_are_refused(self):
+        for accept_encoding in ('gzip;q=abc', 'gzip;q=1.5', 'gzip;q=-1', 'gzip;q=nan'):
+            with self.subTest(accept_encoding=accept_encoding):
+                self.assertIsNone(self.middleware.negotiate(accept_encoding))
+
+    def test_refused_gzip_is_sent_uncompressed(self):
+        response = self.request('gzip;q=0')
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertEqual(response.content, b'x' * 1000)
+
+    def test_gzip_response(self):
+        self.middleware.encodings = ('gzip',)
+        response = self.request('gzip')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(response['Vary'], 'Accept-Encoding')
+
+    def test_brotli_response_is_padded(self):
+        sizes = set()
+        for _ in range(10):
+            response = self.request('br')
+            self.assertEqual(response['Content-Encoding'], 'br')
+            self.assertEqual(brotli.decompress(response.content), b'x' * 1000)
+            sizes.add(len(response.content))
+        self.assertGreater(len(sizes), 1)
+
+
+@override_settings(API_SCHEMA_FILE='schema.yml')
+class SchemaFileViewTests(SimpleTestCase):
+    """Tests for schema_file_view."""
+
+    def request(self, accept_encoding):
+        return schema_file_view(RequestFactory().get('/api/schema/', HTTP_ACCEPT_ENCODING=accept_encoding))
+
+    def test_gzip_response(self):
+        response = self.request('gzip, deflate')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+
+    def test_refused_gzip_is_sent_uncompressed(self):
+        for accept_encoding in ('gzip;q=0', 'gzip;q=abc', 'identity'):
+            with self.subTest(accept_encoding=accept_encoding):
+                response = self.request(accept_encoding)
+                self.assertFalse(response.has_header('Content-Encoding'))
+                self.assertTrue(response.content.startswith(b'openapi:'))
+
+
+class ReplicaRouterTests(SimpleTestCase):
+    """Tests for ReplicaRouter."""
+
+    def setUp(self):
+        self.router = ReplicaRouter()
+
+    def test_reads_use_primary_by_default(self):
+        self.assertEqual(self.router.db_for_read(User), DEFAULT_DB_ALIAS)
+
+    def test_reads_use_chosen_replica(self):
+        with use_database('replica_0'):
+            self.assertEqual(self.router.db_for_read(User), 'replica_0')
+        self.assertEqual(self.router.db_for_read(User), DEFAULT_DB_ALIAS)
+
+    def test_writes_and_migrations_use_primary(self):
+        with use_database('replica_0'):
+            self.assertEqual(self.router.db_for_write(User), DEFAULT_DB_ALIAS)
+        self.assertTrue(self.router.allow_migrate(DEFAULT_DB_ALIAS, 'core'))
+        self.assertFalse(self.router.allow_migrate('replica_0', 'core'))
+
+    @override_settings(DATABASE_REPLICAS=['replica_0', 'replica_1'], REPLICA_MAX_LAG=5)
+    def test_lagging_and_unreachable_replicas_are_skipped(self):
+        lags = {'replica_0': 30.0, 'replica_1': 1.0, 'replica_2': None}
+        with mock.patch.dict(replicas._lag_cache, clear=True), \
+                mock.patch.object(replicas, 'measure_lag', side_effect=lags.get):
+            self.assertEqual(healthy_replicas(), ['replica_1'])
+        with override_settings(DATABASE_REPLICAS=['replica_2']), \
+                mock.patch.dict(replicas._lag_cache, clear=True), \
+                mock.patch.object(replicas, 'measure_lag', side_effect=lags.get):
+            self.assertEqual(healthy_replicas(), [])
+
+
+@override_settings(
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+    REPLICA_STICKY_SECONDS=10,
+)
+class ReplicaRoutingMiddlewareTests(TestCase):
+    """Tests for ReplicaRoutingMiddleware."""
+
+    def setUp(self):
+        cache.clear()
+        self.factory = RequestFactory()
+        self.middleware = ReplicaRoutingMiddleware(self.read_alias)
+        self.user = User.objects.create_user(email='reader@example.com', password='pw', name='Reader')
+        self.token = str(AccessToken.for_user(self.user))
+        patcher = mock.patch('core.middleware.choose_replica', return_value='replica_0')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @staticmethod
+    def read_alias(request):
+        """Stand-in view returning the database reads are routed to."""
+        return ReplicaRouter().db_for_read(User)
+
+    def request(self, method, token=None, session_user=None):
+        headers = {'HTTP_AUTHORIZATION': f'Bearer {token}'} if token else {}
+        request = getattr(self.factory, method)('/api/courses/', **headers)
+        request.session = {SESSION_KEY: str(session_user.pk)} if session_user else {}
+        return self.middleware(request)
+
+    def test_anonymous_reads_use_replica(self):
+        self.assertEqual(self.request('get'), 'replica_0')
+
+    def test_writes_use_primary(self):
+        self.assertEqual(self.request('post', token=self.token), DEFAULT_DB_ALIAS)
+
+    def test_reads_after_write_are_pinned_to_primary(self):
+        self.request('post', token=self.token)
+        self.assertEqual(self.request('get', token=self.token), DEFAULT_DB_ALIAS)
+        # Other users are not affected by the pin.
+        self.assertEqual(self.request('get'), 'replica_0')
+
+    def test_pin_expires(self):
+        self.request('post', token=self.token)
+        cache.delete(ReplicaRoutingMiddleware.pin_key(str(self.user.pk)))
+        self.assertEqual(self.request('get', token=self.token), 'replica_0')
+
+    def test_session_users_are_pinned_after_write(self):
+        self.request('post', session_user=self.user)
+        self.assertEqual(self.request('get', session_user=self.user), DEFAULT_DB_ALIAS)
+
+    def test_invalid_token_is_not_pinned(self):
+        self.request('post', token='not-a-token')
+        self.assertEqual(self.request('get', token='not-a-token'), 'replica_0')
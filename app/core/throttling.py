@@ -0,0 +1,134 @@
+"""
+Per-role sliding-window throttles.
+
+Rates are configured per scope and role in ``ROLE_THROTTLE_RATES``:
+
+    ROLE_THROTTLE_RATES = {
+        'default': {'ADMIN': '600/min', 'STUDENT': '120/min', 'anon': '60/min'},
+        'login': {'anon': '10/min'},
+    }
+
+``RoleRateThrottle`` applies the ``default`` scope to every request;
+``ScopedRoleRateThrottle`` adds a separate limit for views that set
+``throttle_scope``. A rate of ``120/min`` allows 120 requests in any
+sliding minute: each client has a counter per fixed minute, and a request
+is allowed while the current minute's count plus the previous minute's,
+weighted by how much of it still falls inside the sliding window, is
+within the limit.
+
+Counters are bumped with ``cache.incr``, which is atomic on the shared
+backends (Redis, memcached), so concurrent requests from one client can
+never both spend the last request without any locking. The default cache
+must be shared by every worker process (the ``core.E001`` deploy check);
+with a per-process cache each worker keeps its own counters and the
+effective limit is multiplied by the worker count. If the cache is
+unavailable requests are let through.
+
+Anonymous clients are keyed by IP address. Set ``NUM_PROXIES`` (the
+``DJANGO_NUM_PROXIES`` environment variable) to the number of reverse
+proxies in front of the app so the address is taken from the right
+``X-Forwarded-For`` entry and cannot be spoofed by the client.
+"""
+
+import logging
+import math
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.throttling import BaseThrottle
+
+logger = logging.getLogger(__name__)
+
+PERIODS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+
+def parse_rate(rate):
+    """Return ``(limit, period in seconds)`` for a rate like ``'120/min'``."""
+    num, period = rate.split('/')
+    return int(num), PERIODS[period[0]]
+
+
+def hit(key, limit, period):
+    """
+    Count a request against the sliding window at ``key``.
+
+    Returns ``(allowed, requests left, seconds until the next is allowed)``.
+    """
+    now = time.time()
+    window = int(now // period)
+    elapsed = now - window * period
+    current_key, previous_key = f'{key}:{window}', f'{key}:{window - 1}'
+
+    # The counter must outlive the next window, which weighs it.
+    cache.add(current_key, 0, timeout=2 * period + 1)
+    try:
+        current = cache.incr(current_key)
+    except ValueError:
+        # Expired between add() and incr().
+        cache.add(current_key, 1, timeout=2 * period + 1)
+        current = 1
+    previous = cache.get(previous_key, 0)
+
+    weight = 1 - elapsed / period
+    used = previous * weight + current
+    if used <= limit:
+        return True, max(limit - math.ceil(used), 0), 0
+
+    # Rejected requests count too, so a client that keeps hammering stays
+    # throttled. Find when the next request would fit: first while this
+    # window's count stays put and the previous one slides out...
+    if current < limit and previous:
+        wait = period * (1 - (limit - current - 1) / previous) - elapsed
+        if wait < period - elapsed:
+            return False, 0, max(wait, 0)
+    # ...otherwise after this window ends and becomes the previous one.
+    return False, 0, period - elapsed + max(period * (1 - (limit - 1) / current), 0)
+
+
+class RoleRateThrottle(BaseThrottle):
+    """Throttle every request with the limit for the user's role."""
+
+    scope = 'default'
+
+    def get_scope(self, view):
+        return self.scope
+
+    def get_role(self, request):
+        return request.user.role if request.user and request.user.is_authenticated else 'anon'
+
+    def allow_request(self, request, view):
+        self.wait_seconds = None
+        scope = self.get_scope(view)
+        role = self.get_role(request)
+        rate = settings.ROLE_THROTTLE_RATES.get(scope, {}).get(role)
+        if rate is None:
+            return True
+
+        limit, period = parse_rate(rate)
+        ident = request.user.pk if role != 'anon' else self.get_ident(request)
+        try:
+            allowed, remaining, self.wait_seconds = hit(f'throttle:{scope}:{role}:{ident}', limit, period)
+        except Exception:
+            logger.warning('Throttle cache unavailable, allowing request', exc_info=True)
+            return True
+
+        self.record_quota(request, limit, remaining, math.ceil(period - time.time() % period))
+        return allowed
+
+    def record_quota(self, request, limit, remaining, reset):
+        """Keep the tightest quota seen for RateLimitHeadersMiddleware."""
+        http_request = request._request
+        quota = getattr(http_request, 'rate_limit', None)
+        if quota is None or remaining < quota[1]:
+            http_request.rate_limit = (limit, int(remaining), reset)
+
+    def wait(self):
+        return self.wait_seconds
+
+
+class ScopedRoleRateThrottle(RoleRateThrottle):
+    """Throttle views that set ``throttle_scope`` with their own limit."""
+
+    def get_scope(self, view):
+        return getattr(view, 'throttle_scope', None)
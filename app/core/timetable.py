@@ -0,0 +1,211 @@
+"""
+Timetable generation.
+
+Courses are the vertices of a conflict graph stored as bitsets (Python ints
+with one bit per course): ``hard[c]`` holds the courses that share c's
+teacher and can never meet at the same time, ``soft[c]`` the courses that
+share students with it, weighted by ``shared[c][d]`` students. Each time
+slot's occupancy is a bitset as well, so whether course c fits in slot t is
+``occupancy[t] & hard[c]`` and its student clashes are a sum over the few
+set bits of ``occupancy[t] & soft[c]``.
+
+Sessions are placed greedily, most constrained courses first, into the
+cheapest feasible slot, then improved by iterated local search: min-conflicts
+moves until a full pass finds nothing better, then a few clashing sessions
+are moved at random and the search repeats, keeping the best timetable seen
+until the time limit runs out.
+"""
+
+import random
+import time
+from collections import defaultdict, namedtuple
+
+TimeSlot = namedtuple('TimeSlot', ['weekday', 'start_time', 'end_time'])
+Placement = namedtuple('Placement', ['course_id', 'slot', 'room'])
+
+# Two sessions of a course on the same day cost this many student clashes.
+SAME_DAY_PENALTY = 0.5
+# Clashing sessions moved at random when the local search is stuck.
+PERTURBATION_SIZE = 10
+
+
+def iter_bits(bits):
+    """Yield the positions of the set bits of ``bits``."""
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+
+class TimetableSolver:
+    """Assign the weekly sessions of courses to time slots and rooms."""
+
+    def __init__(self, courses, slots, rooms, enrollments, seed=0):
+        """
+        ``courses`` is a list of ``(course_id, teacher_id, sessions needed)``,
+        ``slots`` a list of ``TimeSlot`` and ``enrollments`` an iterable of
+        ``(student_id, course_id)`` pairs for active enrollments.
+        """
+        self.course_ids = [course_id for course_id, _, _ in courses]
+        self.needed = [needed for _, _, needed in courses]
+        self.slots = slots
+        self.rooms = rooms
+        self.random = random.Random(seed)
+        position = {course_id: i for i, course_id in enumerate(self.course_ids)}
+
+        by_teacher = defaultdict(int)
+        for i, (_, teacher_id, _) in enumerate(courses):
+            if teacher_id is not None:
+                by_teacher[teacher_id] |= 1 << i
+        self.hard = [
+            by_teacher[teacher_id] & ~(1 << i) if teacher_id is not None else 0
+            for i, (_, teacher_id, _) in enumerate(courses)
+        ]
+
+        by_student = defaultdict(list)
+        for student_id, course_id in enrollments:
+            if course_id in position:
+                by_student[student_id].append(position[course_id])
+        self.shared = [defaultdict(int) for _ in courses]
+        for taken in by_student.values():
+            for a in taken:
+                for b in taken:
+                    if a != b:
+                        self.shared[a][b] += 1
+        self.soft = [sum(1 << j for j in shared) for shared in self.shared]
+
+        self.occupancy = [0] * len(slots)
+        self.room_count = [0] * len(slots)
+        self.course_slots = [[] for _ in courses]
+        self.unplaced = []
+
+    def fits(self, i, t):
+        """Whether course ``i`` can take slot ``t`` without breaking a hard constraint."""
+        occupancy = self.occupancy[t]
+        return (
+            not (occupancy >> i) & 1
+            and not occupancy & self.hard[i]
+            and self.room_count[t] < len(self.rooms)
+        )
+
+    def cost(self, i, t):
+        """Student clashes, plus the same-day penalty, of course ``i`` meeting in slot ``t``."""
+        shared = self.shared[i]
+        cost = sum(shared[j] for j in iter_bits(self.occupancy[t] & self.soft[i]))
+        weekday = self.slots[t].weekday
+        return cost + SAME_DAY_PENALTY * sum(
+            1 for other in self.course_slots[i] if other != t and self.slots[other].weekday == weekday
+        )
+
+    def place(self, i, t):
+        self.occupancy[t] |= 1 << i
+        self.room_count[t] += 1
+        self.course_slots[i].append(t)
+
+    def remove(self, i, t):
+        self.occupancy[t] &= ~(1 << i)
+        self.room_count[t] -= 1
+        self.course_slots[i].remove(t)
+
+    def best_slot(self, i):
+        """Return the cheapest feasible slot for another session of course ``i``, or None."""
+        best, best_cost = None, None
+        for t in self.random.sample(range(len(self.slots)), len(self.slots)):
+            if self.fits(i, t):
+                cost = self.cost(i, t)
+                if best is None or cost < best_cost:
+                    best, best_cost = t, cost
+                    if cost == 0:
+                        break
+        return best
+
+    def solve(self, time_limit=50):
+        """Build the timetable and return its ``Placement`` list."""
+        deadline = time.monotonic() + time_limit
+        # Courses with the most teacher and student conflicts are placed first.
+        order = sorted(
+            range(len(self.course_ids)),
+            key=lambda i: (bin(self.hard[i]).count('1'), sum(self.shared[i].values()), self.needed[i]),
+            reverse=True,
+        )
+        for i in order:
+            for _ in range(self.needed[i]):
+                t = self.best_slot(i)
+                if t is None:
+                    self.unplaced.append(self.course_ids[i])
+                    break
+                self.place(i, t)
+
+        self.improve(order, deadline)
+        best_cost, best = self.total_cost(), self.snapshot()
+        while best_cost and time.monotonic() < deadline:
+            self.perturb()
+            self.improve(order, deadline)
+            cost = self.total_cost()
+            if cost < best_cost:
+                best_cost, best = cost, self.snapshot()
+            else:
+                self.restore(best)
+        return self.placements()
+
+    def snapshot(self):
+        return list(self.occupancy), list(self.room_count), [list(slots) for slots in self.course_slots]
+
+    def restore(self, snapshot):
+        occupancy, room_count, course_slots = snapshot
+        self.occupancy, self.room_count = list(occupancy), list(room_count)
+        self.course_slots = [list(slots) for slots in course_slots]
+
+    def total_cost(self):
+        """Student clashes plus same-day penalties over the whole timetable."""
+        return sum(self.cost(i, t) for i, slots in enumerate(self.course_slots) for t in slots) / 2
+
+    def perturb(self):
+        """Move a few clashing sessions to random feasible slots."""
+        clashing = [
+            (i, t) for i, slots in enumerate(self.course_slots) for t in slots if self.cost(i, t)
+        ]
+        for i, t in self.random.sample(clashing, min(PERTURBATION_SIZE, len(clashing))):
+            if t not in self.course_slots[i]:
+                continue
+            self.remove(i, t)
+            feasible = [u for u in range(len(self.slots)) if u != t and self.fits(i, u)]
+            self.place(i, self.random.choice(feasible) if feasible else t)
+
+    def improve(self, order, deadline):
+        """Move sessions to cheaper slots until no move helps or time runs out."""
+        improved = True
+        while improved and time.monotonic() < deadline:
+            improved = False
+            for i in order:
+                for t in list(self.course_slots[i]):
+                    current = self.cost(i, t)
+                    if current == 0:
+                        continue
+                    self.remove(i, t)
+                    best = self.best_slot(i)
+                    if best is not None and self.cost(i, best) < current:
+                        self.place(i, best)
+                        improved = True
+                    else:
+                        self.place(i, t)
+                if time.monotonic() >= deadline:
+                    break
+
+    def student_clashes(self):
+        """Number of times a student has two courses in the same slot."""
+        total = sum(
+            self.shared[i][j]
+            for i, slots in enumerate(self.course_slots)
+            for t in slots
+            for j in iter_bits(self.occupancy[t] & self.soft[i])
+        )
+        return total // 2
+
+    def placements(self):
+        """Return one ``Placement`` per placed session, with rooms handed out per slot."""
+        placements = []
+        for t, slot in enumerate(self.slots):
+            for room, i in zip(self.rooms, iter_bits(self.occupancy[t])):
+                placements.append(Placement(self.course_ids[i], slot, room))
+        return placements
@@ -1,9 +1,11 @@
+from django.db import transaction
 from rest_framework import serializers
 from drf_spectacular.utils import extend_schema_field
-from core.models import Course, TeacherProfile, Enrollment, StudentProfile
+from core.models import Announcement, Course, CourseSession, TeacherProfile, Enrollment, StudentProfile
+from core.fieldsets import DynamicFieldsMixin
 
 
-class CourseTeacherSerializer(serializers.ModelSerializer):
+class CourseTeacherSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     """Minimal serializer for teacher info in courses."""
     
     name = serializers.CharField(source='user.name', read_only=True)
@@ -14,30 +16,70 @@ class CourseTeacherSerializer(serializers.ModelSerializer):
         fields = ['name', 'email']
 
 
-class CourseSerializer(serializers.ModelSerializer):
+class CourseSessionSerializer(serializers.ModelSerializer):
+    """Serializer for a weekly course session."""
+    
+    class Meta:
+        model = CourseSession
+        fields = ['weekday', 'start_time', 'end_time', 'room']
+    
+    def validate(self, data):
+        """Validate that the session is complete and ends after it starts."""
+        # Sessions replace the existing ones, so a PATCH of the course (whose
+        # partial flag also skips missing nested fields) must still send them whole.
+        missing = [name for name, field in self.fields.items() if field.required and name not in data]
+        if missing:
+            raise serializers.ValidationError({name: 'This field is required.' for name in missing})
+        if data['end_time'] <= data['start_time']:
+            raise serializers.ValidationError("end_time must be after start_time")
+        return data
+
+
+class CourseSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     """Serializer for Course model."""
     
     teacher = CourseTeacherSerializer(read_only=True)
     teacher_id = serializers.UUIDField(write_only=True, required=False, allow_null=True)
+    sessions = CourseSessionSerializer(many=True, required=False)
     enrolled_students_count = serializers.SerializerMethodField()
     
     class Meta:
         model = Course
         fields = [
             'id', 'title', 'description', 'duration_weeks', 
-            'schedule', 'teacher', 'teacher_id', 'enrolled_students_count',
+            'schedule', 'sessions', 'teacher', 'teacher_id', 'enrolled_students_count',
             'created_at', 'updated_at'
         ]
         read_only_fields = ['id', 'created_at', 'updated_at']
     
     @extend_schema_field(serializers.IntegerField)
     def get_enrolled_students_count(self, obj: Course) -> int:
-        """Get count of active enrollments."""
+        """Get count of active enrollments, annotated by the course views."""
+        if hasattr(obj, 'active_enrollment_count'):
+            return obj.active_enrollment_count
         return obj.enrollments.filter(status='ACTIVE').count()
     
+    def validate_sessions(self, sessions):
+        """Validate that a course's own sessions do not overlap."""
+        sessions = sorted(sessions, key=lambda session: (session['weekday'], session['start_time']))
+        for previous, session in zip(sessions, sessions[1:]):
+            if previous['weekday'] == session['weekday'] and session['start_time'] < previous['end_time']:
+                raise serializers.ValidationError("Course sessions must not overlap")
+        return sessions
+    
+    def set_sessions(self, course, sessions):
+        """Replace the course's weekly sessions."""
+        course.sessions.all().delete()
+        CourseSession.objects.bulk_create(
+            CourseSession(course=course, **session) for session in sessions
+        )
+    
+    @transaction.atomic
     def create(self, validated_data):
         teacher_id = validated_data.pop('teacher_id', None)
+        sessions = validated_data.pop('sessions', [])
         course = Course.objects.create(**validated_data)
+        self.set_sessions(course, sessions)
         
         if teacher_id:
             try:
@@ -49,8 +91,10 @@ class CourseSerializer(serializers.ModelSerializer):
         
         return course
     
+    @transaction.atomic
     def update(self, instance, validated_data):
         teacher_id = validated_data.pop('teacher_id', None)
+        sessions = validated_data.pop('sessions', None)
         
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
@@ -66,10 +110,12 @@ class CourseSerializer(serializers.ModelSerializer):
                 instance.teacher = None
         
         instance.save()
+        if sessions is not None:
+            self.set_sessions(instance, sessions)
         return instance
 
 
-class CourseListSerializer(serializers.ModelSerializer):
+class CourseListSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     """Serializer for course list with minimal info."""
     
     teacher_name = serializers.CharField(source='teacher.user.name', read_only=True)
@@ -84,5 +130,25 @@ class CourseListSerializer(serializers.ModelSerializer):
     
     @extend_schema_field(serializers.IntegerField)
     def get_enrolled_students_count(self, obj: Course) -> int:
-        """Get count of active enrollments."""
+        """Get count of active enrollments, annotated by the course views."""
+        if hasattr(obj, 'active_enrollment_count'):
+            return obj.active_enrollment_count
         return obj.enrollments.filter(status='ACTIVE').count()
+
+
+class AnnouncementSerializer(serializers.ModelSerializer):
+    """Serializer for course announcements."""
+    
+    author_name = serializers.CharField(source='author.name', read_only=True, allow_null=True)
+    send_email = serializers.BooleanField(
+        write_only=True, default=False, help_text='Also email the announcement to enrolled students'
+    )
+    
+    class Meta:
+        model = Announcement
+        fields = ['id', 'course', 'author_name', 'title', 'message', 'send_email', 'created_at']
+        read_only_fields = ['id', 'course', 'created_at']
+    
+    def create(self, validated_data):
+        validated_data.pop('send_email', None)
+        return super().create(validated_data)
@@ -0,0 +1,77 @@
+from django.db import transaction
+
+from core.job_queue import register
+from core.models import Announcement, Course, Enrollment, User
+from core.email_utils import EmailNotificationService
+
+
+@register('COURSE_DELETE')
+def delete_course(payload):
+    """Delete a course, removing its enrollments in chunks first."""
+    course_id = payload['course_id']
+    batch_size = payload.get('batch_size', 1000)
+    deleted_enrollments = 0
+
+    while True:
+        ids = list(
+            Enrollment.objects.filter(course_id=course_id)
+            .values_list('id', flat=True)[:batch_size]
+        )
+        if not ids:
+            break
+        deleted, _ = Enrollment.objects.filter(id__in=ids).delete()
+        deleted_enrollments += deleted
+
+    deleted_courses, _ = Course.objects.filter(id=course_id).delete()
+    return {'deleted_enrollments': deleted_enrollments, 'deleted_course': bool(deleted_courses)}
+
+
+@register('COURSE_ASSIGNMENT')
+def send_course_assignment(payload):
+    """Notify the teacher assigned to a course."""
+    try:
+        course = Course.objects.select_related('teacher__user').get(id=payload['course_id'])
+    except Course.DoesNotExist:
+        return {'sent': False}
+
+    if course.teacher is None or str(course.teacher.pk) != payload['teacher_id']:
+        # The teacher changed again before the job ran; a newer job covers it.
+        return {'sent': False}
+
+    EmailNotificationService.send_course_assignment_notification(
+        teacher=course.teacher,
+        course=course
+    )
+    return {'sent': True}
+
+
+@register('ANNOUNCEMENT_EMAIL', resumable=True)
+def send_announcement_email(payload, checkpoint):
+    """Email a course announcement to the course's active students in resumable batches."""
+    try:
+        announcement = Announcement.objects.select_related('course').get(id=payload['announcement_id'])
+    except Announcement.DoesNotExist:
+        return {'sent': 0}
+
+    batch_size = payload.get('batch_size', 500)
+    students = (
+        User.objects.filter(
+            studentprofile__enrollments__course_id=announcement.course_id,
+            studentprofile__enrollments__status='ACTIVE',
+        )
+        .only('id', 'email', 'name', 'digest_frequency')
+        .distinct()
+        .order_by('pk')
+    )
+    sent, last_pk = checkpoint.get('sent', 0), checkpoint.get('last_pk')
+    while True:
+        batch = list((students.filter(pk__gt=last_pk) if last_pk else students)[:batch_size])
+        if not batch:
+            break
+        # Held digest rows and the checkpoint commit together, so a failed
+        # batch is retried whole and earlier batches are never sent again.
+        with transaction.atomic():
+            sent += EmailNotificationService.send_announcement_emails(announcement, batch)
+            last_pk = str(batch[-1].pk)
+            checkpoint.save(last_pk=last_pk, sent=sent)
+    return {'sent': sent}
@@ -1,14 +1,24 @@
-from rest_framework import viewsets, permissions
+from django.db import transaction
+from drf_spectacular.utils import extend_schema
+from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from core.models import Course, TeacherProfile, StudentProfile, Enrollment
+from rest_framework.reverse import reverse
+from core.models import Course, TeacherProfile, StudentProfile, Enrollment, Job
 from core.permissions import IsAdminUser, CanManageCourse
-from .serializers import CourseSerializer, CourseListSerializer
+from core.conditional import (
+    ConditionalGetMixin, course_sources, enrollment_sources, student_sources, with_enrollment_counts
+)
+from core.fieldsets import SparseFieldsetMixin
+from core.job_queue import enqueue
+from .serializers import CourseSerializer, CourseListSerializer, AnnouncementSerializer
+from job.serializers import JobSerializer
 from student.serializers import StudentProfileSerializer
 from enrollment.serializers import EnrollmentSerializer
+from enrollment.projections import EnrollmentProjection
 
 
-class CourseViewSet(viewsets.ModelViewSet):
+class CourseViewSet(ConditionalGetMixin, SparseFieldsetMixin, viewsets.ModelViewSet):
     """ViewSet for Course management."""
     
     queryset = Course.objects.all()
@@ -31,6 +41,13 @@ class CourseViewSet(viewsets.ModelViewSet):
     
     def get_queryset(self):
         """Filter queryset based on user role."""
+        queryset = self.get_role_queryset()
+        if self.action in ('list', 'retrieve'):
+            queryset = with_enrollment_counts(queryset.select_related('teacher__user'))
+        return queryset
+    
+    def get_role_queryset(self):
+        """Return the courses the current user can see."""
         if self.request.user.role == 'ADMIN':
             return Course.objects.all()
         elif self.request.user.role == 'TEACHER':
@@ -51,6 +68,27 @@ class CourseViewSet(viewsets.ModelViewSet):
                 return Course.objects.none()
         return Course.objects.none()
     
+    def destroy(self, request, *args, **kwargs):
+        """Queue course deletion; enrollments are removed in chunks by the worker."""
+        course = self.get_object()
+        with transaction.atomic():
+            # Serializes concurrent deletes of the course, so retries reuse one job.
+            Course.objects.select_for_update().filter(pk=course.pk).exists()
+            job = Job.objects.filter(
+                type='COURSE_DELETE', status__in=['PENDING', 'RUNNING'], payload__course_id=str(course.id)
+            ).first()
+            if job is None:
+                job = enqueue('COURSE_DELETE', {'course_id': str(course.id)}, user=request.user)
+        return Response(
+            JobSerializer(job).data,
+            status=status.HTTP_202_ACCEPTED,
+            headers={'Location': reverse('job:job-detail', args=[job.id], request=request)}
+        )
+    
+    def get_validator_sources(self, queryset):
+        """Courses change with their teacher and active enrollment count."""
+        return course_sources(queryset)
+    
     @action(detail=True, methods=['get'], permission_classes=[permissions.IsAuthenticated])
     def students(self, request, pk=None):
         """Get students enrolled in this course."""
@@ -73,8 +111,11 @@ class CourseViewSet(viewsets.ModelViewSet):
         
         enrollments = Enrollment.objects.filter(course=course, status='ACTIVE')
         students = StudentProfile.objects.filter(enrollments__in=enrollments).distinct()
-        serializer = StudentProfileSerializer(students, many=True)
-        return Response(serializer.data)
+        return self.conditional_response(
+            request,
+            [(enrollments, 'updated_at')] + student_sources(students),
+            lambda: self.sparse_response(StudentProfileSerializer, students),
+        )
     
     @action(detail=True, methods=['get'], permission_classes=[permissions.IsAuthenticated])
     def enrollments(self, request, pk=None):
@@ -97,5 +138,33 @@ class CourseViewSet(viewsets.ModelViewSet):
             return Response({'error': 'Permission denied'}, status=403)
         
         enrollments = Enrollment.objects.filter(course=course)
-        serializer = EnrollmentSerializer(enrollments, many=True)
-        return Response(serializer.data)
+        return self.conditional_response(
+            request,
+            enrollment_sources(enrollments),
+            lambda: self.sparse_response(EnrollmentSerializer, enrollments, EnrollmentProjection),
+        )
+    
+    @extend_schema(methods=['get'], responses=AnnouncementSerializer(many=True))
+    @extend_schema(methods=['post'], request=AnnouncementSerializer, responses=AnnouncementSerializer)
+    @action(detail=True, methods=['get', 'post'], permission_classes=[permissions.IsAuthenticated])
+    def announcements(self, request, pk=None):
+        """List this course's announcements, or post one to its enrolled students."""
+        # get_queryset() limits teachers to their courses and students to enrolled ones.
+        course = self.get_object()
+        
+        if request.method == 'GET':
+            announcements = course.announcements.select_related('author').order_by('-created_at')
+            return Response(AnnouncementSerializer(announcements, many=True).data)
+        
+        if request.user.role not in ('ADMIN', 'TEACHER'):
+            return Response(
+                {'error': 'Only admins and the course teacher can post announcements'}, 
+                status=status.HTTP_403_FORBIDDEN
+            )
+        
+        serializer = AnnouncementSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        announcement = serializer.save(course=course, author=request.user)
+        if serializer.validated_data['send_email']:
+            enqueue('ANNOUNCEMENT_EMAIL', {'announcement_id': str(announcement.id)}, user=request.user)
+        return Response(AnnouncementSerializer(announcement).data, status=status.HTTP_201_CREATED)
@@ -0,0 +1,23 @@
+from core.projections import Projection
+
+
+class EnrollmentProjection(Projection):
+    """Read-only projection matching EnrollmentSerializer output."""
+
+    fields = {
+        'id': 'id',
+        'student': {
+            'name': 'student__user__name',
+            'email': 'student__user__email',
+            'roll_number': 'student__roll_number',
+        },
+        'course': {
+            'id': 'course__id',
+            'title': 'course__title',
+            'description': 'course__description',
+            'schedule': 'course__schedule',
+        },
+        'status': 'status',
+        'created_at': 'created_at',
+        'updated_at': 'updated_at',
+    }
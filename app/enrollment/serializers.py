@@ -1,8 +1,10 @@
 from rest_framework import serializers
 from core.models import Enrollment, StudentProfile, Course
+from core.fieldsets import DynamicFieldsMixin
+from core.schedule import describe_conflicts
 
 
-class EnrollmentStudentSerializer(serializers.ModelSerializer):
+class EnrollmentStudentSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     """Minimal student info for enrollments."""
     
     name = serializers.CharField(source='user.name', read_only=True)
@@ -14,7 +16,7 @@ class EnrollmentStudentSerializer(serializers.ModelSerializer):
         fields = ['name', 'email', 'roll_number']
 
 
-class EnrollmentCourseSerializer(serializers.ModelSerializer):
+class EnrollmentCourseSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     """Minimal course info for enrollments."""
     
     class Meta:
@@ -22,7 +24,7 @@ class EnrollmentCourseSerializer(serializers.ModelSerializer):
         fields = ['id', 'title', 'description', 'schedule']
 
 
-class EnrollmentSerializer(serializers.ModelSerializer):
+class EnrollmentSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     """Serializer for Enrollment model."""
     
     student = EnrollmentStudentSerializer(read_only=True)
@@ -67,6 +69,10 @@ class EnrollmentSerializer(serializers.ModelSerializer):
                 "Student is already enrolled in this course"
             )
         
+        conflicts = describe_conflicts([(student.pk, course.pk)])
+        if conflicts:
+            raise serializers.ValidationError(conflicts[0]['error'])
+        
         return data
     
     def create(self, validated_data):
@@ -90,3 +96,50 @@ class EnrollmentUpdateSerializer(serializers.ModelSerializer):
     class Meta:
         model = Enrollment
         fields = ['status']
+    
+    def validate(self, data):
+        """Check that reactivating the enrollment does not clash with the student's timetable."""
+        if data.get('status') == 'ACTIVE' and self.instance.status != 'ACTIVE':
+            conflicts = describe_conflicts([(self.instance.student_id, self.instance.course_id)])
+            if conflicts:
+                raise serializers.ValidationError(conflicts[0]['error'])
+        return data
+
+
+class EnrollmentBulkStatusSerializer(serializers.Serializer):
+    """Serializer for changing the status of many enrollments at once."""
+    
+    status = serializers.ChoiceField(choices=Enrollment.STATUS_CHOICES)
+    course_id = serializers.UUIDField(required=False)
+    ids = serializers.ListField(
+        child=serializers.UUIDField(), required=False, allow_empty=False, max_length=10000
+    )
+    
+    def validate(self, data):
+        """Require exactly one of course_id or ids."""
+        if ('course_id' in data) == ('ids' in data):
+            raise serializers.ValidationError("Provide either course_id or ids")
+        return data
+
+
+class EnrollmentPairSerializer(serializers.Serializer):
+    """Serializer for one proposed enrollment."""
+    
+    student_id = serializers.UUIDField()
+    course_id = serializers.UUIDField()
+
+
+class EnrollmentConflictCheckSerializer(serializers.Serializer):
+    """Serializer for checking many proposed enrollments for timetable clashes."""
+    
+    enrollments = EnrollmentPairSerializer(many=True, allow_empty=False, max_length=10000)
+
+
+class EnrollmentConflictSerializer(serializers.Serializer):
+    """Serializer describing a proposed enrollment that clashes with the timetable."""
+    
+    index = serializers.IntegerField()
+    student_id = serializers.UUIDField()
+    course_id = serializers.UUIDField()
+    conflicting_course_id = serializers.UUIDField()
+    error = serializers.CharField()
@@ -0,0 +1,25 @@
+from django.db import transaction
+
+from core.job_queue import register
+from core.models import Enrollment
+from core.email_utils import EmailNotificationService
+
+
+@register('REMOVAL_EMAIL', resumable=True)
+def send_removal_emails(payload, checkpoint):
+    """Notify students and teachers of dropped enrollments in resumable batches."""
+    enrollment_ids = sorted(payload['enrollment_ids'])
+    batch_size = payload.get('batch_size', 250)
+    sent, done = checkpoint.get('sent', 0), checkpoint.get('done', 0)
+    while done < len(enrollment_ids):
+        ids = enrollment_ids[done:done + batch_size]
+        # Enrollments reactivated before the job ran are not reported as removed.
+        enrollments = (
+            Enrollment.objects.filter(id__in=ids, status='DROPPED')
+            .select_related('student__user', 'course__teacher__user')
+        )
+        with transaction.atomic():
+            sent += EmailNotificationService.send_bulk_removal_notification(enrollments)
+            done += len(ids)
+            checkpoint.save(done=done, sent=sent)
+    return {'sent': sent}
@@ -0,0 +1,43 @@
+from datetime import time
+
+from rest_framework.test import APITestCase
+
+from core.models import Course, CourseSession, Enrollment, StudentProfile, User
+
+
+class EnrollmentReactivationTests(APITestCase):
+    """Tests for reactivating enrollments whose course clashes with the student's timetable."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser(
+            email='admin@example.com', password='pw', name='Admin', role='ADMIN'
+        )
+        user = User.objects.create_user(email='student@example.com', password='pw', name='Student', role='STUDENT')
+        student = StudentProfile.objects.create(user=user, roll_number='S001', batch='A', enrollment_year=2024)
+        courses = []
+        for title in ('Dropped', 'Taken'):
+            course = Course.objects.create(title=title, description='', duration_weeks=10, schedule='Mon 09:00')
+            CourseSession.objects.create(course=course, weekday=0, start_time=time(9), end_time=time(10, 30))
+            courses.append(course)
+        cls.dropped = Enrollment.objects.create(student=student, course=courses[0], status='DROPPED')
+        Enrollment.objects.create(student=student, course=courses[1])
+
+    def setUp(self):
+        self.client.force_authenticate(self.admin)
+
+    def test_patch_reactivation_is_checked(self):
+        response = self.client.patch(f'/api/enrollments/{self.dropped.id}/', {'status': 'ACTIVE'}, format='json')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("'Taken'", str(response.data))
+        self.dropped.refresh_from_db()
+        self.assertEqual(self.dropped.status, 'DROPPED')
+
+    def test_bulk_reactivation_is_checked(self):
+        response = self.client.post(
+            '/api/enrollments/bulk-status/', {'status': 'ACTIVE', 'ids': [str(self.dropped.id)]}, format='json'
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(len(response.data['conflicts']), 1)
@@ -1,16 +1,29 @@
 from datetime import timedelta
-from time import timezone
+from django.db import transaction
+from django.utils import timezone
 from rest_framework import viewsets, permissions, status
+from rest_framework.decorators import action
 from rest_framework.response import Response
+from drf_spectacular.utils import extend_schema
 from core.models import Enrollment, TeacherProfile, StudentProfile
 from core.permissions import IsAdminUser, CanManageEnrollment, CanViewEnrollment
-from .serializers import EnrollmentSerializer, EnrollmentUpdateSerializer
+from core.fieldsets import SparseFieldsetMixin
+from core.job_queue import enqueue
+from core.idempotency import IDEMPOTENCY_KEY_PARAMETER, idempotent
+from core.schedule import describe_conflicts
+from analytics.rollups import Changes, change_key, record, status_change
+from .serializers import (
+    EnrollmentSerializer, EnrollmentUpdateSerializer, EnrollmentBulkStatusSerializer,
+    EnrollmentConflictCheckSerializer, EnrollmentConflictSerializer
+)
+from .projections import EnrollmentProjection
 
 
-class EnrollmentViewSet(viewsets.ModelViewSet):
+class EnrollmentViewSet(SparseFieldsetMixin, viewsets.ModelViewSet):
     """ViewSet for Enrollment management."""
     
     queryset = Enrollment.objects.all()
+    throttle_scope = 'enrollments'
     
     def get_permissions(self):
         """Set permissions based on action."""
@@ -49,6 +62,13 @@ class EnrollmentViewSet(viewsets.ModelViewSet):
                 return Enrollment.objects.none()
         return Enrollment.objects.none()
     
+    def list(self, request, *args, **kwargs):
+        """List enrollments from a values() projection unless fields are requested."""
+        queryset = self.filter_queryset(self.get_queryset())
+        return self.sparse_response(EnrollmentSerializer, queryset, EnrollmentProjection)
+    
+    @extend_schema(parameters=[IDEMPOTENCY_KEY_PARAMETER])
+    @idempotent
     def create(self, request, *args, **kwargs):
         """Create enrollment with role-based restrictions."""
         if request.user.role == 'ADMIN':
@@ -95,3 +115,87 @@ class EnrollmentViewSet(viewsets.ModelViewSet):
         enrollment.status = 'DROPPED'
         enrollment.save()
         return Response(status=status.HTTP_204_NO_CONTENT)
+    
+    @action(detail=False, methods=['post'], url_path='bulk-status',
+            permission_classes=[permissions.IsAuthenticated],
+            serializer_class=EnrollmentBulkStatusSerializer)
+    def bulk_status(self, request):
+        """Change the status of all enrollments in a course or a list of ids."""
+        if request.user.role not in ('ADMIN', 'TEACHER'):
+            return Response(
+                {'error': 'Only admins and teachers can update enrollments in bulk'}, 
+                status=status.HTTP_403_FORBIDDEN
+            )
+        
+        serializer = EnrollmentBulkStatusSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        new_status = serializer.validated_data['status']
+        course_id = serializer.validated_data.get('course_id')
+        
+        # get_queryset() already limits teachers to their own courses.
+        enrollments = self.get_queryset()
+        if course_id:
+            if request.user.role == 'TEACHER' and not TeacherProfile.objects.filter(
+                user=request.user, courses__id=course_id
+            ).exists():
+                return Response(
+                    {'error': 'You can only update enrollments in your assigned courses'}, 
+                    status=status.HTTP_403_FORBIDDEN
+                )
+            enrollments = enrollments.filter(course_id=course_id)
+        else:
+            enrollments = enrollments.filter(id__in=serializer.validated_data['ids'])
+        
+        with transaction.atomic():
+            changed = list(
+                enrollments.exclude(status=new_status)
+                .select_related('student', 'course')
+                .select_for_update(of=('self',))
+            )
+            
+            if new_status == 'ACTIVE':
+                conflicts = describe_conflicts(
+                    [(enrollment.student_id, enrollment.course_id) for enrollment in changed]
+                )
+                if conflicts:
+                    return Response(
+                        {'error': 'Reactivating these enrollments would cause schedule conflicts',
+                         'conflicts': conflicts},
+                        status=status.HTTP_400_BAD_REQUEST
+                    )
+            
+            updated = Enrollment.objects.filter(
+                id__in=[enrollment.id for enrollment in changed]
+            ).update(status=new_status, updated_at=timezone.now())
+            
+            # Queryset updates skip the post_save receiver that maintains the rollups.
+            changes = Changes()
+            for enrollment in changed:
+                metric = status_change(enrollment.status, new_status)
+                if metric:
+                    changes.add(change_key(enrollment), metric, enrollment.course.teacher_id)
+            record(changes)
+            
+            if new_status == 'DROPPED':
+                dropped = [str(enrollment.id) for enrollment in changed if enrollment.status == 'ACTIVE']
+                if dropped:
+                    enqueue('REMOVAL_EMAIL', {'enrollment_ids': dropped}, user=request.user)
+        
+        return Response({'updated': updated, 'status': new_status}, status=status.HTTP_200_OK)
+    
+    @extend_schema(request=EnrollmentConflictCheckSerializer, responses=EnrollmentConflictSerializer(many=True))
+    @action(detail=False, methods=['post'], url_path='check-conflicts',
+            permission_classes=[permissions.IsAuthenticated],
+            serializer_class=EnrollmentConflictCheckSerializer)
+    def check_conflicts(self, request):
+        """Check proposed enrollments against students' timetables and each other."""
+        if request.user.role not in ('ADMIN', 'TEACHER'):
+            return Response(
+                {'error': 'Only admins and teachers can check enrollments'}, 
+                status=status.HTTP_403_FORBIDDEN
+            )
+        
+        serializer = EnrollmentConflictCheckSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        pairs = [(item['student_id'], item['course_id']) for item in serializer.validated_data['enrollments']]
+        return Response(describe_conflicts(pairs), status=status.HTTP_200_OK)
@@ -0,0 +1,40 @@
+"""
+Gunicorn configuration, driven by environment variables.
+
+SERVER_MODE=wsgi runs threaded WSGI workers (app.wsgi); SERVER_MODE=asgi
+runs uvicorn workers (app.asgi). Send SIGHUP to the master process for a
+graceful reload: new workers are started with the new code and the old
+ones finish their in-flight requests before exiting.
+"""
+
+import multiprocessing
+import os
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+SERVER_MODE = (os.getenv('SERVER_MODE') or 'wsgi').lower()
+
+bind = f"0.0.0.0:{os.getenv('PORT') or 8001}"
+workers = int(os.getenv('WEB_CONCURRENCY') or multiprocessing.cpu_count() * 2 + 1)
+threads = int(os.getenv('GUNICORN_THREADS') or 4)
+keepalive = int(os.getenv('GUNICORN_KEEPALIVE') or 5)
+timeout = int(os.getenv('GUNICORN_TIMEOUT') or 30)
+graceful_timeout = int(os.getenv('GUNICORN_GRACEFUL_TIMEOUT') or 30)
+
+# Recycle workers periodically so slow leaks cannot grow unbounded; the
+# jitter keeps them from all restarting at once.
+max_requests = int(os.getenv('GUNICORN_MAX_REQUESTS') or 1000)
+max_requests_jitter = max_requests // 10
+
+if SERVER_MODE == 'asgi':
+    wsgi_app = 'app.asgi:application'
+    worker_class = 'uvicorn_worker.UvicornWorker'
+else:
+    wsgi_app = 'app.wsgi:application'
+    worker_class = 'gthread' if threads > 1 else 'sync'
+
+accesslog = '-'
+errorlog = '-'
+loglevel = os.getenv('GUNICORN_LOG_LEVEL') or 'info'
@@ -0,0 +1,15 @@
+from rest_framework import serializers
+from core.models import Job
+from core.fieldsets import DynamicFieldsMixin
+
+
+class JobSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    """Serializer for background job status."""
+    
+    class Meta:
+        model = Job
+        fields = [
+            'id', 'type', 'status', 'payload', 'result', 'error', 'attempts',
+            'created_at', 'updated_at', 'started_at', 'finished_at'
+        ]
+        read_only_fields = fields
@@ -0,0 +1,12 @@
+from django.urls import path, include
+from rest_framework.routers import DefaultRouter
+from . import views
+
+app_name = 'job'
+
+router = DefaultRouter()
+router.register(r'', views.JobViewSet, basename='job')
+
+urlpatterns = [
+    path('', include(router.urls)),
+]
@@ -0,0 +1,17 @@
+from rest_framework import viewsets, permissions
+from core.models import Job
+from core.fieldsets import SparseFieldsetMixin
+from .serializers import JobSerializer
+
+
+class JobViewSet(SparseFieldsetMixin, viewsets.ReadOnlyModelViewSet):
+    """ViewSet for checking background job status."""
+    
+    serializer_class = JobSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    
+    def get_queryset(self):
+        """Admins see all jobs, other users only the jobs they started."""
+        if self.request.user.role == 'ADMIN':
+            return Job.objects.order_by('-created_at')
+        return Job.objects.filter(created_by=self.request.user).order_by('-created_at')
@@ -1,9 +1,33 @@
+from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
-from core.models import Notification
+from core.models import Announcement, Notification
+from core.fieldsets import DynamicFieldsMixin
 from user.serializers import UserSerializer
 
 
-class NotificationSerializer(serializers.ModelSerializer):
+class NotificationQuerySerializer(serializers.Serializer):
+    """Serializer for inbox query parameters."""
+    
+    limit = serializers.IntegerField(
+        required=False, min_value=1, max_value=200,
+        help_text='Return at most this many items; without it the whole inbox is returned'
+    )
+    before = serializers.DateTimeField(
+        required=False, help_text="Only items older than this; pass the last item's `sent_at` for the next page"
+    )
+    before_id = serializers.UUIDField(
+        required=False,
+        help_text="The last item's `id`, so items sent at the same time that were not on the page are kept"
+    )
+    
+    def validate(self, data):
+        """Check that before_id comes with before."""
+        if 'before_id' in data and 'before' not in data:
+            raise serializers.ValidationError("before_id requires before")
+        return data
+
+
+class NotificationSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     """Serializer for Notification model."""
     
     receiver = UserSerializer(read_only=True)
@@ -12,3 +36,26 @@ class NotificationSerializer(serializers.ModelSerializer):
         model = Notification
         fields = ['id', 'receiver', 'message', 'type', 'sent_at']
         read_only_fields = ['id', 'sent_at']
+
+
+class AnnouncementInboxSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    """Serializer for a course announcement shown in a student's notifications."""
+    
+    receiver = serializers.SerializerMethodField()
+    type = serializers.SerializerMethodField()
+    sent_at = serializers.DateTimeField(source='created_at', read_only=True)
+    course_title = serializers.CharField(source='course.title', read_only=True)
+    
+    class Meta:
+        model = Announcement
+        fields = ['id', 'receiver', 'title', 'message', 'type', 'sent_at', 'course', 'course_title']
+    
+    @extend_schema_field(UserSerializer)
+    def get_receiver(self, obj):
+        """Announcements are shared, so the receiver is the user reading them."""
+        if not hasattr(self, '_receiver'):
+            self._receiver = UserSerializer(self.context['request'].user).data
+        return self._receiver
+    
+    def get_type(self, obj) -> str:
+        return 'ANNOUNCEMENT'
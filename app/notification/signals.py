@@ -2,6 +2,7 @@ from django.db.models.signals import post_save, pre_save
 from django.dispatch import receiver
 from core.models import User, Course, Enrollment
 from core.email_utils import EmailNotificationService
+from core.job_queue import enqueue
 
 
 @receiver(pre_save, sender=Course)
@@ -22,7 +23,7 @@ def store_previous_teacher(sender, instance, **kwargs):
 @receiver(post_save, sender=Course)
 def send_course_assignment_notification(sender, instance, created, **kwargs):
     """
-    Send course assignment notification when a teacher is assigned to a course.
+    Queue a course assignment notification when a teacher is assigned to a course.
     Uses the stored previous teacher for accurate comparison.
     """
     if instance.teacher:
@@ -30,14 +31,14 @@ def send_course_assignment_notification(sender, instance, created, **kwargs):
         
         if instance.teacher != previous_teacher:
             try:
-                EmailNotificationService.send_course_assignment_notification(
-                    teacher=instance.teacher,
-                    course=instance
-                )
+                enqueue('COURSE_ASSIGNMENT', {
+                    'course_id': str(instance.id),
+                    'teacher_id': str(instance.teacher.pk),
+                })
             except Exception as e:
                 import logging
                 logger = logging.getLogger(__name__)
-                logger.error(f"Failed to send course assignment notification for course {instance.title}: {str(e)}")
+                logger.error(f"Failed to queue course assignment notification for course {instance.title}: {str(e)}")
 
 
 @receiver(pre_save, sender=Enrollment)
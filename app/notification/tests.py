@@ -0,0 +1,63 @@
+from datetime import timedelta
+
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from core.models import Announcement, Course, Enrollment, Notification, StudentProfile, User
+
+
+class NotificationListTests(APITestCase):
+    """Tests for GET /api/notifications/."""
+
+    url = '/api/notifications/'
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            email='student@example.com', password='pw', name='Student', role='STUDENT'
+        )
+        student = StudentProfile.objects.create(
+            user=cls.user, roll_number='S001', batch='A', enrollment_year=2024
+        )
+        course = Course.objects.create(title='Course', description='', duration_weeks=10, schedule='Mon 09:00')
+        Enrollment.objects.create(student=student, course=course)
+        now = timezone.now()
+        # Several items share each timestamp, across both sources.
+        Notification.objects.bulk_create([
+            Notification(
+                receiver=cls.user, message=f'Message {index}', type='ENROLLMENT',
+                sent_at=now - timedelta(minutes=index // 3)
+            )
+            for index in range(9)
+        ])
+        for index in range(3):
+            announcement = Announcement.objects.create(course=course, title=f'News {index}', message='')
+            Announcement.objects.filter(pk=announcement.pk).update(created_at=now - timedelta(minutes=index))
+
+    def setUp(self):
+        self.client.force_authenticate(self.user)
+
+    def test_whole_inbox_without_limit(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data), 12)
+        sent_at = [item['sent_at'] for item in response.data]
+        self.assertEqual(sent_at, sorted(sent_at, reverse=True))
+
+    def test_pages_do_not_skip_items_sharing_a_timestamp(self):
+        expected = [item['id'] for item in self.client.get(self.url).data]
+        seen, params = [], {'limit': 5}
+        while True:
+            page = self.client.get(self.url, params).data
+            if not page:
+                break
+            self.assertLessEqual(len(page), 5)
+            seen += [item['id'] for item in page]
+            params = {'limit': 5, 'before': page[-1]['sent_at'], 'before_id': page[-1]['id']}
+
+        self.assertEqual(seen, expected)
+
+    def test_before_id_requires_before(self):
+        response = self.client.get(self.url, {'limit': 5, 'before_id': Notification.objects.first().pk})
+        self.assertEqual(response.status_code, 400)
@@ -1,12 +1,73 @@
+from django.db.models import Q
+from drf_spectacular.utils import PolymorphicProxySerializer, extend_schema
 from rest_framework import generics, permissions
-from core.models import Notification
-from .serializers import NotificationSerializer
+from rest_framework.response import Response
+from core.models import Announcement, Notification
+from core.fieldsets import SparseFieldsetMixin
+from .serializers import NotificationQuerySerializer, NotificationSerializer, AnnouncementInboxSerializer
 
 
-class NotificationListView(generics.ListAPIView):
+def older_than(field, before, before_id=None):
+    """Return a filter for items older than ``(before, before_id)``, ties broken by id."""
+    if before_id is None:
+        return Q(**{f'{field}__lt': before})
+    return Q(**{f'{field}__lt': before}) | Q(**{field: before, 'id__lt': before_id})
+
+
+class NotificationListView(SparseFieldsetMixin, generics.ListAPIView):
     """List notifications for current user."""
     serializer_class = NotificationSerializer
     permission_classes = [permissions.IsAuthenticated]
-    
+
     def get_queryset(self):
         return Notification.objects.filter(receiver=self.request.user)
+
+    def get_announcements(self):
+        """Announcements of the courses the current student is actively enrolled in."""
+        if self.request.user.role != 'STUDENT':
+            return Announcement.objects.none()
+        return Announcement.objects.filter(
+            course__enrollments__student__user=self.request.user,
+            course__enrollments__status='ACTIVE',
+        ).select_related('course')
+
+    @extend_schema(parameters=[NotificationQuerySerializer], responses=PolymorphicProxySerializer(
+        component_name='InboxItem',
+        serializers=[NotificationSerializer, AnnouncementInboxSerializer],
+        resource_type_field_name=None,
+        many=True,
+    ))
+    def get(self, request, *args, **kwargs):
+        """
+        List the user's notifications together with the announcements of
+        their courses, newest first; with ``limit``, a page at a time.
+        """
+        query = NotificationQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        limit = query.validated_data.get('limit')
+        before, before_id = query.validated_data.get('before'), query.validated_data.get('before_id')
+
+        notifications = self.filter_queryset(self.get_queryset())
+        announcements = self.get_announcements()
+        if before:
+            # Bounding sent_at lets PostgreSQL skip newer notification partitions.
+            notifications = notifications.filter(sent_at__lte=before).filter(older_than('sent_at', before, before_id))
+            announcements = announcements.filter(older_than('created_at', before, before_id))
+        notifications = notifications.order_by('-sent_at', '-id')
+        announcements = announcements.order_by('-created_at', '-id')
+        if limit:
+            # Each source can fill the page on its own, so fetch a page of both.
+            notifications, announcements = notifications[:limit], announcements[:limit]
+        notifications, announcements = list(notifications), list(announcements)
+        context = self.get_serializer_context()
+
+        items = list(zip(
+            [(notification.sent_at, notification.id) for notification in notifications],
+            NotificationSerializer(notifications, many=True, context=context).data,
+        ))
+        items += zip(
+            [(announcement.created_at, announcement.id) for announcement in announcements],
+            AnnouncementInboxSerializer(announcements, many=True, context=context).data,
+        )
+        items.sort(key=lambda item: item[0], reverse=True)
+        return Response([data for _, data in items[:limit]])
@@ -1,6 +1,17 @@
 #!/bin/bash
 
-# Script to wait for database and then run Django development server
+# Script to wait for database and then run the Django application.
+#
+#   ./start_server.sh          web server
+#   ./start_server.sh worker   background job worker (run_jobs)
+#
+# Deployments run both: course deletes and assignment, announcement and bulk
+# removal emails stay PENDING until a worker picks them up.
+# With DJANGO_DEBUG=True the development server is used, with a worker in
+# the background; otherwise static files are collected and gunicorn serves
+# the app (see gunicorn.conf.py).
+
+ROLE=${1:-web}
 
 echo "Starting Django application with database check..."
 
@@ -12,14 +23,34 @@ python manage.py wait_for_db --timeout=60
 if [ $? -eq 0 ]; then
     # echo "Database is ready. Running migrations..."
     # python manage.py migrate
-    
-    # if [ $? -eq 0 ]; then
-    echo "Starting development server..."
-    python manage.py runserver 0.0.0.0:8001
-    # else
-    #     echo "Migrations failed!"
-    #     exit 1
-    # fi
+
+    if [ "$ROLE" = "worker" ]; then
+        echo "Starting background job worker..."
+        exec python manage.py run_jobs
+    fi
+
+    DEBUG=$(python -c "from dotenv import load_dotenv; import os; load_dotenv(); print((os.getenv('DJANGO_DEBUG') or '').lower())")
+    case "$DEBUG" in
+        1|true|yes)
+            echo "Starting background job worker..."
+            python manage.py run_jobs &
+            echo "Starting development server..."
+            exec python manage.py runserver 0.0.0.0:${PORT:-8001}
+            ;;
+    esac
+
+    # Fails on deploy errors such as a cache that is not shared between
+    # the gunicorn workers (rate limits, idempotency keys, replica pins).
+    echo "Running deploy checks..."
+    python manage.py check --deploy --fail-level ERROR || exit 1
+
+    echo "Collecting static files..."
+    python manage.py collectstatic --noinput || exit 1
+
+    # exec so SIGHUP (graceful reload) and SIGTERM (graceful shutdown)
+    # reach the gunicorn master directly.
+    echo "Starting gunicorn (${SERVER_MODE:-wsgi})..."
+    exec gunicorn -c gunicorn.conf.py
 else
     echo "Database connection failed!"
     exit 1
@@ -0,0 +1,15 @@
+from core.projections import Projection
+
+
+class StudentEnrollmentsProjection(Projection):
+    """Read-only projection matching StudentEnrollmentsSerializer output."""
+
+    fields = {
+        'id': 'id',
+        'course_title': 'course__title',
+        'course_description': 'course__description',
+        'course_schedule': 'course__schedule',
+        'teacher_name': 'course__teacher__user__name',
+        'status': 'status',
+        'created_at': 'created_at',
+    }
@@ -1,9 +1,10 @@
 from rest_framework import serializers
-from core.models import StudentProfile, Enrollment
+from core.models import StudentProfile, Enrollment, Notification
+from core.fieldsets import DynamicFieldsMixin
 from user.serializers import UserProfileSerializer
 
 
-class StudentProfileSerializer(serializers.ModelSerializer):
+class StudentProfileSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     """Serializer for StudentProfile model with nested user updates."""
     
     user = UserProfileSerializer() 
@@ -40,13 +41,13 @@ class StudentProfileUpdateSerializer(StudentProfileSerializer):
         
 
 
-class StudentEnrollmentsSerializer(serializers.ModelSerializer):
+class StudentEnrollmentsSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     """Serializer for student's enrollments."""
     
     course_title = serializers.CharField(source='course.title', read_only=True)
     course_description = serializers.CharField(source='course.description', read_only=True)
     course_schedule = serializers.CharField(source='course.schedule', read_only=True)
-    teacher_name = serializers.CharField(source='course.teacher.user.name', read_only=True)
+    teacher_name = serializers.CharField(source='course.teacher.user.name', read_only=True, allow_null=True)
     
     class Meta:
         model = Enrollment
@@ -55,3 +56,51 @@ class StudentEnrollmentsSerializer(serializers.ModelSerializer):
             'teacher_name', 'status', 'created_at'
         ]
         read_only_fields = ['id', 'created_at']
+
+
+class DashboardCourseSerializer(serializers.ModelSerializer):
+    """Serializer for an active course on the student dashboard."""
+
+    course_id = serializers.UUIDField(source='course.id', read_only=True)
+    course_title = serializers.CharField(source='course.title', read_only=True)
+    course_schedule = serializers.CharField(source='course.schedule', read_only=True)
+    duration_weeks = serializers.IntegerField(source='course.duration_weeks', read_only=True)
+    teacher_name = serializers.CharField(source='course.teacher.user.name', read_only=True, allow_null=True)
+
+    class Meta:
+        model = Enrollment
+        fields = [
+            'id', 'course_id', 'course_title', 'course_schedule', 'duration_weeks',
+            'teacher_name', 'created_at'
+        ]
+        read_only_fields = fields
+
+
+class DashboardNotificationSerializer(serializers.ModelSerializer):
+    """Serializer for a recent notification on the student dashboard."""
+
+    class Meta:
+        model = Notification
+        fields = ['id', 'message', 'type', 'sent_at']
+        read_only_fields = fields
+
+
+class DashboardCountsSerializer(serializers.Serializer):
+    """Serializer for the dashboard totals."""
+
+    active_courses = serializers.IntegerField(source='active_count')
+    dropped_courses = serializers.IntegerField(source='dropped_count')
+    notifications = serializers.IntegerField(source='notification_count')
+
+
+class StudentDashboardSerializer(serializers.Serializer):
+    """
+    Serializer for the current student's dashboard.
+
+    Expects a StudentProfile loaded by ``StudentProfileViewSet.get_dashboard_queryset``.
+    """
+
+    profile = StudentProfileSerializer(source='*', read_only=True)
+    courses = DashboardCourseSerializer(source='active_enrollments', many=True, read_only=True)
+    notifications = DashboardNotificationSerializer(source='user.recent_notifications', many=True, read_only=True)
+    counts = DashboardCountsSerializer(source='*', read_only=True)
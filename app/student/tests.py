@@ -0,0 +1,78 @@
+from rest_framework.test import APITestCase
+
+from core.models import Course, Enrollment, Notification, StudentProfile, TeacherProfile, User
+
+
+class StudentDashboardTests(APITestCase):
+    """Tests for GET /api/students/me/dashboard/."""
+
+    url = '/api/students/me/dashboard/'
+
+    @classmethod
+    def setUpTestData(cls):
+        teacher_user = User.objects.create_user(
+            email='teacher@example.com', password='pw', name='Teacher', role='TEACHER'
+        )
+        teacher = TeacherProfile.objects.create(user=teacher_user)
+        cls.user = User.objects.create_user(
+            email='student@example.com', password='pw', name='Student', role='STUDENT'
+        )
+        cls.student = StudentProfile.objects.create(
+            user=cls.user, roll_number='S001', batch='A', enrollment_year=2024
+        )
+        for index, status in enumerate(['ACTIVE', 'ACTIVE', 'ACTIVE', 'DROPPED']):
+            course = Course.objects.create(
+                title=f'Course {index}', description='', duration_weeks=10, schedule='Mon 09:00',
+                teacher=teacher if index else None
+            )
+            Enrollment.objects.create(student=cls.student, course=course, status=status)
+        Notification.objects.bulk_create([
+            Notification(receiver=cls.user, message=f'Message {index}', type='ENROLLMENT')
+            for index in range(12)
+        ])
+
+    def setUp(self):
+        self.client.force_authenticate(self.user)
+
+    def test_dashboard_contents(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['profile']['roll_number'], 'S001')
+        self.assertEqual(len(response.data['courses']), 3)
+        self.assertEqual(
+            sorted(course['teacher_name'] for course in response.data['courses'] if course['teacher_name']),
+            ['Teacher', 'Teacher']
+        )
+        self.assertEqual(len(response.data['notifications']), 10)
+        self.assertEqual(dict(response.data['counts']), {
+            'active_courses': 3,
+            'dropped_courses': 1,
+            'notifications': Notification.objects.filter(receiver=self.user).count(),
+        })
+
+    def test_dashboard_query_count_does_not_grow(self):
+        # Profile with counts, active enrollments with courses and teachers,
+        # and recent notifications.
+        with self.assertNumQueries(3):
+            self.client.get(self.url)
+
+        other_teacher_user = User.objects.create_user(
+            email='teacher2@example.com', password='pw', name='Teacher 2', role='TEACHER'
+        )
+        other_teacher = TeacherProfile.objects.create(user=other_teacher_user)
+        for index in range(5):
+            course = Course.objects.create(
+                title=f'Extra {index}', description='', duration_weeks=10, schedule='Tue 09:00',
+                teacher=other_teacher
+            )
+            Enrollment.objects.create(student=self.student, course=course, status='ACTIVE')
+
+        with self.assertNumQueries(3):
+            response = self.client.get(self.url)
+        self.assertEqual(len(response.data['courses']), 8)
+
+    def test_dashboard_requires_student(self):
+        self.client.force_authenticate(User.objects.get(email='teacher@example.com'))
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 403)
@@ -1,15 +1,24 @@
+from django.db.models import Count, IntegerField, OuterRef, Prefetch, Q, Subquery
+from django.db.models.functions import Coalesce
 from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from core.models import StudentProfile, Enrollment, TeacherProfile
+from core.models import StudentProfile, Enrollment, TeacherProfile, Notification
 from core.permissions import IsAdminUser, IsStudentOwnerOrTeacherOrAdmin, IsStudentUser
-from .serializers import StudentProfileSerializer, StudentEnrollmentsSerializer, StudentProfileUpdateSerializer
+from core.conditional import ConditionalGetMixin, enrollment_sources, student_sources
+from core.fieldsets import SparseFieldsetMixin
+from .serializers import (
+    StudentProfileSerializer, StudentEnrollmentsSerializer, StudentProfileUpdateSerializer,
+    StudentDashboardSerializer
+)
+from .projections import StudentEnrollmentsProjection
 
 
-class StudentProfileViewSet(viewsets.ModelViewSet):
+class StudentProfileViewSet(ConditionalGetMixin, SparseFieldsetMixin, viewsets.ModelViewSet):
     """ViewSet for StudentProfile management."""
     serializer_class= StudentProfileSerializer
     queryset = StudentProfile.objects.all()
+    dashboard_notifications = 10
     
     def create(self, request, *args, **kwargs):
         """Disable POST requests for student profile creation."""
@@ -24,6 +33,8 @@ class StudentProfileViewSet(viewsets.ModelViewSet):
             permission_classes = [permissions.IsAuthenticated]
         elif self.action in ['create', 'destroy']:
             permission_classes = [IsAdminUser]
+        elif self.action == 'dashboard':
+            permission_classes = [IsStudentUser]
         else:
             permission_classes = [IsStudentOwnerOrTeacherOrAdmin]
         return [permission() for permission in permission_classes]
@@ -42,13 +53,22 @@ class StudentProfileViewSet(viewsets.ModelViewSet):
             return StudentProfile.objects.filter(user=self.request.user)
         return StudentProfile.objects.none()
     
+    def get_validator_sources(self, queryset):
+        """Student profiles change with their nested user."""
+        return student_sources(queryset)
+    
     @action(detail=True, methods=['get'], permission_classes=[IsStudentOwnerOrTeacherOrAdmin])
     def enrollments(self, request, pk=None):
         """Get student's enrollments."""
         student = self.get_object()
-        enrollments = student.enrollments.all()
-        serializer = StudentEnrollmentsSerializer(enrollments, many=True)
-        return Response(serializer.data)
+        enrollments = Enrollment.objects.filter(student=student)
+        return self.conditional_response(
+            request,
+            enrollment_sources(enrollments),
+            lambda: self.sparse_response(
+                StudentEnrollmentsSerializer, enrollments, StudentEnrollmentsProjection
+            ),
+        )
 
     @action(detail=True, methods=['patch'], permission_classes=[IsAdminUser])
     def update_profile(self, request, pk=None):
@@ -58,4 +78,50 @@ class StudentProfileViewSet(viewsets.ModelViewSet):
         if serializer.is_valid():
             serializer.save()
             return Response(serializer.data)
-        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
\ No newline at end of file
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+    def get_dashboard_queryset(self):
+        """
+        Load a student with everything the dashboard shows in three queries:
+        the profile with its user and counts, the active enrollments with their
+        course and teacher, and the most recent notifications.
+        """
+        notification_count = (
+            Notification.objects.filter(receiver=OuterRef('user'))
+            .values('receiver')
+            .annotate(total=Count('id'))
+            .values('total')
+        )
+        return (
+            StudentProfile.objects.select_related('user')
+            .annotate(
+                active_count=Count('enrollments', filter=Q(enrollments__status='ACTIVE')),
+                dropped_count=Count('enrollments', filter=Q(enrollments__status='DROPPED')),
+                notification_count=Coalesce(Subquery(notification_count, output_field=IntegerField()), 0),
+            )
+            .prefetch_related(
+                Prefetch(
+                    'enrollments',
+                    queryset=Enrollment.objects.filter(status='ACTIVE')
+                    .select_related('course__teacher__user')
+                    .order_by('-created_at'),
+                    to_attr='active_enrollments',
+                ),
+                Prefetch(
+                    'user__notifications',
+                    queryset=Notification.objects.order_by('-sent_at')[:self.dashboard_notifications],
+                    to_attr='recent_notifications',
+                ),
+            )
+        )
+
+    @action(detail=False, methods=['get'], url_path='me/dashboard', permission_classes=[IsStudentUser])
+    def dashboard(self, request):
+        """Get the current student's profile, active courses, recent notifications and counts."""
+        try:
+            student = self.get_dashboard_queryset().get(user=request.user)
+        except StudentProfile.DoesNotExist:
+            return Response({'error': 'Student profile not found'}, status=status.HTTP_404_NOT_FOUND)
+
+        serializer = StudentDashboardSerializer(student)
+        return Response(serializer.data)
@@ -0,0 +1,131 @@
+"""
+Change feeds for incremental sync.
+
+Each resource's feed merges rows whose ``changed_at`` moved past the
+client's cursor (inserts and updates) with ``DeletionLog`` entries (deletes),
+ordered by ``(changed_at, id)``. The cursor is an opaque token holding the
+position of the last entry returned, so a sync costs one indexed range scan
+proportional to the churn since then.
+
+Rows newer than ``SYNC_SAFETY_WINDOW`` seconds are held back: ``updated_at``
+is stamped before commit, so a slow transaction could otherwise commit a
+row behind a cursor that has already moved past it. Once a client has
+caught up, its cursor moves to that horizon even if nothing changed, so
+quiet resources do not leave cursors behind the deletion log's retention.
+"""
+
+import base64
+import binascii
+import uuid
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.db.models import F, Q
+from django.utils import timezone
+
+from core.models import Course, Enrollment, StudentProfile, TeacherProfile, DeletionLog, DeletionLogPrune
+from .projections import (
+    CourseSyncProjection, EnrollmentSyncProjection, StudentSyncProjection, TeacherSyncProjection
+)
+
+# resource -> (queryset annotated with changed_at, projection)
+FEEDS = {
+    'courses': (
+        lambda: Course.objects.annotate(changed_at=F('updated_at')),
+        CourseSyncProjection,
+    ),
+    'enrollments': (
+        lambda: Enrollment.objects.annotate(changed_at=F('updated_at')),
+        EnrollmentSyncProjection,
+    ),
+    # Profiles are touched when their user's name or email changes (signals).
+    'students': (
+        lambda: StudentProfile.objects.annotate(changed_at=F('updated_at')),
+        StudentSyncProjection,
+    ),
+    'teachers': (
+        lambda: TeacherProfile.objects.annotate(changed_at=F('updated_at')),
+        TeacherSyncProjection,
+    ),
+}
+
+
+class InvalidSyncToken(ValueError):
+    """Raised when a sync token cannot be decoded."""
+
+
+class ExpiredSyncToken(Exception):
+    """Raised when deletes after the token's position have already been pruned."""
+
+
+# Sorts after every id, so a cursor at (horizon, LAST_ID) covers the horizon.
+LAST_ID = uuid.UUID(int=(1 << 128) - 1)
+
+
+def encode_token(changed_at, object_id):
+    """Return the opaque cursor for the entry at ``(changed_at, object_id)``."""
+    return base64.urlsafe_b64encode(f'{changed_at.isoformat()}|{object_id}'.encode()).decode()
+
+
+def decode_token(token):
+    """Return ``(changed_at, object_id)`` for a token made by :func:`encode_token`."""
+    try:
+        changed_at, object_id = base64.urlsafe_b64decode(token.encode()).decode().split('|')
+        changed_at = datetime.fromisoformat(changed_at)
+        object_id = uuid.UUID(object_id)
+    except (ValueError, TypeError, binascii.Error) as e:
+        raise InvalidSyncToken(str(e))
+    if timezone.is_naive(changed_at):
+        raise InvalidSyncToken('Token timestamp has no timezone')
+    return changed_at, object_id
+
+
+def get_changes(resource, token=None, limit=1000):
+    """
+    Return ``(entries, next token, has_more)`` for ``resource`` after ``token``.
+
+    Entries are ``{'op': 'upsert', 'id', 'changed_at', 'data'}`` or
+    ``{'op': 'delete', 'id', 'changed_at'}``. Without a token the feed starts
+    from the beginning, which doubles as the initial full sync.
+    """
+    queryset_factory, projection_class = FEEDS[resource]
+    now = timezone.now()
+    horizon = now - timedelta(seconds=settings.SYNC_SAFETY_WINDOW)
+
+    upserts = queryset_factory().filter(changed_at__lte=horizon)
+    deletes = DeletionLog.objects.filter(resource=resource, deleted_at__lte=horizon)
+    if token is not None:
+        changed_at, object_id = decode_token(token)
+        pruned_through = (
+            DeletionLogPrune.objects.filter(resource=resource)
+            .values_list('pruned_through', flat=True).first()
+        )
+        if pruned_through is not None and pruned_through > changed_at:
+            raise ExpiredSyncToken
+        upserts = upserts.filter(Q(changed_at__gt=changed_at) | Q(changed_at=changed_at, pk__gt=object_id))
+        deletes = deletes.filter(
+            Q(deleted_at__gt=changed_at) | Q(deleted_at=changed_at, object_id__gt=object_id)
+        )
+
+    # One extra row from each side tells whether another page follows.
+    upserts = upserts.order_by('changed_at', 'pk')[:limit + 1]
+    deletes = deletes.order_by('deleted_at', 'object_id').values_list('object_id', 'deleted_at')[:limit + 1]
+
+    entries = [
+        {'op': 'upsert', 'id': row['id'], 'changed_at': row.pop('changed_at'), 'data': row}
+        for row in projection_class(upserts).data
+    ]
+    entries += [
+        {'op': 'delete', 'id': object_id, 'changed_at': deleted_at}
+        for object_id, deleted_at in deletes
+    ]
+    entries.sort(key=lambda entry: (entry['changed_at'], str(entry['id'])))
+
+    has_more = len(entries) > limit
+    entries = entries[:limit]
+    if has_more:
+        token = encode_token(entries[-1]['changed_at'], entries[-1]['id'])
+    else:
+        # Everything up to the horizon has been returned.
+        token = encode_token(horizon, LAST_ID)
+    return entries, token, has_more
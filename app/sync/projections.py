@@ -0,0 +1,62 @@
+from core.projections import Projection
+
+
+class CourseSyncProjection(Projection):
+    """Flat course rows for the sync feed."""
+
+    fields = {
+        'id': 'id',
+        'title': 'title',
+        'description': 'description',
+        'duration_weeks': 'duration_weeks',
+        'schedule': 'schedule',
+        'teacher': 'teacher_id',
+        'created_at': 'created_at',
+        'changed_at': 'changed_at',
+    }
+
+
+class EnrollmentSyncProjection(Projection):
+    """Flat enrollment rows for the sync feed."""
+
+    fields = {
+        'id': 'id',
+        'student': 'student_id',
+        'course': 'course_id',
+        'status': 'status',
+        'created_at': 'created_at',
+        'changed_at': 'changed_at',
+    }
+
+
+class StudentSyncProjection(Projection):
+    """Flat student profile rows, including the user's name and email."""
+
+    fields = {
+        'id': 'user_id',
+        'email': 'user__email',
+        'name': 'user__name',
+        'is_active': 'user__is_active',
+        'roll_number': 'roll_number',
+        'batch': 'batch',
+        'enrollment_year': 'enrollment_year',
+        'phone': 'phone',
+        'address': 'address',
+        'changed_at': 'changed_at',
+    }
+
+
+class TeacherSyncProjection(Projection):
+    """Flat teacher profile rows, including the user's name and email."""
+
+    fields = {
+        'id': 'user_id',
+        'email': 'user__email',
+        'name': 'user__name',
+        'is_active': 'user__is_active',
+        'phone': 'phone',
+        'address': 'address',
+        'qualification': 'qualification',
+        'experience_years': 'experience_years',
+        'changed_at': 'changed_at',
+    }
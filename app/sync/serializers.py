@@ -0,0 +1,25 @@
+from rest_framework import serializers
+
+
+class SyncQuerySerializer(serializers.Serializer):
+    """Serializer for change feed query parameters."""
+
+    since = serializers.CharField(required=False, help_text='Token returned as `next` by the previous sync')
+    limit = serializers.IntegerField(required=False, default=1000, min_value=1, max_value=5000)
+
+
+class SyncChangeSerializer(serializers.Serializer):
+    """Serializer describing one change feed entry."""
+
+    op = serializers.ChoiceField(choices=['upsert', 'delete'])
+    id = serializers.UUIDField()
+    changed_at = serializers.DateTimeField()
+    data = serializers.JSONField(required=False, help_text='Row contents, for upserts only')
+
+
+class SyncResponseSerializer(serializers.Serializer):
+    """Serializer describing a page of the change feed."""
+
+    changes = SyncChangeSerializer(many=True)
+    next = serializers.CharField(allow_null=True, help_text='Pass as `since` on the next sync')
+    has_more = serializers.BooleanField()
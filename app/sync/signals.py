@@ -0,0 +1,43 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+from core.models import User, Course, Enrollment, StudentProfile, TeacherProfile, DeletionLog
+
+RESOURCES = {
+    Course: 'courses',
+    Enrollment: 'enrollments',
+    StudentProfile: 'students',
+    TeacherProfile: 'teachers',
+}
+
+# User fields the student and teacher feeds include.
+PROFILE_USER_FIELDS = {'email', 'name', 'is_active'}
+
+
+@receiver(post_delete, sender=Course)
+@receiver(post_delete, sender=Enrollment)
+@receiver(post_delete, sender=StudentProfile)
+@receiver(post_delete, sender=TeacherProfile)
+def log_deletion(sender, instance, **kwargs):
+    """
+    Record deleted rows for the sync feed.
+
+    Runs for cascaded deletes too (e.g. a course's enrollments), since the
+    receiver stops Django from fast-deleting them.
+    """
+    DeletionLog.objects.create(resource=RESOURCES[sender], object_id=instance.pk)
+
+
+@receiver(post_save, sender=User)
+def touch_profiles(sender, instance, created, update_fields=None, **kwargs):
+    """
+    Move the user's profile up the sync feed when its user fields change.
+
+    Profiles are paged on their own indexed ``updated_at``, so it must change
+    with the name and email the feed serves alongside them.
+    """
+    if created or (update_fields is not None and not PROFILE_USER_FIELDS & set(update_fields)):
+        return
+    now = timezone.now()
+    for model in (StudentProfile, TeacherProfile):
+        model.objects.filter(user=instance).update(updated_at=now)
@@ -0,0 +1,8 @@
+from django.urls import path
+from . import views
+
+app_name = 'sync'
+
+urlpatterns = [
+    path('<str:resource>/', views.SyncAPIView.as_view(), name='sync'),
+]
@@ -0,0 +1,44 @@
+from drf_spectacular.utils import extend_schema
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from core.db.replicas import use_database
+from core.permissions import IsAdminUser
+from .feeds import FEEDS, ExpiredSyncToken, InvalidSyncToken, get_changes
+from .serializers import SyncQuerySerializer, SyncResponseSerializer
+
+
+class SyncAPIView(APIView):
+    """Incremental change feed for courses, enrollments and profiles."""
+
+    permission_classes = [IsAdminUser]
+
+    @extend_schema(parameters=[SyncQuerySerializer], responses=SyncResponseSerializer)
+    def get(self, request, resource):
+        """Get the inserts, updates and deletes of ``resource`` since the `since` token."""
+        if resource not in FEEDS:
+            return Response(
+                {'error': f"Unknown resource. Choose one of: {', '.join(FEEDS)}"},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        serializer = SyncQuerySerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        try:
+            # A lagging replica could hide rows the cursor then moves past.
+            with use_database(None):
+                changes, next_token, has_more = get_changes(
+                    resource,
+                    serializer.validated_data.get('since'),
+                    serializer.validated_data['limit'],
+                )
+        except InvalidSyncToken:
+            return Response({'error': 'Invalid sync token'}, status=status.HTTP_400_BAD_REQUEST)
+        except ExpiredSyncToken:
+            return Response(
+                {'error': 'Sync token has expired; start a full sync without `since`'},
+                status=status.HTTP_410_GONE
+            )
+
+        return Response({'changes': changes, 'next': next_token, 'has_more': has_more})
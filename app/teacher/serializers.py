@@ -1,9 +1,10 @@
 from rest_framework import serializers
 from core.models import TeacherProfile, Course
+from core.fieldsets import DynamicFieldsMixin
 from user.serializers import UserProfileSerializer
 
 
-class TeacherProfileSerializer(serializers.ModelSerializer):
+class TeacherProfileSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     """Serializer for TeacherProfile model with nested user updates."""
     
     user = UserProfileSerializer()
@@ -30,7 +31,7 @@ class TeacherProfileSerializer(serializers.ModelSerializer):
         return instance
 
 
-class TeacherCoursesSerializer(serializers.ModelSerializer):
+class TeacherCoursesSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     """Serializer for courses assigned to teacher."""
     
     class Meta:
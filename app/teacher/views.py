@@ -3,12 +3,15 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from core.models import TeacherProfile, Course, Enrollment, StudentProfile
 from core.permissions import IsAdminUser, IsTeacherOwnerOrAdmin, IsTeacherUser
+from core.conditional import ConditionalGetMixin, enrollment_sources, student_sources, teacher_sources
+from core.fieldsets import SparseFieldsetMixin
 from .serializers import TeacherProfileSerializer, TeacherCoursesSerializer
 from student.serializers import StudentProfileSerializer
 from enrollment.serializers import EnrollmentSerializer
+from enrollment.projections import EnrollmentProjection
 
 
-class TeacherProfileViewSet(viewsets.ModelViewSet):
+class TeacherProfileViewSet(ConditionalGetMixin, SparseFieldsetMixin, viewsets.ModelViewSet):
     """ViewSet for TeacherProfile management."""
     serializer_class= TeacherProfileSerializer
     queryset = TeacherProfile.objects.all()
@@ -42,13 +45,20 @@ class TeacherProfileViewSet(viewsets.ModelViewSet):
             return TeacherProfile.objects.filter(user=self.request.user)
         return TeacherProfile.objects.none()
     
+    def get_validator_sources(self, queryset):
+        """Teacher profiles change with their nested user."""
+        return teacher_sources(queryset)
+    
     @action(detail=True, methods=['get'], permission_classes=[IsTeacherOwnerOrAdmin])
     def courses(self, request, pk=None):
         """Get courses assigned to this teacher."""
         teacher = self.get_object()
         courses = teacher.courses.all()
-        serializer = TeacherCoursesSerializer(courses, many=True)
-        return Response(serializer.data)
+        return self.conditional_response(
+            request,
+            [(courses, 'updated_at')],
+            lambda: self.sparse_response(TeacherCoursesSerializer, courses),
+        )
     
     @action(detail=True, methods=['get'], permission_classes=[IsTeacherOwnerOrAdmin])
     def students(self, request, pk=None):
@@ -57,8 +67,11 @@ class TeacherProfileViewSet(viewsets.ModelViewSet):
         courses = teacher.courses.all()
         enrollments = Enrollment.objects.filter(course__in=courses, status='ACTIVE')
         students = StudentProfile.objects.filter(enrollments__in=enrollments).distinct()
-        serializer = StudentProfileSerializer(students, many=True)
-        return Response(serializer.data)
+        return self.conditional_response(
+            request,
+            [(enrollments, 'updated_at')] + student_sources(students),
+            lambda: self.sparse_response(StudentProfileSerializer, students),
+        )
     
     @action(detail=True, methods=['get'], permission_classes=[IsTeacherOwnerOrAdmin])
     def enrollments(self, request, pk=None):
@@ -66,5 +79,8 @@ class TeacherProfileViewSet(viewsets.ModelViewSet):
         teacher = self.get_object()
         courses = teacher.courses.all()
         enrollments = Enrollment.objects.filter(course__in=courses)
-        serializer = EnrollmentSerializer(enrollments, many=True)
-        return Response(serializer.data)
+        return self.conditional_response(
+            request,
+            enrollment_sources(enrollments),
+            lambda: self.sparse_response(EnrollmentSerializer, enrollments, EnrollmentProjection),
+        )
@@ -2,8 +2,9 @@ from rest_framework import serializers,status
 from rest_framework.response import Response
 from core.models import User, TeacherProfile, StudentProfile
 from core.email_utils import EmailNotificationService
+from core.fieldsets import DynamicFieldsMixin
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     """Serializer for User model."""
     
     password = serializers.CharField(write_only=True, min_length=5)
@@ -57,12 +58,12 @@ class UserSerializer(serializers.ModelSerializer):
         return user
 
 
-class UserProfileSerializer(serializers.ModelSerializer):
+class UserProfileSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     """Serializer for viewing/updating user profile with limited fields."""
     
     class Meta:
         model = User
-        fields = ['id', 'email', 'name', 'role', 'created_at', 'updated_at']
+        fields = ['id', 'email', 'name', 'role', 'digest_frequency', 'created_at', 'updated_at']
         read_only_fields = ['id', 'email', 'role', 'created_at', 'updated_at']
 
 
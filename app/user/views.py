@@ -3,15 +3,18 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from django.contrib.auth import authenticate
+from drf_spectacular.utils import extend_schema
 from core.models import User
 from core.permissions import IsAdminUser, IsOwnerOrAdminUser, IsStudentUser
+from core.fieldsets import SparseFieldsetMixin
+from core.idempotency import IDEMPOTENCY_KEY_PARAMETER, idempotent
 from .serializers import (
     UserSerializer, 
     UserProfileSerializer, 
     ChangePasswordSerializer
 )
 
-class UserViewSet(viewsets.ModelViewSet):
+class UserViewSet(SparseFieldsetMixin, viewsets.ModelViewSet):
     """ViewSet for User management - Admin only for creation."""
     
     queryset = User.objects.all()
@@ -40,6 +43,12 @@ class UserViewSet(viewsets.ModelViewSet):
         else:
             # Non-admin users can only access their own profile
             return User.objects.filter(id=self.request.user.id)
+    
+    @extend_schema(parameters=[IDEMPOTENCY_KEY_PARAMETER])
+    @idempotent
+    def create(self, request, *args, **kwargs):
+        """Create a user (admin only)."""
+        return super().create(request, *args, **kwargs)
 
 
 class ProfileAPIView(APIView):